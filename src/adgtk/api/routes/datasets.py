@@ -14,6 +14,10 @@ router = APIRouter()
 _templates: Jinja2Templates | None = None
 
 _CSV_EXTS = {".csv", ".tsv"}
+# columnar files shown in the table preview; suffix -> encoding
+_TABLE_EXTS = {
+    ".parquet": "parquet", ".feather": "feather", ".arrow": "feather",
+}
 _TEXT_EXTS = {
     ".txt", ".log", ".md", ".json", ".yaml", ".yml",
     ".py", ".toml", ".ini", ".cfg", ".rst", ".sh", ".xml",
@@ -41,7 +45,7 @@ def _build_preview(full_path: Path):
         return "missing", None, None, None, False, None
 
     suffix = full_path.suffix.lower()
-    if suffix in _CSV_EXTS:
+    if suffix in _CSV_EXTS or suffix in _TABLE_EXTS:
         preview_type = "csv"
     elif suffix in _TEXT_EXTS:
         preview_type = "text"
@@ -51,7 +55,19 @@ def _build_preview(full_path: Path):
     csv_headers, csv_rows, text_content, preview_error = None, None, None, None
     truncated = False
 
-    if preview_type == "csv":
+    if preview_type == "csv" and suffix in _TABLE_EXTS:
+        # only the first row group / record batch is decoded
+        from adgtk.data.ingest import read_table_preview
+        try:
+            csv_headers, table_rows = read_table_preview(
+                str(full_path), _TABLE_EXTS[suffix], _PREVIEW_LIMIT + 1)
+            truncated = len(table_rows) > _PREVIEW_LIMIT
+            csv_rows = table_rows[:_PREVIEW_LIMIT]
+        except Exception as exc:
+            preview_type = "error"
+            preview_error = str(exc)
+
+    elif preview_type == "csv":
         delimiter = "\t" if suffix == ".tsv" else ","
         try:
             with open(full_path, "r", encoding="utf-8", errors="replace") as f:
@@ -98,15 +114,13 @@ async def register_dataset(
     description: str = Form(""),
 ):
     from adgtk.data.dataset import DatasetManager
+    from adgtk.data.structure import FileEncodingTypes
     try:
         new_tags = [t.strip() for t in tags.split(",") if t.strip()]
         mgr = DatasetManager()
         result_id = mgr.register(
             source_file=source_file.strip(),
-            encoding=cast(
-                Literal["csv", "hf-json", "json", "pickle", "pandas", "text"],
-                encoding,
-            ),
+            encoding=cast(FileEncodingTypes, encoding),
             tags=new_tags or None,
             file_id=custom_id.strip() or None,
             use=cast(Literal["test", "train", "validate", "other"], use),
@@ -129,14 +143,17 @@ async def register_dataset(
 
 
 def _build_rows(datasets):
-    from adgtk.data.dataset import find_blueprints_using_dataset
+    from adgtk.tracking.usage import all_dataset_usage, DatasetUsage
+    usage = all_dataset_usage()
     rows = []
     for d in datasets:
         full_path = Path(d.path) / d.filename
+        used = usage.get(d.file_id, DatasetUsage())
         rows.append({
             "defn": d,
             "exists": full_path.exists(),
-            "blueprints": find_blueprints_using_dataset(d.file_id),
+            "blueprints": used.blueprints,
+            "runs": used.runs,
         })
     return rows
 
@@ -182,12 +199,18 @@ async def dataset_detail(dataset_id: str, request: Request):
         text_content, truncated, preview_error,
     ) = _build_preview(full_path)
 
+    from adgtk.tracking.usage import dataset_usage
+    usage = dataset_usage(dataset_id)
+
+    from adgtk.data.profile import PROFILE_KEY, current_profile
+    profile = current_profile(defn)
+
     import json as _json
     tags_str = ", ".join(defn.tags) if defn.tags else ""
-    ext_meta_str = (
-        _json.dumps(defn.extended_metadata, indent=2)
-        if defn.extended_metadata else ""
-    )
+    # the profile has its own card and is kept when metadata is edited
+    ext_meta = {k: v for k, v in (defn.extended_metadata or {}).items()
+                if k != PROFILE_KEY}
+    ext_meta_str = _json.dumps(ext_meta, indent=2) if ext_meta else ""
 
     return _t().TemplateResponse(
         request,
@@ -204,11 +227,39 @@ async def dataset_detail(dataset_id: str, request: Request):
             "preview_error": preview_error,
             "tags_str": tags_str,
             "ext_meta_str": ext_meta_str,
+            "profile": profile,
+            "profile_error": None,
+            "usage": usage,
             "active": "datasets",
         },
     )
 
 
+@router.post("/datasets/{dataset_id}/profile", response_class=HTMLResponse)
+def profile_dataset(dataset_id: str, request: Request):
+    """Profiles the dataset (once per content) and returns the card.
+
+    A plain def, so the one-pass read runs on the threadpool rather than
+    blocking the event loop.
+    """
+    from adgtk.data.dataset import DatasetManager
+    mgr = DatasetManager()
+    try:
+        defn = mgr.get_file_definition(dataset_id)
+    except KeyError:
+        return HTMLResponse("Dataset not found.", status_code=404)
+    profile, profile_error = None, None
+    try:
+        profile = mgr.profile(dataset_id)
+    except Exception as exc:
+        profile_error = str(exc)
+    return _t().TemplateResponse(
+        request,
+        "partials/dataset_profile.html",
+        {"defn": defn, "profile": profile, "profile_error": profile_error},
+    )
+
+
 @router.get("/datasets/{dataset_id}/download")
 async def dataset_download(dataset_id: str):
     from adgtk.data.dataset import DatasetManager
@@ -254,6 +305,11 @@ async def update_dataset(
                     )
             except _json.JSONDecodeError as exc:
                 raise ValueError(f"Invalid JSON: {exc}") from exc
+            from adgtk.data.profile import PROFILE_KEY
+            current = (
+                mgr.get_file_definition(dataset_id).extended_metadata or {})
+            if PROFILE_KEY in current:
+                ext_meta.setdefault(PROFILE_KEY, current[PROFILE_KEY])
 
         result_id = mgr.update_file(
             dataset_id,
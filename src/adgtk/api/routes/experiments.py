@@ -477,6 +477,8 @@ async def builder_create(request: Request):
                 default_flow_style=False,
                 sort_keys=False,
             )
+        from adgtk.tracking.blueprints import index_blueprint
+        index_blueprint(str(path))
     except Exception as exc:
         return HTMLResponse(
             f'<div class="text-red-600 text-sm px-6 py-2">Error: {exc}</div>'
@@ -627,6 +629,8 @@ async def save_yaml(name: str, content: str = Form(...)):
     path = Path("blueprints") / f"{name}.yaml"
     try:
         path.write_text(content, encoding="utf-8")
+        from adgtk.tracking.blueprints import index_blueprint
+        index_blueprint(str(path))
         cls = "bg-green-50 text-green-800 border-green-200"
         msg = "Blueprint saved."
     except Exception as exc:
@@ -652,6 +656,8 @@ async def copy_experiment(
         msg = f"'{destination}' already exists."
     else:
         shutil.copy2(src, dst)
+        from adgtk.tracking.blueprints import index_blueprint
+        index_blueprint(str(dst))
         return HTMLResponse("", headers={"HX-Refresh": "true"})
     return HTMLResponse(
         f'<div class="rounded-md border px-4 py-3 text-sm {red}">{msg}</div>'
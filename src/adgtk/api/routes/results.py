@@ -15,6 +15,8 @@ from fastapi.templating import Jinja2Templates
 
 router = APIRouter()
 _templates: Jinja2Templates | None = None
+# step-band charts are thinned to this many points per series
+_MAX_CHART_POINTS = 500
 
 
 def init(templates: Jinja2Templates) -> None:
@@ -104,6 +106,14 @@ async def results_runs(
         str(exp_path / "common")
     )
 
+    from adgtk.tracking.metric_store import step_bands as _step_bands
+    from adgtk.tracking.report import STEP_BAND_KEYS
+    step_bands: dict[str, dict] = {}
+    for key in STEP_BAND_KEYS:
+        bands = _step_bands(experiment, key)
+        if bands is not None:
+            step_bands[key] = bands.downsample(_MAX_CHART_POINTS).to_dict()
+
     return _t().TemplateResponse(
         request,
         "results_runs.html",
@@ -114,6 +124,7 @@ async def results_runs(
             "report_generated": report_generated,
             "initial_tab": initial_tab,
             "journal_entries": journal_entries,
+            "step_bands": step_bands,
             "active": "results",
         },
     )
@@ -217,7 +228,11 @@ async def run_detail(experiment: str, run_id: str, request: Request):
     )
 
     # Raw agent metric time-series (one value per step)
-    agent_series = _read_agent_metric_series(results_path / "metrics")
+    from adgtk.tracking.metric_store import load_run_series
+    agent_series = (
+        load_run_series(experiment, run_id, prefix="agent.")
+        or _read_agent_metric_series(results_path / "metrics")
+    )
 
     # LLM interaction logs stored under results/{exp}/{run}/llm/
     from adgtk.api.routes.logs import read_tail as _read_tail
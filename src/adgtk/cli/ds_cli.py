@@ -20,6 +20,7 @@ from adgtk.data.structure import (
     FileEncodingTypes
 )
 from adgtk.data.dataset import DatasetManager
+from adgtk.data.profile import format_profile
 from adgtk.utils import get_user_input
 from adgtk.utils import create_logger
 
@@ -75,6 +76,8 @@ def parse_args() -> argparse.Namespace:
         epilog=(
             "examples:\n"
             "  adgtk-ds report\n"
+            "  adgtk-ds report --profile train\n"
+            "  adgtk-ds profile --id <uuid> [--refresh]\n"
             "  adgtk-ds register                              (interactive)\n"
             "  adgtk-ds register --file data/f.csv --encoding csv --use test\n"
             "  adgtk-ds retire                                (interactive)\n"
@@ -91,6 +94,22 @@ def parse_args() -> argparse.Namespace:
         "tags", nargs="*",
         help="Optional tag(s) to filter results"
     )
+    report_p.add_argument(
+        "--profile", action="store_true",
+        help="Also print column statistics (profiles files once; cached)"
+    )
+
+    # ---- profile ----
+    prof_p = sub.add_parser(
+        "profile", help="Print column statistics for a dataset")
+    prof_p.add_argument(
+        "--id", type=str, required=True,
+        help="ID of the dataset to profile"
+    )
+    prof_p.add_argument(
+        "--refresh", action="store_true",
+        help="Profile again even if the file is unchanged"
+    )
 
     # ---- register ----
     reg_p = sub.add_parser(
@@ -293,9 +312,27 @@ def cmd_find(ds_mgr: DatasetManager, filename: str) -> None:
         sys.exit(1)
 
 
-def cmd_report(ds_mgr: DatasetManager, tags: list[str]) -> None:
+def cmd_report(
+    ds_mgr: DatasetManager,
+    tags: list[str],
+    profiles: bool = False,
+) -> None:
     _banner("Dataset Inventory")
-    ds_mgr.report(tag=tags if tags else None)
+    ds_mgr.report(tag=tags if tags else None, profiles=profiles)
+
+
+def cmd_profile(ds_mgr: DatasetManager, entry_id: str, refresh: bool) -> None:
+    _banner("Dataset Profile")
+    try:
+        profile = ds_mgr.profile(entry_id, refresh=refresh)
+    except KeyError:
+        _err(f"No entry found for ID: {entry_id}")
+        sys.exit(1)
+    except (ValueError, OSError) as exc:
+        _err(str(exc))
+        sys.exit(1)
+    print()
+    print(format_profile(profile, entry_id))
 
 
 # ----------------------------------------------------------------------
@@ -309,7 +346,10 @@ def main() -> None:
     ds_mgr = DatasetManager(folder=".tracking")
 
     if args.command == "report":
-        cmd_report(ds_mgr, args.tags)
+        cmd_report(ds_mgr, args.tags, profiles=args.profile)
+
+    elif args.command == "profile":
+        cmd_profile(ds_mgr=ds_mgr, entry_id=args.id, refresh=args.refresh)
 
     elif args.command == "register":
         cmd_register(
@@ -339,6 +379,7 @@ def main() -> None:
             "  register   Register a file (interactive when args omitted)\n"
             "  retire     Remove a dataset entry from the inventory\n"
             "  report     Print the inventory (optionally filter by tag)\n"
+            "  profile    Print column statistics for a dataset\n"
             "  find       Look up the ID assigned to a filename\n"
             "\n"
             "  Run  adgtk-ds <command> --help  for per-command options.\n"
@@ -153,6 +153,8 @@ def _copy_blueprint(source: str | None, dest: str | None) -> None:
         return
 
     shutil.copy2(src_path, dest_path)
+    from adgtk.tracking.blueprints import index_blueprint
+    index_blueprint(dest_path)
     print(f"Copied '{source}' -> '{dest}'")
 
 
@@ -0,0 +1,249 @@
+"""Cache of parsed datasets under .tracking/cache/datasets/.
+
+Parsing the same CSV or JSON file for every experiment in a batch is
+wasted work once the file has been parsed once. This module keeps the
+parsed (and optionally re-oriented / renamed) form in a fast binary file:
+
+  - DataFrames as Feather when pyarrow is installed, else pickle
+  - everything else (lists of records, dicts) as a pickle
+
+Entries are keyed by the file's content fingerprint (see fingerprint.py)
+plus the load options, so an edited dataset or a different orientation
+never hits a stale entry. A hit bumps the entry's mtime; when the cache
+grows past MAX_CACHE_BYTES the entries with the oldest mtime are removed
+first (LRU). Every file is written via a temp file and an atomic rename,
+so concurrent runs can share the cache.
+
+Shuffling is not cached: callers shuffle the cached result so each load
+still gets its own order.
+"""
+
+import gc
+import json
+import os
+import pickle
+from typing import Any, Callable, Optional, Sequence
+
+import pandas as pd
+
+from adgtk.data.fingerprint import (
+    Fingerprint,
+    compute_fingerprint,
+    stored_fingerprint,
+)
+from adgtk.data.structure import FileDefinition
+from adgtk.utils.defaults import CACHE_FOLDER, TRACKING_FOLDER
+from adgtk.utils.file import content_hash
+
+try:
+    import pyarrow  # noqa: F401
+    _HAS_ARROW = True
+except ImportError:  # pragma: no cover - pyarrow ships with datasets
+    _HAS_ARROW = False
+
+CACHE_DIR = "datasets"
+CACHEABLE_ENCODINGS = ("csv", "json", "jsonl", "pandas")
+CACHE_VERSION = 1
+# total bytes kept before least recently used entries are evicted
+MAX_CACHE_BYTES = 2 * 1024 ** 3
+# set False to bypass the cache entirely
+CACHE_ENABLED = True
+
+_FEATHER = ".feather"
+_PICKLE = ".pkl"
+
+# fingerprints taken by this process, for files without a stored one
+_fingerprints: dict[str, Fingerprint] = {}
+
+
+# ----------------------------------------------------------------------
+# Internal helpers
+# ----------------------------------------------------------------------
+
+
+def _cache_folder() -> str:
+    return os.path.join(TRACKING_FOLDER, CACHE_FOLDER, CACHE_DIR)
+
+
+def _fingerprint(file_def: FileDefinition) -> Fingerprint:
+    """The current fingerprint, hashing only when the stamps changed."""
+    path = os.path.abspath(os.path.join(file_def.path, file_def.filename))
+    previous = _fingerprints.get(path) or stored_fingerprint(file_def)
+    current = compute_fingerprint(path, previous)
+    _fingerprints[path] = current
+    return current
+
+
+def _write_entry(base: str, data: Any) -> Optional[str]:
+    """Write data under base with the best format for it."""
+    if _HAS_ARROW and isinstance(data, pd.DataFrame):
+        tmp_path = f"{base}{_FEATHER}.{os.getpid()}.tmp"
+        try:
+            # feather needs a default index and string column names
+            data.to_feather(tmp_path)
+            os.replace(tmp_path, base + _FEATHER)
+            return base + _FEATHER
+        except (ValueError, TypeError, ImportError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    tmp_path = f"{base}{_PICKLE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        os.remove(tmp_path)
+        return None
+    os.replace(tmp_path, base + _PICKLE)
+    return base + _PICKLE
+
+
+def _read_entry(base: str) -> tuple[bool, Any]:
+    """Return (found, data) for the entry at base."""
+    for suffix in (_FEATHER, _PICKLE):
+        path = base + suffix
+        try:
+            if suffix == _FEATHER:
+                data = pd.read_feather(path)
+            else:
+                with open(path, "rb") as f:
+                    # millions of small containers; skip GC passes meanwhile
+                    gc_was_enabled = gc.isenabled()
+                    gc.disable()
+                    try:
+                        data = pickle.load(f)
+                    finally:
+                        if gc_was_enabled:
+                            gc.enable()
+        except FileNotFoundError:
+            continue
+        except Exception:
+            # unreadable (e.g. truncated by a crash); rebuild it
+            os.remove(path)
+            continue
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return True, data
+    return False, None
+
+
+# ----------------------------------------------------------------------
+# Public API
+# ----------------------------------------------------------------------
+
+
+def cache_key(
+    file_def: FileDefinition,
+    options: Optional[dict] = None,
+    encodings: Sequence[str] = CACHEABLE_ENCODINGS,
+) -> Optional[str]:
+    """Return the cache key of a file and load options.
+
+    Args:
+        file_def: The file being loaded.
+        options: The load options that shape the cached result, e.g. the
+            target orientation and key rename map. None values are
+            ignored.
+        encodings: The encodings worth caching for this result.
+            Defaults to CACHEABLE_ENCODINGS.
+
+    Returns:
+        The key, or None when the file cannot be cached.
+    """
+    if file_def.encoding not in encodings:
+        return None
+    try:
+        fingerprint = _fingerprint(file_def)
+    except OSError:
+        return None
+    payload = {
+        "version": CACHE_VERSION,
+        "digest": fingerprint.digest,
+        "size": fingerprint.size,
+        "encoding": file_def.encoding,
+        # pandas picks its reader from the extension
+        "suffix": os.path.splitext(file_def.filename)[1],
+        "options": {k: v for k, v in (options or {}).items()
+                    if v is not None},
+    }
+    return content_hash(
+        json.dumps(payload, sort_keys=True, default=str).encode("utf-8"))
+
+
+def load_cached(
+    file_def: FileDefinition,
+    build: Callable[[], Any],
+    options: Optional[dict] = None,
+    encodings: Sequence[str] = CACHEABLE_ENCODINGS,
+) -> Any:
+    """Return the parsed form of a file, from the cache when possible.
+
+    Args:
+        file_def: The file being loaded.
+        build: Parses the file (and applies options) on a miss.
+        options: The load options build applies; part of the key.
+        encodings: The encodings worth caching for this result, e.g.
+            every streamable encoding for small derived results such as
+            samples. Defaults to CACHEABLE_ENCODINGS.
+
+    Returns:
+        The cached or freshly built data.
+    """
+    key = (cache_key(file_def, options, encodings)
+           if CACHE_ENABLED else None)
+    if key is None:
+        return build()
+
+    base = os.path.join(_cache_folder(), key)
+    found, data = _read_entry(base)
+    if found:
+        return data
+
+    data = build()
+    if data is not None:
+        os.makedirs(_cache_folder(), exist_ok=True)
+        if _write_entry(base, data) is not None:
+            evict(MAX_CACHE_BYTES)
+    return data
+
+
+def evict(max_bytes: int) -> int:
+    """Remove least recently used entries until the cache fits max_bytes.
+
+    Args:
+        max_bytes: The size to shrink the cache to.
+
+    Returns:
+        The number of entries removed.
+    """
+    folder = _cache_folder()
+    try:
+        with os.scandir(folder) as it:
+            entries = []
+            for dirent in it:
+                if dirent.name.endswith((_FEATHER, _PICKLE)):
+                    st = dirent.stat()
+                    entries.append((st.st_mtime_ns, st.st_size, dirent.path))
+    except FileNotFoundError:
+        return 0
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+    return removed
+
+
+def clear_dataset_cache() -> int:
+    """Remove every cached dataset. Returns the number removed."""
+    _fingerprints.clear()
+    return evict(0)
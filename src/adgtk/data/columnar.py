@@ -0,0 +1,278 @@
+"""Columnar in-memory datasets with index-permutation views.
+
+A ColumnarDataset holds one NumPy array per column plus an optional array
+of row positions. The row positions are the "view": shuffling, slicing,
+taking rows and splitting by keys produce a new ColumnarDataset that
+shares the column arrays and only carries a different set of positions
+or columns. Nothing is copied until rows are converted to Python objects
+at the edge (iteration, indexing, to_records/to_dict/to_pandas).
+
+Columns whose values are all ints, all floats or all bools are stored in
+native dtypes; anything else (strings, mixed types, nested values, None)
+is an object array holding the original Python objects. Column arrays
+are read-only so views can share them safely.
+
+Records with differing keys are accepted: the columns are the union of
+the keys in first-seen order and missing values are None.
+"""
+
+from typing import Any, Iterable, Iterator, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+# ----------------------------------------------------------------------
+# Internal helpers
+# ----------------------------------------------------------------------
+
+_NATIVE_DTYPES = {
+    frozenset([bool]): np.bool_,
+    frozenset([int]): np.int64,
+    frozenset([float]): np.float64,
+}
+
+
+def _list_column(values: list) -> np.ndarray:
+    """A native array when every value shares a bool/int/float type."""
+    dtype = _NATIVE_DTYPES.get(frozenset(map(type, values)))
+    if dtype is not None:
+        try:
+            return np.array(values, dtype=dtype)
+        except OverflowError:
+            pass
+    # fromiter never tries to interpret nested lists as dimensions
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _to_column(values: Union[list, np.ndarray]) -> np.ndarray:
+    """A read-only column array holding values without converting them."""
+    if isinstance(values, np.ndarray) and values.ndim == 1:
+        column = values.view()
+    else:
+        column = _list_column(list(values))
+    column.flags.writeable = False
+    return column
+
+
+# ----------------------------------------------------------------------
+# Dataset
+# ----------------------------------------------------------------------
+
+
+class ColumnarDataset:
+    """A dict of column arrays viewed through an index permutation.
+
+    Example:
+        ds = ColumnarDataset.from_records(rows)
+        train, test = ds.shuffle(seed=1).split_at(0.8)
+        inputs, labels = train.split(["label"])
+        for row in inputs:      # plain dicts, built on demand
+            ...
+    """
+
+    def __init__(
+        self,
+        columns: Mapping[str, Union[list, np.ndarray]],
+        index: Optional[np.ndarray] = None,
+    ) -> None:
+        """Wraps the columns, which must all have the same length.
+
+        Args:
+            columns: Column name to values.
+            index: Row positions into the columns, in view order. None
+                means all rows in stored order.
+
+        Raises:
+            ValueError: If the columns have different lengths.
+        """
+        self._columns = {str(k): _to_column(v) for k, v in columns.items()}
+        lengths = {len(c) for c in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("Columns are different lengths")
+        self._size = lengths.pop() if lengths else 0
+        self._index = index
+
+    @classmethod
+    def _view(
+        cls,
+        columns: dict[str, np.ndarray],
+        size: int,
+        index: Optional[np.ndarray],
+    ) -> "ColumnarDataset":
+        """A dataset sharing already validated column arrays."""
+        view = cls.__new__(cls)
+        view._columns = columns
+        view._size = size
+        view._index = index
+        return view
+
+    def __setstate__(self, state: dict) -> None:
+        # unpickled arrays come back writeable
+        for column in state["_columns"].values():
+            column.flags.writeable = False
+        self.__dict__.update(state)
+
+    # ---------------- construction ----------------
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping]) -> "ColumnarDataset":
+        """Builds a dataset from a list of dictionaries."""
+        records = list(records)
+        keys: dict[str, None] = {}
+        for row in records:
+            keys.update(dict.fromkeys(row))
+        return cls({k: [row.get(k) for row in records] for k in keys})
+
+    @classmethod
+    def from_pandas(cls, frame: pd.DataFrame) -> "ColumnarDataset":
+        """Builds a dataset from a DataFrame's columns."""
+        # copied once so later edits to the frame do not leak into views
+        return cls({str(k): frame[k].to_numpy(copy=True)
+                    for k in frame.columns})
+
+    @classmethod
+    def from_data(cls, data: Any) -> "ColumnarDataset":
+        """Builds a dataset from any tabular data load_data returns.
+
+        Args:
+            data: A ColumnarDataset, DataFrame, dict of lists or list of
+                dicts.
+
+        Raises:
+            ValueError: If data is not tabular.
+
+        Returns:
+            The dataset; data itself when it is already columnar.
+        """
+        if isinstance(data, ColumnarDataset):
+            return data
+        if isinstance(data, pd.DataFrame):
+            return cls.from_pandas(data)
+        if isinstance(data, dict):
+            return cls(data)
+        if isinstance(data, list) and all(isinstance(r, dict) for r in data):
+            return cls.from_records(data)
+        raise ValueError(f"Unable to build columns from {type(data)}")
+
+    # ---------------- shape ----------------
+
+    @property
+    def columns(self) -> list[str]:
+        """The column names."""
+        return list(self._columns)
+
+    @property
+    def index(self) -> np.ndarray:
+        """The row positions of this view into the stored columns."""
+        if self._index is None:
+            return np.arange(self._size)
+        return self._index
+
+    def __len__(self) -> int:
+        if self._index is None:
+            return self._size
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return f"ColumnarDataset(rows={len(self)}, columns={self.columns})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ColumnarDataset):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    # ---------------- row and column access ----------------
+
+    def column(self, name: str) -> np.ndarray:
+        """Return one column in view order.
+
+        Without a permutation this is the stored (read-only) array itself.
+        """
+        column = self._columns[name]
+        if self._index is None:
+            return column
+        return column[self._index]
+
+    def __getitem__(self, key: Any) -> Any:
+        """Row dict for an int, column array for a name, view otherwise."""
+        if isinstance(key, str):
+            return self.column(key)
+        if isinstance(key, (int, np.integer)):
+            length = len(self)
+            if key < 0:
+                key += length
+            if not 0 <= key < length:
+                raise IndexError("row index out of range")
+            pos = key if self._index is None else self._index[key]
+            return {k: c[pos].item() if c.dtype != object else c[pos]
+                    for k, c in self._columns.items()}
+        return self.take(key)
+
+    def __iter__(self) -> Iterator[dict]:
+        keys = self.columns
+        for values in zip(*(self.column(k).tolist() for k in keys)):
+            yield dict(zip(keys, values))
+
+    # ---------------- views ----------------
+
+    def take(self, rows: Any) -> "ColumnarDataset":
+        """Return a view of the given rows (slice, positions or mask)."""
+        if self._index is None and isinstance(rows, slice):
+            index = np.arange(self._size)[rows]
+        else:
+            index = self.index[rows]
+        return self._view(self._columns, self._size, np.asarray(index))
+
+    def shuffle(self, seed: Optional[int] = None) -> "ColumnarDataset":
+        """Return a view of the rows in random order."""
+        rng = np.random.default_rng(seed)
+        return self._view(
+            self._columns, self._size, rng.permutation(self.index))
+
+    def select(self, keys: Iterable[str]) -> "ColumnarDataset":
+        """Return a view holding only the given columns (missing skipped)."""
+        columns = {k: self._columns[k] for k in keys if k in self._columns}
+        return self._view(columns, self._size, self._index)
+
+    def split(self, keys: Iterable[str]) -> tuple:
+        """Split the columns in two, like split_dict.
+
+        Args:
+            keys: Columns for the right-hand view.
+
+        Returns:
+            (left, right) views sharing this dataset's rows.
+        """
+        keys = set(keys)
+        left = {k: c for k, c in self._columns.items() if k not in keys}
+        right = {k: c for k, c in self._columns.items() if k in keys}
+        return (self._view(left, self._size, self._index),
+                self._view(right, self._size, self._index))
+
+    def split_at(self, fraction: float) -> tuple:
+        """Split the rows in two at a fraction of the length.
+
+        Returns:
+            (head, tail) views.
+        """
+        cut = int(len(self) * fraction)
+        return self.take(slice(0, cut)), self.take(slice(cut, None))
+
+    def rename(self, key_map: Mapping[str, str]) -> "ColumnarDataset":
+        """Return a view with columns renamed as in remap_data."""
+        columns = {key_map.get(k, k): c for k, c in self._columns.items()}
+        return self._view(columns, self._size, self._index)
+
+    # ---------------- conversion at the edge ----------------
+
+    def to_dict(self) -> dict[str, list]:
+        """The view as a dict of lists (dict_contains_list)."""
+        return {k: self.column(k).tolist() for k in self._columns}
+
+    def to_records(self) -> list[dict]:
+        """The view as a list of dicts (list_contains_dict)."""
+        return list(self)
+
+    def to_pandas(self) -> pd.DataFrame:
+        """The view as a DataFrame."""
+        return pd.DataFrame({k: self.column(k) for k in self._columns})
@@ -8,11 +8,77 @@ Roadmap:
 """
 
 import os
-from pathlib import Path
-from typing import Literal, Optional, Union
-from adgtk.data.structure import FileEncodingTypes
-from adgtk.tracking.dataset import JsonFileTracker
-from adgtk.data.utils import load_data_from_file, ReturnDataTypes
+from concurrent.futures import Future
+from typing import cast, Any, Callable, Iterator, Literal, Optional, Union
+import numpy as np
+import pandas as pd
+from adgtk.data.fingerprint import (
+    Fingerprint,
+    compute_fingerprint,
+    fingerprint_many,
+    is_current,
+    run_in_background,
+    stored_fingerprint,
+    with_fingerprint,
+)
+from adgtk.data.columnar import ColumnarDataset
+from adgtk.data.ingest import (
+    ColumnTypes,
+    FilterTypes,
+    TABULAR_ENCODINGS,
+    count_table_rows,
+    iter_table,
+    read_csv_columns,
+    read_table,
+    take_table_rows,
+)
+from adgtk.data.cache import load_cached
+from adgtk.data.jsonl import JsonlReader
+from adgtk.data.pipeline import Pipeline
+from adgtk.data.profile import (
+    DEFAULT_TOP_K,
+    DatasetProfile,
+    current_profile,
+    format_profile,
+    profile_chunks,
+    stored_profile,
+    with_profile,
+)
+from adgtk.data.sample import reservoir_sample, stratified_sample
+from adgtk.data.shards import (
+    Shard,
+    combined_fingerprint,
+    is_sharded,
+    iter_shards,
+    load_shards,
+    scan_shards,
+    shard_definitions,
+    shards_metadata,
+    split_source,
+    stored_shards,
+)
+from adgtk.data.split import (
+    OUTPUT_FORMATS,
+    SPLIT_KEY,
+    SplitAssigner,
+    SplitWriter,
+)
+from adgtk.data.structure import FileDefinition, FileEncodingTypes
+from adgtk.tracking.blueprints import find_blueprints_referencing
+from adgtk.tracking.dataset import JsonFileTracker, _tag_list
+from adgtk.tracking.usage import all_dataset_usage, note_dataset_loaded
+from adgtk.data.utils import (
+    ChunkTypes,
+    DEFAULT_CHUNK_SIZE,
+    HF_MODE_KEY,
+    HfModeTypes,
+    load_hf_json,
+    STREAMABLE_ENCODINGS,
+    iter_data_from_file,
+    load_data_from_file,
+    ReturnDataTypes,
+    valid_dict_of_lists,
+)
 from adgtk.utils import create_logger
 
 
@@ -25,20 +91,12 @@ def find_blueprints_using_dataset(
 ) -> list[str]:
     """Return blueprint names that reference the given dataset ID.
 
-    Scans all *.yaml files in blueprints_dir for an exact string match of
-    dataset_id. Returns a sorted list of blueprint name stems (no extension).
+    A blueprint references a dataset when dataset_id appears as one of its
+    string settings. Lookups go through the cached blueprint index, so
+    only blueprints changed since the last lookup are read. Returns a
+    sorted list of blueprint name stems (no extension).
     """
-    bp_dir = Path(blueprints_dir)
-    if not bp_dir.is_dir():
-        return []
-    names = []
-    for path in bp_dir.glob("*.yaml"):
-        try:
-            if dataset_id in path.read_text(encoding="utf-8"):
-                names.append(path.stem)
-        except OSError:
-            continue
-    return sorted(names)
+    return find_blueprints_referencing(dataset_id, blueprints_dir)
 
 
 class DatasetManager(JsonFileTracker):
@@ -77,6 +135,87 @@ class DatasetManager(JsonFileTracker):
             inventory_file=file_w_path,
             logger=self.logger
         )
+        self._pending: list[Future] = []
+
+    # ------------------------------------------------------------------
+    # Fingerprints
+    # ------------------------------------------------------------------
+
+    def _store_fingerprints(self, found: dict[str, Fingerprint]) -> None:
+        """Writes fingerprints into extended_metadata, in one update."""
+        def _apply(inventory: dict[str, FileDefinition]) -> None:
+            for file_id, fp in found.items():
+                entry = inventory.get(file_id)
+                if entry is None or stored_fingerprint(entry) == fp:
+                    continue
+                entry = entry.model_copy()
+                entry.extended_metadata = with_fingerprint(
+                    entry.extended_metadata, fp)
+                inventory[file_id] = entry
+
+        self._refresh()
+        if all(file_id in self._inventory
+               and stored_fingerprint(self._inventory[file_id]) == fp
+               for file_id, fp in found.items()):
+            return
+        self._update(_apply)
+
+    def _fingerprint_later(self, file_ids: list[str]) -> None:
+        """Fingerprints files in the background and stores the results."""
+        self._pending.append(
+            run_in_background(self.refresh_fingerprints, file_ids))
+
+    def wait_for_fingerprints(self) -> None:
+        """Blocks until every background fingerprint has been stored."""
+        while self._pending:
+            self._pending.pop().result()
+
+    def fingerprint(self, file_id: str) -> Fingerprint:
+        """Returns the content fingerprint of a registered file.
+
+        The stored fingerprint is used while the file's size and mtime
+        match it; otherwise the file is hashed again and the new
+        fingerprint stored.
+
+        Args:
+            file_id: The ID of the file.
+
+        Raises:
+            KeyError: If the file ID is not found.
+            FileNotFoundError: If the file no longer exists on disk.
+        """
+        file_def = self.get_file_definition(file_id)
+        if is_sharded(file_def):
+            return combined_fingerprint(self._rescan_shards(file_def))
+        previous = stored_fingerprint(file_def)
+        current = compute_fingerprint(
+            os.path.join(file_def.path, file_def.filename), previous)
+        if current != previous:
+            self._store_fingerprints({file_id: current})
+        return current
+
+    def refresh_fingerprints(
+        self,
+        file_ids: Optional[list[str]] = None,
+    ) -> int:
+        """Re-hashes the files whose size or mtime changed, in parallel.
+
+        Sharded datasets are skipped; see refresh_shards.
+
+        Args:
+            file_ids: The files to check. Defaults to every file.
+
+        Returns:
+            The number of fingerprints that were (re)computed.
+        """
+        self._refresh()
+        ids = file_ids if file_ids is not None else list(self._inventory)
+        stale = [self._inventory[i] for i in ids
+                 if not is_sharded(self._inventory[i])
+                 and not is_current(self._inventory[i])]
+        found = fingerprint_many(stale)
+        self._store_fingerprints(found)
+        return len(found)
 
     def register(
         self,
@@ -87,6 +226,8 @@ class DatasetManager(JsonFileTracker):
         use: Literal["test", "train", "validate", "other"] = "other",
         description: Optional[str] = None,
         extended_metadata: Optional[dict] = None,
+        fingerprint: bool = True,
+        background: bool = False,
     ) -> str:
         """Registers a file definition.
 
@@ -99,6 +240,11 @@ class DatasetManager(JsonFileTracker):
                 validate, other). Defaults to "other".
             description: Optional human-readable description.
             extended_metadata: Optional dict of custom fields.
+            fingerprint: Store the content fingerprint of the file in
+                extended_metadata. Defaults to True.
+            background: Compute the fingerprint on a background thread
+                and return immediately. See wait_for_fingerprints.
+                Defaults to False.
 
         Raises:
             FileNotFoundError: If the source file is not found on disk.
@@ -117,7 +263,11 @@ class DatasetManager(JsonFileTracker):
             tags = [tags]
         tags.append(use)
 
-        return self.register_file(
+        if fingerprint and not background:
+            extended_metadata = with_fingerprint(
+                extended_metadata, compute_fingerprint(full_path))
+
+        assigned = self.register_file(
             source_file=full_path,
             encoding=encoding,
             tags=tags,
@@ -125,9 +275,338 @@ class DatasetManager(JsonFileTracker):
             description=description,
             extended_metadata=extended_metadata,
         )
+        if fingerprint and background:
+            self._fingerprint_later([assigned])
+        return assigned
+
+    def register_many(
+        self,
+        source_files: list[str],
+        encoding: FileEncodingTypes,
+        tags: Optional[Union[str, list[str]]] = None,
+        file_ids: Optional[list[str]] = None,
+        description: Optional[str] = None,
+        extended_metadata: Optional[dict] = None,
+        *,
+        use: Literal["test", "train", "validate", "other"] = "other",
+        fingerprint: bool = True,
+        background: bool = False,
+    ) -> list[str]:
+        """Registers many files in a single inventory write.
+
+        Fingerprints are computed in parallel and written with the
+        entries, or afterwards when background is set.
+
+        Args:
+            source_files: The names of the files with their paths.
+            encoding: The encoding shared by the files.
+            tags: The tags for every file. Defaults to None.
+            file_ids: The requested IDs, one per file. Defaults to None.
+            description: Optional human-readable description.
+            extended_metadata: Optional dict of custom fields.
+            use: Intended usage category appended as a tag (test, train,
+                validate, other). Defaults to "other".
+            fingerprint: Store content fingerprints. Defaults to True.
+            background: Compute the fingerprints on a background thread.
+                Defaults to False.
+
+        Raises:
+            FileNotFoundError: If a source file is not found on disk.
+            IndexError: If a provided ID already exists in the inventory.
+
+        Returns:
+            The IDs assigned, in the order of source_files.
+        """
+        if tags is None:
+            tags = []
+        elif isinstance(tags, str):
+            tags = [tags]
+        with self.batch():
+            assigned = super().register_many(
+                [os.path.abspath(f) for f in source_files],
+                encoding=encoding,
+                tags=tags + [use],
+                file_ids=file_ids,
+                description=description,
+                extended_metadata=extended_metadata,
+            )
+            if fingerprint and not background:
+                self.refresh_fingerprints(assigned)
+        if fingerprint and background:
+            self._fingerprint_later(assigned)
+        return assigned
+
+    # ------------------------------------------------------------------
+    # Sharded datasets
+    # ------------------------------------------------------------------
+
+    def register_shards(
+        self,
+        source: str,
+        encoding: FileEncodingTypes,
+        tags: Optional[Union[str, list[str]]] = None,
+        file_id: Optional[str] = None,
+        use: Literal["test", "train", "validate", "other"] = "other",
+        description: Optional[str] = None,
+        extended_metadata: Optional[dict] = None,
+    ) -> str:
+        """Registers a folder or glob of shard files as one dataset.
+
+        Every shard is fingerprinted (in parallel) and recorded with its
+        size in extended_metadata["shards"]; see adgtk.data.shards. The
+        dataset then loads and streams like a single file: load_file
+        joins the shards, iter_file streams them in order.
+
+        Args:
+            source: A folder (every file in it) or a glob such as
+                "generated/part-*.jsonl".
+            encoding: The encoding shared by the shards.
+            tags: The tags for this dataset. Defaults to None.
+            file_id: The requested ID. Defaults to None.
+            use: Intended usage category appended as a tag (test, train,
+                validate, other). Defaults to "other".
+            description: Optional human-readable description.
+            extended_metadata: Optional dict of custom fields.
+
+        Raises:
+            ValueError: If source is neither a folder nor a glob.
+            FileNotFoundError: If no shard matches.
+            IndexError: If the provided ID already exists in the inventory.
+
+        Returns:
+            The unique ID assigned to the dataset.
+        """
+        folder, pattern = split_source(source)
+        shards = scan_shards(folder, pattern)
+        assigned = self.register_file(
+            source_file=folder,
+            encoding=encoding,
+            tags=_tag_list(tags) + [use],
+            file_id=file_id,
+            description=description,
+            extended_metadata=shards_metadata(
+                pattern, shards, extended_metadata),
+        )
+        self.logger.info(
+            f"Registered {len(shards)} shards of {source} as {assigned}")
+        return assigned
+
+    def _rescan_shards(self, file_def: FileDefinition) -> list[Shard]:
+        """Scans a sharded dataset again and stores any change."""
+        pattern, previous = stored_shards(file_def)
+        folder = os.path.join(file_def.path, file_def.filename)
+        shards = scan_shards(folder, pattern, previous)
+        if shards == previous:
+            return shards
+
+        def _apply(inventory: dict[str, FileDefinition]) -> None:
+            entry = inventory.get(file_def.file_id)
+            if entry is None:
+                return
+            entry = entry.model_copy()
+            entry.extended_metadata = shards_metadata(
+                pattern, shards, entry.extended_metadata)
+            inventory[file_def.file_id] = entry
+
+        self._update(_apply)
+        return shards
+
+    def refresh_shards(self, file_id: str) -> int:
+        """Picks up shards added, removed or changed since registration.
+
+        Only shards whose size or mtime changed are hashed again.
+
+        Args:
+            file_id: The ID of the sharded dataset.
+
+        Raises:
+            KeyError: If the file ID is not found.
+            ValueError: If the file is not a sharded dataset.
+            FileNotFoundError: If no shard matches any more.
+
+        Returns:
+            The number of shards now in the dataset.
+        """
+        return len(self._rescan_shards(self.get_file_definition(file_id)))
 
-    def report(self, tag=None) -> None:
-        """Print inventory report with blueprint usage counts."""
+    def list_shards(
+        self,
+        file_id: str,
+        worker: int = 0,
+        num_workers: int = 1,
+    ) -> list[FileDefinition]:
+        """The shards of a sharded dataset as file definitions.
+
+        Args:
+            file_id: The ID of the sharded dataset.
+            worker: Return only the shards worker reads, i.e. every
+                num_workers-th shard starting at worker.
+            num_workers: The number of workers sharing the dataset.
+
+        Raises:
+            KeyError: If the file ID is not found.
+            ValueError: If the file is not a sharded dataset or worker is
+                not in [0, num_workers).
+        """
+        return shard_definitions(
+            self.get_file_definition(file_id), worker, num_workers)
+
+    def load_shards(
+        self,
+        file_id: str,
+        worker: int = 0,
+        num_workers: int = 1,
+        max_workers: Optional[int] = None,
+        processes: bool = False,
+    ) -> ChunkTypes:
+        """Loads the shards of a dataset in parallel and joins them.
+
+        Args:
+            file_id: The ID of the sharded dataset.
+            worker: Load only this worker's shards; see list_shards.
+            num_workers: The number of workers sharing the dataset.
+            max_workers: Shards loaded at once. Defaults to
+                adgtk.data.shards.MAX_SHARD_WORKERS.
+            processes: Load in worker processes instead of threads;
+                faster for csv and json shards.
+
+        Raises:
+            KeyError: If the file ID is not found.
+            ValueError: If the file is not a sharded dataset, worker is
+                out of range, or the shards do not load as lists or
+                DataFrames.
+
+        Returns:
+            The records of the shards in order: a list or a DataFrame.
+        """
+        data = load_shards(
+            self.list_shards(file_id, worker, num_workers),
+            max_workers=max_workers, processes=processes)
+        note_dataset_loaded(file_id)
+        return data
+
+    def iter_shards(
+        self,
+        file_id: str,
+        worker: int = 0,
+        num_workers: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: Optional[int] = None,
+        processes: bool = False,
+    ) -> Iterator[ChunkTypes]:
+        """Streams the shards of a dataset, reading ahead in parallel.
+
+        Example:
+            # in worker i of N
+            for chunk in manager.iter_shards("generated", i, N):
+                ...
+
+        Args:
+            file_id: The ID of the sharded dataset.
+            worker: Stream only this worker's shards; see list_shards.
+            num_workers: The number of workers sharing the dataset.
+            chunk_size: The maximum records per chunk.
+            max_workers: Shards read ahead at once. Defaults to
+                adgtk.data.shards.MAX_SHARD_WORKERS.
+            processes: Read in worker processes instead of threads.
+
+        Raises:
+            KeyError: If the file ID is not found.
+            ValueError: If the file is not a sharded dataset or worker is
+                out of range.
+
+        Returns:
+            An iterator over the chunks of each shard in turn.
+        """
+        chunks = iter_shards(
+            self.list_shards(file_id, worker, num_workers), chunk_size,
+            max_workers=max_workers, processes=processes)
+        note_dataset_loaded(file_id)
+        return chunks
+
+    # ------------------------------------------------------------------
+    # Profiles
+    # ------------------------------------------------------------------
+
+    def profile(
+        self,
+        file_id: str,
+        refresh: bool = False,
+        top_k: int = DEFAULT_TOP_K,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> DatasetProfile:
+        """Returns per-column statistics of a registered file.
+
+        The file is streamed once (see adgtk.data.profile) and the
+        profile stored in extended_metadata["profile"] with the file's
+        fingerprint digest. Later calls return the stored profile until
+        the content changes, which costs a stat of the file.
+
+        Args:
+            file_id: The unique identifier of the file in the tracker.
+            refresh: Profile the file again even if it is unchanged.
+            top_k: The most frequent values kept per column.
+            chunk_size: The records read per chunk.
+
+        Raises:
+            KeyError: If the file ID is not found.
+            ValueError: If the file's data is not records or a table.
+
+        Returns:
+            The profile.
+        """
+        file_def = self.get_file_definition(file_id)
+        digest = self.fingerprint(file_id).digest
+        cached = stored_profile(file_def)
+        if cached is not None and cached.digest == digest and not refresh:
+            return cached
+
+        profile = profile_chunks(
+            self._profile_source(file_def, chunk_size), digest, top_k)
+
+        def _apply(inventory: dict[str, FileDefinition]) -> None:
+            entry = inventory.get(file_id)
+            if entry is None:
+                return
+            entry = entry.model_copy()
+            entry.extended_metadata = with_profile(
+                entry.extended_metadata, profile)
+            inventory[file_id] = entry
+
+        self._update(_apply)
+        self.logger.info(
+            f"Profiled {file_id}: {profile.rows} rows in {profile.seconds}s")
+        return profile
+
+    @staticmethod
+    def _profile_source(
+        file_def: FileDefinition,
+        chunk_size: int,
+    ) -> Union[list, Iterator[ChunkTypes]]:
+        """Streams the file when possible, otherwise loads it whole."""
+        try:
+            return iter_data_from_file(file_def, chunk_size=chunk_size)
+        except ValueError:
+            data = load_data_from_file(file_def)
+        if isinstance(data, dict) and valid_dict_of_lists(data):
+            data = pd.DataFrame(data)
+        if isinstance(data, (list, pd.DataFrame)):
+            return [data]
+        raise ValueError(
+            f"Unable to profile {file_def.encoding} data "
+            f"({type(data).__name__})")
+
+    def report(self, tag=None, profiles: bool = False) -> None:
+        """Print inventory report with blueprint usage counts.
+
+        The Rows column comes from stored profiles that are still
+        current; see profile.
+
+        Args:
+            tag: Only list files with these tags.
+            profiles: Also print the column statistics of every listed
+                file, profiling those without a current profile.
+        """
         files = self.list_files(tag=tag)
         files.sort(key=lambda x: (x.path, x.filename))
 
@@ -137,21 +616,26 @@ class DatasetManager(JsonFileTracker):
             if tag_str:
                 title = f"{self.label} File Manager report - tags: {tag_str}"
 
-        cid, cfile, cpath, ctags, cused = 35, 30, 15, 20, 6
+        cid, cfile, cpath, ctags, cused, crows = 35, 30, 15, 20, 6, 12
         header = (
             f"    {'File ID':<{cid}} | {'Filename':<{cfile}} | "
             f"{'Folder':<{cpath}} | {'Tags':<{ctags}} | {'Used':>{cused}}"
+            f" | {'Rows':>{crows}}"
         )
 
+        usage = all_dataset_usage()
         rows = []
         for file in files:
             file_tags = " ".join(file.tags) if file.tags else ""
-            bp_count = len(find_blueprints_using_dataset(file.file_id))
+            entry = usage.get(file.file_id)
+            bp_count = len(entry.blueprints) if entry else 0
             used = str(bp_count) if bp_count else "-"
+            known = current_profile(file)
+            count = f"{known.rows:,}" if known else "-"
             rows.append(
                 f" - {file.file_id:<{cid}} | {file.filename:<{cfile}} | "
                 f"{file.path:<{cpath}} | {file_tags:<{ctags}}"
-                f" | {used:>{cused}}"
+                f" | {used:>{cused}} | {count:>{crows}}"
             )
 
         all_lines = [title, header] + rows
@@ -163,6 +647,15 @@ class DatasetManager(JsonFileTracker):
         for row in rows:
             print(row)
 
+        if not profiles:
+            return
+        for file in files:
+            try:
+                text = format_profile(self.profile(file.file_id), file.file_id)
+            except (ValueError, OSError) as e:
+                text = f"{file.file_id} - not profiled: {e}"
+            print(f"\n{text}")
+
     def load_file(self, file_id: str) -> ReturnDataTypes:
         """Retrieves and loads data from a file using its tracker ID.
 
@@ -173,4 +666,495 @@ class DatasetManager(JsonFileTracker):
             The loaded data in its native or requested format.
         """
         file_def = self.get_file_definition(file_id)
-        return load_data_from_file(file_def=file_def)
+        data = load_data_from_file(file_def=file_def)
+        note_dataset_loaded(file_id)
+        return data
+
+    def iter_file(
+        self,
+        file_id: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[ChunkTypes]:
+        """Streams a registered file in chunks of bounded size.
+
+        Supports the csv, jsonl, pandas (.csv), hf-json, parquet and
+        feather encodings; see
+        iter_data_from_file. The chunks can be passed straight to
+        MeasurementEngine.measure_chunks.
+
+        Args:
+            file_id: The unique identifier of the file in the tracker.
+            chunk_size: The maximum records per chunk.
+
+        Raises:
+            KeyError: If the file ID is not found.
+            ValueError: If the file's encoding cannot be streamed.
+
+        Returns:
+            An iterator over lists of records, or over DataFrames for the
+            pandas encoding.
+        """
+        file_def = self.get_file_definition(file_id)
+        note_dataset_loaded(file_id)
+        return iter_data_from_file(file_def, chunk_size=chunk_size)
+
+    def load_columns(
+        self,
+        file_id: str,
+        schema: Optional[dict[str, ColumnTypes]] = None,
+        infer_types: bool = True,
+        usecols: Optional[list[str]] = None,
+        nrows: Optional[int] = None,
+    ) -> ColumnarDataset:
+        """Loads a registered CSV file into typed columns.
+
+        Uses the C-accelerated reader of adgtk.data.ingest; much faster
+        and smaller than load_file for large files.
+
+        Args:
+            file_id: The unique identifier of the file in the tracker.
+            schema: Column name to "int", "float", "bool" or "str".
+            infer_types: Infer the type of columns missing from the
+                schema; otherwise keep them as strings. Defaults to True.
+            usecols: Read only these columns. Defaults to all.
+            nrows: Read at most this many rows. Defaults to all.
+
+        Raises:
+            KeyError: If the file ID is not found.
+            ValueError: If the file is not a CSV file.
+
+        Returns:
+            The file's columns.
+        """
+        file_def = self.get_file_definition(file_id)
+        is_csv = file_def.encoding == "csv" or (
+            file_def.encoding == "pandas"
+            and file_def.filename.lower().endswith(".csv"))
+        if not is_csv:
+            raise ValueError(f"{file_id} is not a CSV file")
+        data = read_csv_columns(
+            os.path.join(file_def.path, file_def.filename),
+            schema=schema, infer_types=infer_types, usecols=usecols,
+            nrows=nrows)
+        note_dataset_loaded(file_id)
+        return data
+
+    def pipeline(
+        self,
+        file_id: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Pipeline:
+        """Starts a lazy transform pipeline over a registered file.
+
+        The file is streamed with iter_file only when the pipeline runs;
+        see adgtk.data.pipeline. Its write_to stage registers the output
+        with this manager.
+
+        Args:
+            file_id: The unique identifier of the file in the tracker.
+            chunk_size: The records read per chunk.
+
+        Raises:
+            KeyError: If the file ID is not found.
+
+        Returns:
+            A Pipeline yielding the file's records.
+        """
+        self.get_file_definition(file_id)
+        return Pipeline.from_chunks(
+            lambda: self.iter_file(file_id, chunk_size), manager=self)
+
+    def sample(
+        self,
+        file_id: str,
+        n: int,
+        seed: Optional[int] = None,
+        method: Literal["auto", "stream", "random_access"] = "auto",
+        use_cache: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ChunkTypes:
+        """Draws n records uniformly at random without loading the file.
+
+        "stream" makes one pass over iter_file (reservoir sampling, see
+        adgtk.data.sample). "random_access" draws positions and reads
+        only those records; it needs a jsonl file (through its offset
+        index) or a parquet/feather file. "auto" picks random access when
+        the file supports it.
+
+        With a seed, the sample is cached by the file's fingerprint, n,
+        seed and method, so repeating the call is a cache read until the
+        file changes.
+
+        Args:
+            file_id: The unique identifier of the file in the tracker.
+            n: The sample size; capped at the number of records.
+            seed: Seed for a reproducible sample. None draws a fresh one
+                (and bypasses the cache).
+            method: "auto", "stream" or "random_access".
+            use_cache: Read and fill the cache for seeded samples.
+            chunk_size: The records read per chunk when streaming.
+
+        Raises:
+            KeyError: If the file ID is not found.
+            ValueError: If the file cannot be streamed, or random access
+                was requested for a file without it.
+
+        Returns:
+            The records in file order: a list, or a DataFrame for
+            pandas, parquet and feather files.
+        """
+        file_def = self.get_file_definition(file_id)
+        random_access = not is_sharded(file_def) and (
+            file_def.encoding in ("jsonl",) + TABULAR_ENCODINGS)
+        if method == "auto":
+            method = "random_access" if random_access else "stream"
+        if method == "random_access" and not random_access:
+            raise ValueError(
+                f"{file_def.encoding} files do not support random access")
+
+        def _build() -> ChunkTypes:
+            if method == "stream":
+                return reservoir_sample(
+                    self.iter_file(file_id, chunk_size), n, seed)
+            return self._sample_positions(file_def, n, seed)
+
+        data = self._cached_sample(file_def, _build, use_cache and (
+            seed is not None), {"sample": method, "n": n, "seed": seed})
+        note_dataset_loaded(file_id)
+        return data
+
+    def stratified_sample(
+        self,
+        file_id: str,
+        column: str,
+        n: int,
+        seed: Optional[int] = None,
+        per_stratum: bool = True,
+        use_cache: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ChunkTypes:
+        """Draws a uniform sample within each value of a column.
+
+        One streaming pass; memory holds at most n records per stratum.
+        Seeded samples are cached like sample().
+
+        Args:
+            file_id: The unique identifier of the file in the tracker.
+            column: The field whose values define the strata.
+            n: Records per stratum, or in total when per_stratum is
+                False.
+            seed: Seed for a reproducible sample. None draws a fresh one.
+            per_stratum: Take n from every stratum. When False, n in
+                total, shared in proportion to the strata sizes.
+            use_cache: Read and fill the cache for seeded samples.
+            chunk_size: The records read per chunk.
+
+        Raises:
+            KeyError: If the file ID is not found or a record lacks the
+                column.
+            ValueError: If the file cannot be streamed.
+
+        Returns:
+            The records in file order: a list, or a DataFrame for
+            pandas, parquet and feather files.
+        """
+        file_def = self.get_file_definition(file_id)
+
+        def _build() -> ChunkTypes:
+            return stratified_sample(
+                self.iter_file(file_id, chunk_size), column, n, seed,
+                per_stratum=per_stratum)
+
+        data = self._cached_sample(
+            file_def, _build, use_cache and seed is not None, {
+                "sample": "stratified", "column": column, "n": n,
+                "seed": seed, "per_stratum": per_stratum})
+        note_dataset_loaded(file_id)
+        return data
+
+    @staticmethod
+    def _cached_sample(
+        file_def: FileDefinition,
+        build: Callable[[], ChunkTypes],
+        use_cache: bool,
+        options: dict,
+    ) -> ChunkTypes:
+        if not use_cache:
+            return build()
+        return load_cached(
+            file_def, build, options=options, encodings=STREAMABLE_ENCODINGS)
+
+    @staticmethod
+    def _sample_positions(
+        file_def: FileDefinition,
+        n: int,
+        seed: Optional[int],
+    ) -> ChunkTypes:
+        """Uniform sample through random access, in file order."""
+        path = os.path.join(file_def.path, file_def.filename)
+        rng = np.random.default_rng(seed)
+        if file_def.encoding == "jsonl":
+            with JsonlReader(path) as reader:
+                total = len(reader)
+                picks = np.sort(
+                    rng.choice(total, min(n, total), replace=False))
+                return [reader[int(i)] for i in picks]
+        total = count_table_rows(path, file_def.encoding)
+        picks = np.sort(rng.choice(total, min(n, total), replace=False))
+        return take_table_rows(path, file_def.encoding, picks.tolist())
+
+    def iter_split(
+        self,
+        file_id: str,
+        split: str,
+        key: Optional[str] = None,
+        ratios: Optional[dict[str, float]] = None,
+        seed: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[ChunkTypes]:
+        """Streams the records of one split of a registered file.
+
+        Records are assigned by hashing the key field with the seed (see
+        adgtk.data.split), so the same arguments select the same records
+        on any machine without loading or shuffling the file.
+
+        Args:
+            file_id: The unique identifier of the file in the tracker.
+            split: The split to stream, e.g. "train".
+            key: The field to hash. None hashes whole records.
+            ratios: Split name to proportion. Defaults to 80/10/10
+                train/test/validate.
+            seed: The split seed. Defaults to 0.
+            chunk_size: The maximum records read per chunk.
+
+        Raises:
+            KeyError: If the file ID is not found.
+            ValueError: If the file cannot be streamed or the split or
+                ratios are invalid.
+
+        Returns:
+            An iterator over chunks holding only that split's records.
+        """
+        assigner = SplitAssigner(key=key, ratios=ratios, seed=seed)
+        return assigner.iter_split(self.iter_file(file_id, chunk_size), split)
+
+    def split_file(
+        self,
+        file_id: str,
+        key: Optional[str] = None,
+        ratios: Optional[dict[str, float]] = None,
+        seed: int = 0,
+        output_dir: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> dict[str, str]:
+        """Writes each split of a registered file to a new registered file.
+
+        The source is read once, in chunks; every record is appended to
+        the file of its split as it is read. The split files are named
+        <stem>.<split><ext>, use the source's format family and are
+        registered as <file_id>-<split>, tagged with the split as their
+        use and the source's other tags. extended_metadata["split"]
+        records the source, key, seed and ratios.
+
+        Args:
+            file_id: The unique identifier of the file in the tracker.
+            key: The field to hash. None hashes whole records.
+            ratios: Split name to proportion. Defaults to 80/10/10
+                train/test/validate.
+            seed: The split seed. Defaults to 0.
+            output_dir: Where to write the split files. Defaults to the
+                source file's folder.
+            chunk_size: The maximum records read per chunk.
+
+        Raises:
+            KeyError: If the file ID is not found.
+            IndexError: If a split file ID is already registered.
+            ValueError: If the file cannot be streamed or the ratios are
+                invalid.
+
+        Returns:
+            Split name to the registered file ID, for non-empty splits.
+        """
+        assigner = SplitAssigner(key=key, ratios=ratios, seed=seed)
+        file_def = self.get_file_definition(file_id)
+        if file_def.encoding not in OUTPUT_FORMATS:
+            raise ValueError(f"Unable to split {file_def.encoding} files")
+        encoding, ext = OUTPUT_FORMATS[file_def.encoding]
+        split_ids = {name: f"{file_id}-{name}" for name in assigner.ratios}
+        for split_id in split_ids.values():
+            if self.file_id_exists(split_id):
+                raise IndexError(f"{split_id} is already registered")
+
+        folder = output_dir or file_def.path
+        os.makedirs(folder, exist_ok=True)
+        stem = os.path.splitext(file_def.filename)[0]
+        paths = {name: os.path.join(folder, f"{stem}.{name}{ext}")
+                 for name in assigner.ratios}
+        with SplitWriter(paths, encoding) as writer:
+            for chunk in self.iter_file(file_id, chunk_size):
+                for name, part in assigner.assign(chunk):
+                    writer.write(name, part)
+
+        source_tags = [
+            t for t in _tag_list(file_def.tags)
+            if t not in ("test", "train", "validate", "other")]
+        registered = {}
+        try:
+            # every split is registered, or none is and the files go
+            with self.batch():
+                for name, path in writer.written.items():
+                    registered[name] = self.register(
+                        path,
+                        cast(FileEncodingTypes, encoding),
+                        tags=list(source_tags),
+                        file_id=split_ids[name],
+                        use=cast(Literal["test", "train", "validate", "other"],
+                                 name if name in ("test", "train", "validate")
+                                 else "other"),
+                        description=f"{name} split of {file_id}",
+                        extended_metadata={SPLIT_KEY: {
+                            "source": file_id,
+                            "key": key,
+                            "seed": seed,
+                            "ratios": assigner.ratios,
+                            "records": writer.counts[name],
+                        }},
+                    )
+        except BaseException:
+            for path in writer.written.values():
+                if os.path.exists(path):
+                    os.remove(path)
+            raise
+        self.logger.info(
+            f"Split {file_id} into {writer.counts} with seed {seed}")
+        return registered
+
+    def load_hf(
+        self,
+        file_id: str,
+        mode: Optional[HfModeTypes] = None,
+    ) -> Any:
+        """Loads a registered hf-json file with the datasets library.
+
+        Args:
+            file_id: The unique identifier of the file in the tracker.
+            mode: "dataset_dict", "memory_map" or "streaming"; see
+                adgtk.data.utils.load_hf_json. Defaults to the file's
+                extended_metadata["hf_mode"], else "dataset_dict".
+
+        Raises:
+            KeyError: If the file ID is not found.
+            ValueError: If the file is not registered as hf-json.
+
+        Returns:
+            A DatasetDict, memory-mapped Dataset or IterableDataset.
+        """
+        file_def = self.get_file_definition(file_id)
+        if file_def.encoding != "hf-json":
+            raise ValueError(
+                f"{file_id} is registered as {file_def.encoding}, not hf-json")
+        if mode is None:
+            mode = (file_def.extended_metadata or {}).get(
+                HF_MODE_KEY, "dataset_dict")
+        data = load_hf_json(
+            os.path.join(file_def.path, file_def.filename), mode)
+        note_dataset_loaded(file_id)
+        return data
+
+    def load_table(
+        self,
+        file_id: str,
+        columns: Optional[list[str]] = None,
+        filters: Optional[FilterTypes] = None,
+    ) -> pd.DataFrame:
+        """Loads a registered Parquet or Feather file.
+
+        Only the requested columns are read, and for Parquet the filters
+        skip row groups whose statistics cannot match.
+
+        Args:
+            file_id: The unique identifier of the file in the tracker.
+            columns: Read only these columns. Defaults to all.
+            filters: A pyarrow.compute Expression or DNF tuples such as
+                [("split", "==", "train")].
+
+        Raises:
+            KeyError: If the file ID is not found.
+            ValueError: If the file is not parquet or feather.
+
+        Returns:
+            The matching rows.
+        """
+        file_def = self._tabular_definition(file_id)
+        data = read_table(
+            os.path.join(file_def.path, file_def.filename),
+            file_def.encoding, columns=columns, filters=filters)
+        note_dataset_loaded(file_id)
+        return data
+
+    def iter_table(
+        self,
+        file_id: str,
+        columns: Optional[list[str]] = None,
+        filters: Optional[FilterTypes] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Streams a registered Parquet or Feather file as DataFrames.
+
+        Like load_table, but only one row group or record batch is held
+        in memory at a time.
+
+        Args:
+            file_id: The unique identifier of the file in the tracker.
+            columns: Read only these columns. Defaults to all.
+            filters: Keep only matching rows, as for load_table.
+            chunk_size: The maximum rows per DataFrame.
+
+        Raises:
+            KeyError: If the file ID is not found.
+            ValueError: If the file is not parquet or feather.
+
+        Returns:
+            An iterator over DataFrames.
+        """
+        file_def = self._tabular_definition(file_id)
+        chunks = iter_table(
+            os.path.join(file_def.path, file_def.filename),
+            file_def.encoding, columns=columns, filters=filters,
+            chunk_size=chunk_size)
+        note_dataset_loaded(file_id)
+        return chunks
+
+    def _tabular_definition(self, file_id: str) -> FileDefinition:
+        file_def = self.get_file_definition(file_id)
+        if file_def.encoding not in TABULAR_ENCODINGS:
+            raise ValueError(
+                f"{file_id} is registered as {file_def.encoding}, "
+                "not parquet or feather")
+        return file_def
+
+    def open_jsonl(self, file_id: str) -> JsonlReader:
+        """Opens a registered JSONL file for random access.
+
+        The file's line-offset index is built on first use and extended
+        incrementally when the file has only been appended to. Records are
+        parsed only when read.
+
+        Args:
+            file_id: The unique identifier of the file in the tracker.
+
+        Raises:
+            KeyError: If the file ID is not found.
+            ValueError: If the file is not registered with the jsonl
+                encoding.
+
+        Returns:
+            A JsonlReader; close it (or use it as a context manager) when
+            done.
+        """
+        file_def = self.get_file_definition(file_id)
+        if file_def.encoding != "jsonl":
+            raise ValueError(
+                f"{file_id} is registered as {file_def.encoding}, not jsonl")
+        note_dataset_loaded(file_id)
+        return JsonlReader(os.path.join(file_def.path, file_def.filename))
@@ -0,0 +1,180 @@
+"""Content fingerprints for registered datasets.
+
+A fingerprint is the streamed blake2b digest of a file together with the
+size and mtime it had when hashed. It is stored in the file definition's
+extended_metadata under FINGERPRINT_KEY, so anything needing a cache key
+for a dataset (loading, measurement memoization, run skipping) can read
+it instead of hashing the file again.
+
+A stored fingerprint is trusted while the file's size and mtime still
+match it; only then is the digest reused. Hashing runs in a shared thread
+pool when many files are involved — hashlib releases the GIL while it
+digests, so the pool spreads the work over the available cores.
+"""
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional
+
+from pydantic import BaseModel, ValidationError
+
+from adgtk.data.structure import FileDefinition
+from adgtk.utils.file import file_content_hash
+
+FINGERPRINT_KEY = "fingerprint"
+MAX_HASH_WORKERS = min(8, os.cpu_count() or 1)
+
+_executor: Optional[ThreadPoolExecutor] = None
+# runs background jobs that themselves wait on _executor
+_background: Optional[ThreadPoolExecutor] = None
+
+
+# ----------------------------------------------------------------------
+# Models
+# ----------------------------------------------------------------------
+
+
+class Fingerprint(BaseModel):
+    """The content digest of a file and the stamps it was taken at."""
+    digest: str
+    size: int
+    mtime_ns: int
+
+
+# ----------------------------------------------------------------------
+# Internal helpers
+# ----------------------------------------------------------------------
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=MAX_HASH_WORKERS,
+            thread_name_prefix="adgtk-fingerprint")
+    return _executor
+
+
+def _get_background() -> ThreadPoolExecutor:
+    global _background
+    if _background is None:
+        _background = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="adgtk-fingerprint-bg")
+    return _background
+
+
+def _source_path(file_def: FileDefinition) -> str:
+    return os.path.join(file_def.path, file_def.filename)
+
+
+# ----------------------------------------------------------------------
+# Public API
+# ----------------------------------------------------------------------
+
+
+def stored_fingerprint(file_def: FileDefinition) -> Optional[Fingerprint]:
+    """Return the fingerprint held in a file definition, if any."""
+    meta = file_def.extended_metadata or {}
+    raw = meta.get(FINGERPRINT_KEY)
+    if not isinstance(raw, dict):
+        return None
+    try:
+        return Fingerprint(**raw)
+    except ValidationError:
+        return None
+
+
+def compute_fingerprint(
+    path: str,
+    previous: Optional[Fingerprint] = None,
+) -> Fingerprint:
+    """Fingerprint a file, reusing previous when its stamps still match.
+
+    Args:
+        path: The file to fingerprint.
+        previous: The last known fingerprint of the file.
+
+    Returns:
+        The current Fingerprint.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    st = os.stat(path)
+    if (previous is not None and previous.size == st.st_size
+            and previous.mtime_ns == st.st_mtime_ns):
+        return previous
+    digest = file_content_hash(path)
+    # a write while hashing shows up as changed stamps on the next call
+    return Fingerprint(
+        digest=digest, size=st.st_size, mtime_ns=st.st_mtime_ns)
+
+
+def is_current(file_def: FileDefinition) -> bool:
+    """True when the stored fingerprint matches the file's stamps."""
+    stored = stored_fingerprint(file_def)
+    if stored is None:
+        return False
+    try:
+        st = os.stat(_source_path(file_def))
+    except OSError:
+        return False
+    return stored.size == st.st_size and stored.mtime_ns == st.st_mtime_ns
+
+
+def submit_path(
+    path: str,
+    previous: Optional[Fingerprint] = None,
+) -> "Future[Fingerprint]":
+    """Fingerprint any file on the shared thread pool."""
+    return _get_executor().submit(compute_fingerprint, path, previous)
+
+
+def submit_fingerprint(
+    file_def: FileDefinition,
+) -> "Future[Fingerprint]":
+    """Fingerprint a registered file on the shared thread pool."""
+    return submit_path(_source_path(file_def), stored_fingerprint(file_def))
+
+
+def fingerprint_many(
+    file_defs: Iterable[FileDefinition],
+) -> dict[str, Fingerprint]:
+    """Fingerprint several registered files in parallel.
+
+    Files whose stored fingerprint is still current are not read.
+
+    Args:
+        file_defs: The file definitions to fingerprint.
+
+    Returns:
+        Mapping of file ID to its current Fingerprint. Files missing on
+        disk are left out.
+    """
+    futures = {fd.file_id: submit_fingerprint(fd) for fd in file_defs}
+    found: dict[str, Fingerprint] = {}
+    for file_id, future in futures.items():
+        try:
+            found[file_id] = future.result()
+        except OSError:
+            continue
+    return found
+
+
+def with_fingerprint(
+    extended_metadata: Optional[dict],
+    fingerprint: Fingerprint,
+) -> dict:
+    """Return a copy of extended_metadata holding fingerprint."""
+    meta = dict(extended_metadata or {})
+    meta[FINGERPRINT_KEY] = fingerprint.model_dump()
+    return meta
+
+
+def run_in_background(fn: Callable[..., Any], *args: Any) -> Future:
+    """Run a fingerprinting job off the caller's thread.
+
+    Jobs run one at a time on their own thread and may use the hashing
+    pool, so a job waiting on fingerprint_many never starves it.
+    """
+    return _get_background().submit(fn, *args)
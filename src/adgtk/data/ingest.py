@@ -0,0 +1,401 @@
+"""Fast, typed ingestion of CSV, Parquet and Feather files.
+
+read_csv_columns parses a CSV file with a C/C++ reader straight into
+column arrays (a ColumnarDataset) instead of one Python dict per row:
+
+  - pyarrow's CSV reader when pyarrow is installed (it ships with
+    datasets); it is multi-threaded and the fastest option
+  - pandas' C parser otherwise, and whenever pyarrow rejects the file
+
+Column types come from the optional schema, then from inference
+(int, float, bool or str) unless infer_types is False, in which case
+every column stays a string exactly as the csv module would return it.
+Both readers give the same types: dates and times stay strings. Types
+are inferred from the rows read, so with nrows a column can come back
+as int that is float in the whole file; pass a schema to pin it.
+Only empty cells count as missing: in numeric columns they become NaN,
+in string columns they stay "". Literal "NA" or "null" are kept as text.
+
+usecols reads only some of the columns and nrows stops after that many
+rows, both without materialising the rest of the file in Python.
+
+Parquet and Feather (Arrow IPC) files are read through pyarrow's dataset
+API: read_table and iter_table accept a column projection and filters.
+For Parquet the filters are pushed down, so row groups whose statistics
+rule them out are never read; for Feather they are applied per batch.
+iter_table streams one row group (Parquet) or record batch (Feather) at
+a time, and read_table_preview reads only the first one.
+"""
+
+import csv
+from typing import Any, Iterator, Literal, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from adgtk.data.columnar import ColumnarDataset
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.dataset as pa_ds
+    import pyarrow.parquet as pq
+    _HAS_ARROW = True
+except ImportError:  # pragma: no cover - pyarrow ships with datasets
+    _HAS_ARROW = False
+
+ColumnTypes = Literal["int", "float", "bool", "str"]
+# a pyarrow.compute Expression, or DNF tuples like [("score", ">", 0.5)]
+FilterTypes = Union[Any, list[tuple], list[list[tuple]]]
+TABULAR_ENCODINGS = ("parquet", "feather")
+COLUMN_TYPES: tuple[str, ...] = ("int", "float", "bool", "str")
+
+_PANDAS_DTYPES = {
+    "int": "int64",
+    "float": "float64",
+    "bool": "bool",
+    "str": "object",
+}
+
+
+# ----------------------------------------------------------------------
+# Internal helpers
+# ----------------------------------------------------------------------
+
+
+def _read_header(filename: str, encoding: str, delimiter: str) -> list[str]:
+    with open(filename, "r", newline="", encoding=encoding) as f:
+        return next(csv.reader(f, delimiter=delimiter), [])
+
+
+def _column_types(
+    header: list[str],
+    usecols: list[str],
+    schema: Optional[dict[str, ColumnTypes]],
+    infer_types: bool,
+) -> dict[str, str]:
+    """The declared type of each column that is not left to inference."""
+    declared = {} if infer_types else {c: "str" for c in usecols}
+    for column, kind in (schema or {}).items():
+        if kind not in COLUMN_TYPES:
+            raise ValueError(f"Unknown column type {kind} for {column}")
+        if column not in header:
+            raise ValueError(f"Schema column {column} is not in the file")
+        if column in usecols:
+            declared[column] = kind
+    return declared
+
+
+def _arrow_table(
+    filename: str,
+    usecols: list[str],
+    declared: dict[str, str],
+    nrows: Optional[int],
+    encoding: str,
+    delimiter: str,
+) -> "pa.Table":
+    arrow_types = {"int": pa.int64(), "float": pa.float64(),
+                   "bool": pa.bool_(), "str": pa.string()}
+    read_options = pa_csv.ReadOptions(encoding=encoding)
+    parse_options = pa_csv.ParseOptions(
+        delimiter=delimiter, newlines_in_values=True)
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=usecols,
+        column_types={c: arrow_types[k] for c, k in declared.items()},
+        null_values=[""],
+        strings_can_be_null=False,
+    )
+    if nrows is None:
+        table = pa_csv.read_csv(
+            filename, read_options=read_options,
+            parse_options=parse_options, convert_options=convert_options)
+    else:
+        # stream blocks until enough rows are read
+        batches = []
+        count = 0
+        with pa_csv.open_csv(
+                filename, read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options) as reader:
+            for batch in reader:
+                if count >= nrows:
+                    break
+                batches.append(batch)
+                count += batch.num_rows
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+        table = table.slice(0, nrows)
+    return table
+
+
+def _arrow_columns(
+    filename: str,
+    usecols: list[str],
+    declared: dict[str, str],
+    nrows: Optional[int],
+    encoding: str,
+    delimiter: str,
+) -> dict[str, np.ndarray]:
+    table = _arrow_table(
+        filename, usecols, declared, nrows, encoding, delimiter)
+    # pyarrow also infers dates, times and all-empty (null) columns; read
+    # those again typed as the pandas parser would: str and float
+    retype = {
+        field.name: "str" if pa.types.is_temporal(field.type) else "float"
+        for field in table.schema
+        if pa.types.is_temporal(field.type) or pa.types.is_null(field.type)}
+    if retype:
+        table = _arrow_table(filename, usecols, {**declared, **retype},
+                             nrows, encoding, delimiter)
+    return {name: table.column(name).to_numpy(zero_copy_only=False)
+            for name in table.column_names}
+
+
+def _pandas_columns(
+    filename: str,
+    usecols: list[str],
+    declared: dict[str, str],
+    nrows: Optional[int],
+    encoding: str,
+    delimiter: str,
+) -> dict[str, np.ndarray]:
+    frame = pd.read_csv(
+        filename,
+        engine="c",
+        usecols=usecols,
+        dtype={c: _PANDAS_DTYPES[k] for c, k in declared.items()},
+        nrows=nrows,
+        encoding=encoding,
+        sep=delimiter,
+        keep_default_na=False,
+        na_values=[""],
+    )
+    columns: dict[str, np.ndarray] = {}
+    for name in usecols:
+        series = frame[name]
+        if declared.get(name) == "str" or not (
+                pd.api.types.is_numeric_dtype(series)
+                or pd.api.types.is_bool_dtype(series)):
+            columns[name] = series.to_numpy(dtype=object, na_value="")
+        else:
+            columns[name] = series.to_numpy()
+    return columns
+
+
+def _require_arrow(encoding: str) -> None:
+    if not _HAS_ARROW:
+        raise ImportError(f"pyarrow is required for the {encoding} encoding")
+    if encoding not in TABULAR_ENCODINGS:
+        raise ValueError(f"Unsupported tabular encoding {encoding}")
+
+
+def _dataset(filename: str, encoding: str) -> "pa_ds.Dataset":
+    _require_arrow(encoding)
+    return pa_ds.dataset(
+        filename, format="ipc" if encoding == "feather" else "parquet")
+
+
+def _expression(filters: Optional[FilterTypes]) -> Any:
+    if filters is None or isinstance(filters, pa_ds.Expression):
+        return filters
+    return pq.filters_to_expression(filters)
+
+
+def _scanner(
+    filename: str,
+    encoding: str,
+    columns: Optional[list[str]],
+    filters: Optional[FilterTypes],
+    **kwargs: Any,
+) -> "pa_ds.Scanner":
+    return _dataset(filename, encoding).scanner(
+        columns=columns, filter=_expression(filters), **kwargs)
+
+
+# ----------------------------------------------------------------------
+# Public API
+# ----------------------------------------------------------------------
+
+
+def read_csv_columns(
+    filename: str,
+    schema: Optional[dict[str, ColumnTypes]] = None,
+    infer_types: bool = True,
+    usecols: Optional[list[str]] = None,
+    nrows: Optional[int] = None,
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+) -> ColumnarDataset:
+    """Reads a CSV file with a header row into a ColumnarDataset.
+
+    Args:
+        filename: The path to the CSV file.
+        schema: Column name to "int", "float", "bool" or "str" for the
+            columns whose type should not be inferred.
+        infer_types: Infer the type of columns missing from the schema.
+            When False they are kept as strings. Defaults to True.
+        usecols: Read only these columns, in this order. Defaults to all.
+        nrows: Read at most this many rows. Defaults to all.
+        encoding: The text encoding of the file. Defaults to utf-8.
+        delimiter: The field delimiter. Defaults to ",".
+
+    Raises:
+        ValueError: If usecols or schema name a column the file lacks,
+            the schema holds an unknown type, or a value cannot be
+            converted to its declared type.
+
+    Returns:
+        The file's columns.
+    """
+    header = _read_header(filename, encoding, delimiter)
+    if usecols is None:
+        usecols = header
+    missing = [c for c in usecols if c not in header]
+    if missing:
+        raise ValueError(f"Columns not found in {filename}: {missing}")
+    if not usecols or nrows == 0:
+        return ColumnarDataset({c: [] for c in usecols})
+    declared = _column_types(header, usecols, schema, infer_types)
+
+    if _HAS_ARROW:
+        try:
+            return ColumnarDataset(_arrow_columns(
+                filename, usecols, declared, nrows, encoding, delimiter))
+        except pa.ArrowInvalid:
+            # e.g. a type that changes after the first streamed block
+            pass
+    return ColumnarDataset(_pandas_columns(
+        filename, usecols, declared, nrows, encoding, delimiter))
+
+
+def read_table(
+    filename: str,
+    encoding: str,
+    columns: Optional[list[str]] = None,
+    filters: Optional[FilterTypes] = None,
+) -> pd.DataFrame:
+    """Reads a Parquet or Feather file into a DataFrame.
+
+    Args:
+        filename: The path to the file.
+        encoding: "parquet" or "feather".
+        columns: Read only these columns. Defaults to all.
+        filters: Keep only matching rows; a pyarrow.compute Expression or
+            DNF tuples such as [("split", "==", "train")]. Pushed down to
+            the row groups of Parquet files.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ValueError: If the encoding is not parquet or feather.
+
+    Returns:
+        The matching rows.
+    """
+    table = _scanner(filename, encoding, columns, filters).to_table()
+    return table.to_pandas()
+
+
+def iter_table(
+    filename: str,
+    encoding: str,
+    columns: Optional[list[str]] = None,
+    filters: Optional[FilterTypes] = None,
+    chunk_size: Optional[int] = None,
+) -> Iterator[pd.DataFrame]:
+    """Streams a Parquet or Feather file as DataFrames.
+
+    Only one row group (Parquet) or record batch (Feather) is decoded at
+    a time, and at most chunk_size rows are yielded per DataFrame.
+
+    Args:
+        filename: The path to the file.
+        encoding: "parquet" or "feather".
+        columns: Read only these columns. Defaults to all.
+        filters: Keep only matching rows, as for read_table.
+        chunk_size: The maximum rows per chunk. Defaults to the file's
+            own row groups or batches, capped at pyarrow's batch size.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ValueError: If the encoding is not parquet or feather.
+
+    Returns:
+        An iterator over DataFrames; empty ones are skipped.
+    """
+    kwargs = {} if chunk_size is None else {"batch_size": chunk_size}
+    scanner = _scanner(filename, encoding, columns, filters, **kwargs)
+
+    def _chunks() -> Iterator[pd.DataFrame]:
+        for batch in scanner.to_batches():
+            if batch.num_rows:
+                yield batch.to_pandas()
+    return _chunks()
+
+
+def read_table_preview(
+    filename: str,
+    encoding: str,
+    limit: int,
+) -> tuple[list[str], list[list[Any]]]:
+    """Reads up to limit rows from the first row group or batch only.
+
+    Args:
+        filename: The path to the file.
+        encoding: "parquet" or "feather".
+        limit: The maximum rows returned.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ValueError: If the encoding is not parquet or feather.
+
+    Returns:
+        (column names, rows as lists of values).
+    """
+    _require_arrow(encoding)
+    if encoding == "parquet":
+        parquet = pq.ParquetFile(filename, memory_map=True)
+        names = parquet.schema_arrow.names
+        if parquet.num_row_groups == 0:
+            return names, []
+        table = parquet.read_row_group(0)
+    else:
+        with pa.memory_map(filename) as source:
+            reader = pa.ipc.open_file(source)
+            names = reader.schema.names
+            if reader.num_record_batches == 0:
+                return names, []
+            table = pa.Table.from_batches([reader.get_batch(0)])
+    rows = table.slice(0, limit).to_pylist()
+    return names, [[row[name] for name in names] for row in rows]
+
+
+def count_table_rows(filename: str, encoding: str) -> int:
+    """The number of rows of a Parquet or Feather file, from its metadata.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ValueError: If the encoding is not parquet or feather.
+    """
+    return _dataset(filename, encoding).count_rows()
+
+
+def take_table_rows(
+    filename: str,
+    encoding: str,
+    positions: Sequence[int],
+) -> pd.DataFrame:
+    """Reads only the rows at the given positions of a Parquet/Feather file.
+
+    Args:
+        filename: The path to the file.
+        encoding: "parquet" or "feather".
+        positions: Zero-based row positions.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ValueError: If the encoding is not parquet or feather.
+
+    Returns:
+        The rows, in the order of positions.
+    """
+    table = _dataset(filename, encoding).take(pa.array(positions, pa.int64()))
+    return table.to_pandas()
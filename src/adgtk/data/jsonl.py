@@ -0,0 +1,357 @@
+"""Random access to JSON Lines files through a persisted line-offset index.
+
+The index is a flat array of little-endian uint64 byte offsets, one per
+non-blank line, built in a single vectorised pass over the file. It is
+stored under .tracking/cache/jsonl/ next to a small JSON header recording
+what was indexed:
+
+  - size and mtime_ns of the file when last indexed
+  - indexed_bytes: the end of the last complete (newline terminated) line
+  - digests of the first and last bytes covered, to detect rewrites
+
+A file that only grew by appending keeps its header digests, so only the
+new bytes are scanned and their offsets appended to the index. Anything
+else triggers a rebuild. A final line without a trailing newline is
+found at open time and never persisted, so a later append that completes
+it is indexed correctly.
+
+JsonlReader maps the file and the index with mmap; reading a record
+parses only that line, which makes len(), indexing, slicing, sampling and
+sharded reads cheap regardless of file size.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+from typing import Any, Iterator, Optional, Sequence, Union
+
+import numpy as np
+from pydantic import BaseModel, ValidationError
+
+from adgtk.tracking.store import atomic_write, file_lock
+from adgtk.utils.defaults import CACHE_FOLDER, TRACKING_FOLDER
+
+INDEX_DIR = "jsonl"
+INDEX_VERSION = 1
+OFFSET_DTYPE = np.dtype("<u8")
+# bytes hashed at either end of the indexed region
+_EDGE_BYTES = 64 * 1024
+# bytes scanned per pass when building the index
+_SCAN_BYTES = 64 * 1024 * 1024
+_NEWLINE = ord("\n")
+_WHITESPACE = np.array([ord(c) for c in " \t\r\n"], dtype=np.uint8)
+
+
+# ----------------------------------------------------------------------
+# Models
+# ----------------------------------------------------------------------
+
+
+class LineIndexHeader(BaseModel):
+    """What the persisted offsets of one file cover."""
+    version: int = INDEX_VERSION
+    path: str
+    size: int
+    mtime_ns: int
+    indexed_bytes: int
+    count: int
+    head_digest: str
+    tail_digest: str
+
+
+# ----------------------------------------------------------------------
+# Internal helpers
+# ----------------------------------------------------------------------
+
+
+def _index_folder() -> str:
+    return os.path.join(TRACKING_FOLDER, CACHE_FOLDER, INDEX_DIR)
+
+
+def _index_paths(path: str) -> tuple[str, str]:
+    """Return the (header, offsets) files for a JSONL file."""
+    key = hashlib.blake2b(
+        os.path.abspath(path).encode("utf-8"), digest_size=16).hexdigest()
+    base = os.path.join(_index_folder(), key)
+    return base + ".json", base + ".offsets"
+
+
+def _edge_digests(buf: Union[mmap.mmap, bytes], end: int) -> tuple[str, str]:
+    head = buf[:min(end, _EDGE_BYTES)]
+    tail = buf[max(0, end - _EDGE_BYTES):end]
+    return (hashlib.blake2b(head, digest_size=16).hexdigest(),
+            hashlib.blake2b(tail, digest_size=16).hexdigest())
+
+
+def _scan(
+    buf: Union[mmap.mmap, bytes],
+    start: int,
+    end: int,
+) -> np.ndarray:
+    """Offsets of the non-blank lines starting in [start, end).
+
+    end must be just past a newline (or start), so every line found is
+    complete.
+    """
+    found: list[np.ndarray] = []
+    pos = start
+    while pos < end:
+        stop = min(end, pos + _SCAN_BYTES)
+        if stop < end:
+            # extend to the next newline so no line is split across passes
+            nl = buf.find(b"\n", stop - 1, end)
+            stop = end if nl < 0 else nl + 1
+        chunk = np.frombuffer(buf, dtype=np.uint8, count=stop - pos,
+                              offset=pos)
+        newlines = np.flatnonzero(chunk == _NEWLINE)
+        starts = np.concatenate(([0], newlines[:-1] + 1))
+        lengths = newlines - starts
+        # lines opening with whitespace may be blank; check those exactly
+        maybe_blank = np.flatnonzero(
+            (lengths == 0) | np.isin(chunk[np.minimum(starts, len(chunk) - 1)],
+                                     _WHITESPACE))
+        keep = np.ones(len(starts), dtype=bool)
+        for i in maybe_blank:
+            line = chunk[starts[i]:newlines[i]].tobytes()
+            keep[i] = bool(line.strip())
+        found.append((starts[keep] + pos).astype(OFFSET_DTYPE))
+        pos = stop
+    if not found:
+        return np.empty(0, dtype=OFFSET_DTYPE)
+    return np.concatenate(found)
+
+
+def _load_header(header_path: str) -> Optional[LineIndexHeader]:
+    try:
+        with open(header_path, "rb") as f:
+            header = LineIndexHeader.model_validate_json(f.read())
+    except (OSError, ValidationError):
+        return None
+    return header if header.version == INDEX_VERSION else None
+
+
+def _tail_offset(
+    buf: Union[mmap.mmap, bytes],
+    indexed_bytes: int,
+) -> Optional[int]:
+    """Offset of a final line lacking its newline, if it holds a record."""
+    if indexed_bytes < len(buf) and buf[indexed_bytes:].strip():
+        return indexed_bytes
+    return None
+
+
+# ----------------------------------------------------------------------
+# Index maintenance
+# ----------------------------------------------------------------------
+
+
+def update_line_index(path: str) -> LineIndexHeader:
+    """Bring the persisted line index of a JSONL file up to date.
+
+    Only bytes appended since the last update are scanned when the
+    indexed region is unchanged; otherwise the index is rebuilt.
+
+    Args:
+        path: The JSONL file.
+
+    Returns:
+        The header describing the persisted index.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    header_path, offsets_path = _index_paths(path)
+    with file_lock(header_path):
+        st = os.stat(path)
+        header = _load_header(header_path)
+        if (header is not None and header.size == st.st_size
+                and header.mtime_ns == st.st_mtime_ns
+                and os.path.exists(offsets_path)):
+            return header
+
+        with open(path, "rb") as f:
+            if st.st_size == 0:
+                buf: Union[mmap.mmap, bytes] = b""
+            else:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                return _update_locked(
+                    path, buf, st, header, header_path, offsets_path)
+            finally:
+                if isinstance(buf, mmap.mmap):
+                    buf.close()
+
+
+def _update_locked(
+    path: str,
+    buf: Union[mmap.mmap, bytes],
+    st: os.stat_result,
+    header: Optional[LineIndexHeader],
+    header_path: str,
+    offsets_path: str,
+) -> LineIndexHeader:
+    size = len(buf)
+    end = buf.rfind(b"\n") + 1  # 0 when there is no newline
+    appended = (
+        header is not None
+        and os.path.exists(offsets_path)
+        and header.indexed_bytes <= end
+        and os.path.getsize(offsets_path)
+        == header.count * OFFSET_DTYPE.itemsize
+        and _edge_digests(buf, header.indexed_bytes) == (
+            header.head_digest, header.tail_digest)
+    )
+    if appended:
+        assert header is not None
+        new = _scan(buf, header.indexed_bytes, end)
+        with open(offsets_path, "ab") as f:
+            f.write(new.tobytes())
+        count = header.count + len(new)
+    else:
+        offsets = (_scan(buf, 0, end)
+                   if end else np.empty(0, dtype=OFFSET_DTYPE))
+        tmp_path = f"{offsets_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(offsets.tobytes())
+        os.replace(tmp_path, offsets_path)
+        count = len(offsets)
+
+    head_digest, tail_digest = _edge_digests(buf, end)
+    header = LineIndexHeader(
+        path=os.path.abspath(path),
+        size=size,
+        mtime_ns=st.st_mtime_ns,
+        indexed_bytes=end,
+        count=count,
+        head_digest=head_digest,
+        tail_digest=tail_digest,
+    )
+    atomic_write(header_path, header.model_dump_json())
+    return header
+
+
+# ----------------------------------------------------------------------
+# Reader
+# ----------------------------------------------------------------------
+
+
+class JsonlReader(Sequence):
+    """A JSON Lines file as a read-only sequence of decoded records.
+
+    Use as a context manager, or call close(), to release the maps.
+
+    Example:
+        with JsonlReader("generated.jsonl") as records:
+            print(len(records), records[-1])
+            batch = records[1000:2000]
+            picked = records.sample(100, seed=7)
+    """
+
+    def __init__(self, path: str) -> None:
+        """Indexes the file if needed and maps it.
+
+        Args:
+            path: The JSONL file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        self.path = path
+        self.header = update_line_index(path)
+        _, offsets_path = _index_paths(path)
+
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._buf: Union[mmap.mmap, bytes] = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if size else b"")
+        offsets: np.ndarray = (
+            np.memmap(offsets_path, dtype=OFFSET_DTYPE, mode="r",
+                      shape=(self.header.count,))
+            if self.header.count else np.empty(0, dtype=OFFSET_DTYPE))
+        tail = _tail_offset(self._buf, self.header.indexed_bytes)
+        if tail is not None:
+            offsets = np.append(offsets, np.array([tail], dtype=OFFSET_DTYPE))
+        self.offsets = offsets
+
+    def __enter__(self) -> "JsonlReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Releases the file map and handle."""
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __iter__(self) -> Iterator[Any]:
+        for chunk in self.iter_chunks(1024):
+            yield from chunk
+
+    def _line(self, i: int) -> bytes:
+        start = int(self.offsets[i])
+        end = self._buf.find(b"\n", start)
+        return self._buf[start:end if end >= 0 else len(self._buf)]
+
+    def __getitem__(self, item):  # type: ignore[override]
+        if isinstance(item, slice):
+            return [json.loads(self._line(i))
+                    for i in range(*item.indices(len(self)))]
+        n = len(self)
+        i = item + n if item < 0 else item
+        if not 0 <= i < n:
+            raise IndexError(f"record {item} out of range ({n} records)")
+        return json.loads(self._line(i))
+
+    def take(self, indices: Sequence[int]) -> list:
+        """Returns the records at the given positions, in that order."""
+        return [self[int(i)] for i in indices]
+
+    def sample(self, k: int, seed: Optional[int] = None) -> list:
+        """Returns k distinct records chosen uniformly at random.
+
+        Records are read in file order for locality, then returned in the
+        order they were drawn.
+
+        Args:
+            k: The number of records. Capped at len(self).
+            seed: Seed for a reproducible sample.
+        """
+        rng = np.random.default_rng(seed)
+        picked = rng.choice(len(self), size=min(k, len(self)), replace=False)
+        by_position = {int(i): self[int(i)] for i in np.sort(picked)}
+        return [by_position[int(i)] for i in picked]
+
+    def shard_range(self, worker: int, num_workers: int) -> range:
+        """The contiguous record positions read by one of num_workers.
+
+        Args:
+            worker: The worker number, 0 <= worker < num_workers.
+            num_workers: The number of workers sharing the file.
+        """
+        if not 0 <= worker < num_workers:
+            raise ValueError("worker must be in [0, num_workers)")
+        bounds = np.linspace(0, len(self), num_workers + 1).astype(int)
+        return range(int(bounds[worker]), int(bounds[worker + 1]))
+
+    def iter_chunks(
+        self,
+        chunk_size: int,
+        records: Optional[range] = None,
+    ) -> Iterator[list]:
+        """Yields lists of at most chunk_size records.
+
+        Args:
+            chunk_size: The maximum records per chunk.
+            records: The positions to read, e.g. a shard_range. Defaults
+                to the whole file.
+        """
+        span = records if records is not None else range(len(self))
+        for start in range(span.start, span.stop, chunk_size):
+            yield self[start:min(start + chunk_size, span.stop)]
@@ -0,0 +1,323 @@
+"""Lazy, streaming transform pipelines over datasets.
+
+A Pipeline describes where records come from and the stages applied to
+them; nothing is read until it is iterated or a terminal method runs:
+
+    pipe = (manager.pipeline("generated")
+            .filter(lambda r: r["score"] > 0.5)
+            .remap({"text": "prompt"})
+            .map(tokenize, processes=8)
+            .shuffle(buffer=10_000, seed=1)
+            .take(50_000))
+    file_id = pipe.write_to("prepared.jsonl", file_id="prepared")
+
+Records flow one at a time from the source chunks, so memory stays flat
+whatever the dataset size. Consecutive map, filter and remap stages are
+fused into a single loop. Each stage returns a new Pipeline, so a
+pipeline can be branched and iterated more than once (each iteration
+reads the source again).
+
+map(fn, processes=N) runs fn in a process pool. Records are sent in
+blocks and at most a few blocks per process are in flight, so a slow
+consumer does not make the pool read ahead through the whole source. fn
+must be picklable (a module-level function): workers are started with
+forkserver (spawn where unavailable), since forking a process that
+already runs threads, such as the fingerprint pool, can deadlock.
+"""
+
+import multiprocessing
+import os
+import random
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import pandas as pd
+
+from adgtk.data.columnar import ColumnarDataset
+from adgtk.data.split import SplitWriter
+
+# records per block sent to a worker process
+DEFAULT_BLOCK_SIZE = 256
+# blocks in flight per worker process
+_BLOCKS_PER_WORKER = 2
+
+
+# ----------------------------------------------------------------------
+# Internal helpers
+# ----------------------------------------------------------------------
+
+
+def _records(data: Any) -> Iterator[Any]:
+    """Iterate the records of any load_data result or chunk."""
+    if isinstance(data, pd.DataFrame):
+        yield from data.to_dict(orient="records")
+    elif isinstance(data, ColumnarDataset):
+        yield from data
+    elif isinstance(data, dict):
+        keys = list(data)
+        for values in zip(*(data[k] for k in keys)):
+            yield dict(zip(keys, values))
+    else:
+        yield from data
+
+
+def _fused(it: Iterable[Any], ops: tuple) -> Iterator[Any]:
+    """Apply a run of map/filter/remap ops to each record in one loop."""
+    for item in it:
+        keep = True
+        for kind, fn in ops:
+            if kind == "map":
+                item = fn(item)
+            elif kind == "filter":
+                if not fn(item):
+                    keep = False
+                    break
+            else:
+                item = {fn.get(k, k): v for k, v in item.items()}
+        if keep:
+            yield item
+
+
+def process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """A process pool whose workers are not forked from this process.
+
+    Forking a process that already runs threads (e.g. the fingerprint
+    pool) can deadlock, so workers start with forkserver, or spawn
+    where that is unavailable.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn")
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+
+def _apply_block(fn: Callable[[Any], Any], block: list) -> list:
+    return [fn(item) for item in block]
+
+
+def _process_map(
+    it: Iterable[Any],
+    fn: Callable[[Any], Any],
+    processes: int,
+    block_size: int,
+) -> Iterator[Any]:
+    """Ordered map over a process pool with bounded read-ahead."""
+    limit = processes * _BLOCKS_PER_WORKER
+    pending: deque[Future] = deque()
+    source = iter(it)
+    with process_pool(processes) as pool:
+        while True:
+            while len(pending) < limit:
+                block = list(islice(source, block_size))
+                if not block:
+                    break
+                pending.append(pool.submit(_apply_block, fn, block))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+
+def _buffered_shuffle(
+    it: Iterable[Any],
+    buffer: int,
+    seed: Optional[int],
+) -> Iterator[Any]:
+    """Emit items in random order using a fixed-size buffer."""
+    rng = random.Random(seed)
+    pool: list = []
+    for item in it:
+        if len(pool) < buffer:
+            pool.append(item)
+            continue
+        i = rng.randrange(buffer)
+        yield pool[i]
+        pool[i] = item
+    rng.shuffle(pool)
+    yield from pool
+
+
+def _batches(it: Iterable[Any], size: int) -> Iterator[list]:
+    source = iter(it)
+    while True:
+        batch = list(islice(source, size))
+        if not batch:
+            return
+        yield batch
+
+
+# ----------------------------------------------------------------------
+# Pipeline
+# ----------------------------------------------------------------------
+
+
+class Pipeline:
+    """A lazy chain of record transforms over a streamed source."""
+
+    def __init__(
+        self,
+        source: Callable[[], Iterable[Any]],
+        stages: tuple = (),
+        manager: Optional[Any] = None,
+    ) -> None:
+        """Wraps a source; prefer the from_* constructors.
+
+        Args:
+            source: Called on each iteration; returns the chunks (lists
+                of records or DataFrames) to read.
+            stages: The stages so far, as ("kind", args) tuples.
+            manager: The DatasetManager write_to registers files with.
+        """
+        self._source = source
+        self._stages = stages
+        self._manager = manager
+
+    # ---------------- construction ----------------
+
+    @classmethod
+    def from_chunks(
+        cls,
+        chunks: Callable[[], Iterable[Any]],
+        manager: Optional[Any] = None,
+    ) -> "Pipeline":
+        """A pipeline over chunks, e.g. lambda: manager.iter_file(id)."""
+        return cls(chunks, manager=manager)
+
+    @classmethod
+    def from_data(cls, data: Any) -> "Pipeline":
+        """A pipeline over data already in memory (any load_data result)."""
+        return cls(lambda: [data])
+
+    def _then(self, kind: str, args: Any) -> "Pipeline":
+        return Pipeline(
+            self._source, self._stages + ((kind, args),), self._manager)
+
+    # ---------------- stages ----------------
+
+    def map(
+        self,
+        fn: Callable[[Any], Any],
+        processes: Optional[int] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> "Pipeline":
+        """Apply fn to every record.
+
+        Args:
+            fn: The transform. Must be picklable when processes is set.
+            processes: Run fn in this many worker processes; 0 uses one
+                per CPU. None (the default) runs it in this process.
+            block_size: Records sent to a worker at a time.
+        """
+        if processes is None:
+            return self._then("map", fn)
+        processes = processes or os.cpu_count() or 1
+        return self._then("pmap", (fn, processes, block_size))
+
+    def filter(self, predicate: Callable[[Any], bool]) -> "Pipeline":
+        """Keep only records for which predicate is true."""
+        return self._then("filter", predicate)
+
+    def remap(self, key_map: dict[str, str]) -> "Pipeline":
+        """Rename record keys, as remap_data does, without mutating."""
+        return self._then("remap", dict(key_map))
+
+    def batch(self, size: int) -> "Pipeline":
+        """Group records into lists of up to size; later stages get lists."""
+        if size < 1:
+            raise ValueError("batch size must be positive")
+        return self._then("batch", size)
+
+    def shuffle(self, buffer: int, seed: Optional[int] = None) -> "Pipeline":
+        """Approximately shuffle through a buffer of buffer records.
+
+        Memory holds buffer records; a buffer at least the dataset size
+        gives a full shuffle.
+        """
+        if buffer < 1:
+            raise ValueError("shuffle buffer must be positive")
+        return self._then("shuffle", (buffer, seed))
+
+    def take(self, n: int) -> "Pipeline":
+        """Stop after n records; the source is not read further."""
+        return self._then("take", n)
+
+    # ---------------- execution ----------------
+
+    def __iter__(self) -> Iterator[Any]:
+        it: Iterable[Any] = (
+            record for chunk in self._source() for record in _records(chunk))
+        fused: list = []
+        for kind, args in self._stages:
+            if kind in ("map", "filter", "remap"):
+                fused.append((kind, args))
+                continue
+            if fused:
+                it = _fused(it, tuple(fused))
+                fused = []
+            if kind == "pmap":
+                it = _process_map(it, *args)
+            elif kind == "batch":
+                it = _batches(it, args)
+            elif kind == "shuffle":
+                it = _buffered_shuffle(it, *args)
+            elif kind == "take":
+                it = islice(it, args)
+        if fused:
+            it = _fused(it, tuple(fused))
+        return iter(it)
+
+    def collect(self) -> list:
+        """Run the pipeline and return every record as a list."""
+        return list(self)
+
+    def to_columnar(self) -> ColumnarDataset:
+        """Run the pipeline into a ColumnarDataset (records must be dicts)."""
+        return ColumnarDataset.from_records(self)
+
+    def write_to(
+        self,
+        path: str,
+        encoding: str = "jsonl",
+        file_id: Optional[str] = None,
+        chunk_size: int = 10_000,
+        **register_args: Any,
+    ) -> str:
+        """Run the pipeline into a file and register it.
+
+        Args:
+            path: The output file.
+            encoding: csv, jsonl, parquet or feather. Defaults to jsonl.
+            file_id: The ID to register the file under. Defaults to one
+                assigned by the manager.
+            chunk_size: Records written at a time.
+            register_args: Passed to DatasetManager.register, e.g. tags,
+                use or description.
+
+        Raises:
+            ValueError: If the encoding cannot be written.
+
+        Returns:
+            The registered file ID, or the path when the pipeline has no
+            DatasetManager (see DatasetManager.pipeline).
+        """
+        if encoding not in ("csv", "jsonl", "parquet", "feather"):
+            raise ValueError(f"Unable to write {encoding} files")
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+        with SplitWriter({"out": path}, encoding) as writer:
+            for block in _batches(self, chunk_size):
+                if encoding in ("parquet", "feather"):
+                    writer.write("out", pd.DataFrame(block))
+                else:
+                    writer.write("out", block)
+            if not writer.counts["out"] and encoding in ("parquet", "feather"):
+                # nothing came through; a zero-row table keeps it readable
+                writer.write("out", pd.DataFrame())
+        if not writer.written:
+            # nothing came through; still leave an empty file behind
+            open(path, "w").close()
+        if self._manager is None:
+            return path
+        return self._manager.register(
+            path, encoding, file_id=file_id, **register_args)
@@ -0,0 +1,510 @@
+"""One-pass column statistics for registered datasets.
+
+profile_chunks reads the chunks produced by iter_file once and keeps,
+for every column, a few small sketches instead of the values:
+
+  - count and nulls (None, NaN and empty strings count as missing)
+  - distinct values: a HyperLogLog estimate (about 1.6% error), exact
+    while the column has at most TOPK_CAPACITY distinct values
+  - min, max and mean, exact
+  - quantiles: a KLL-style compactor; rank error around 1%
+  - the most frequent values: Misra-Gries counters, exact while the
+    column has at most TOPK_CAPACITY distinct values and lower bounds
+    after that
+  - for text columns, the same statistics over string lengths plus a
+    histogram with power-of-two bins (0, 1, 2-3, 4-7, ...)
+
+Memory is a few hundred KB per column whatever the file size. CSV
+columns whose every value parses as a number are profiled as numbers.
+
+The resulting DatasetProfile is stored in the file definition's
+extended_metadata under PROFILE_KEY together with the fingerprint digest
+it was computed for, so DatasetManager.profile only reads the file again
+once its content changes.
+"""
+
+import datetime
+import math
+import time
+from typing import Any, Iterable, Literal, Optional
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ValidationError
+
+from adgtk.data.fingerprint import is_current, stored_fingerprint
+from adgtk.data.shards import combined_fingerprint, is_sharded, stored_shards
+from adgtk.data.structure import FileDefinition
+
+# extended_metadata key holding the cached profile
+PROFILE_KEY = "profile"
+# bump when the stored statistics change meaning
+PROFILE_VERSION = 1
+# most frequent values kept in a profile
+DEFAULT_TOP_K = 10
+# values tracked per column by the frequency counters
+TOPK_CAPACITY = 1024
+# quantiles reported, as labels and fractions
+QUANTILES = {"p5": 0.05, "p25": 0.25, "p50": 0.5, "p75": 0.75, "p95": 0.95}
+
+ColumnKinds = Literal["int", "float", "bool", "str", "mixed", "empty"]
+
+_HLL_BITS = 12
+_SKETCH_K = 256
+# longest text kept for a top value
+_MAX_VALUE_CHARS = 120
+_NUMERIC = ("integer", "floating", "mixed-integer-float", "decimal")
+
+
+# ----------------------------------------------------------------------
+# Models
+# ----------------------------------------------------------------------
+
+
+class ColumnProfile(BaseModel):
+    """The statistics of one column."""
+    name: str
+    type: ColumnKinds
+    count: int
+    nulls: int
+    null_rate: float
+    distinct: int
+    distinct_exact: bool
+    # numeric columns
+    min: Optional[float] = None
+    max: Optional[float] = None
+    mean: Optional[float] = None
+    quantiles: Optional[dict[str, float]] = None
+    # text columns
+    length_min: Optional[int] = None
+    length_max: Optional[int] = None
+    length_mean: Optional[float] = None
+    length_quantiles: Optional[dict[str, float]] = None
+    length_histogram: Optional[list[tuple[str, int]]] = None
+    # most frequent values with their counts
+    top: list[tuple[Any, int]] = []
+    top_exact: bool = True
+
+
+class DatasetProfile(BaseModel):
+    """The statistics of a dataset and the content they describe."""
+    digest: str
+    rows: int
+    columns: list[ColumnProfile]
+    profiled_at: str
+    seconds: float
+    version: int = PROFILE_VERSION
+
+
+# ----------------------------------------------------------------------
+# Sketches
+# ----------------------------------------------------------------------
+
+
+class _HyperLogLog:
+    """Distinct count estimate from 64-bit hashes."""
+
+    def __init__(self, p: int = _HLL_BITS) -> None:
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+
+    def add(self, hashes: np.ndarray) -> None:
+        bits = 64 - self.p
+        idx = (hashes >> np.uint64(bits)).astype(np.intp)
+        rest = hashes & np.uint64((1 << bits) - 1)
+        # rank: position of the first 1 bit in the remaining bits
+        rank = np.full(len(hashes), bits + 1, dtype=np.uint8)
+        found = rest > 0
+        rank[found] = bits - np.floor(
+            np.log2(rest[found].astype(np.float64))).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rank)
+
+    def estimate(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(
+            np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # linear counting is more accurate for small cardinalities
+            return int(round(m * math.log(m / zeros)))
+        return int(round(raw))
+
+
+class _QuantileSketch:
+    """A KLL-style sketch: sorted levels, halved when they grow too big.
+
+    Each item at level i stands for 2**i values. The compactions use a
+    fixed seed, so the same data always gives the same quantiles.
+    """
+
+    def __init__(self, k: int = _SKETCH_K) -> None:
+        self.k = k
+        self.levels: list[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(0)
+
+    def add(self, values: np.ndarray) -> None:
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) >= 2 * self.k:
+                items = np.sort(items)
+                held = items[len(items) - len(items) % 2:]
+                start = self._rng.integers(2)
+                promoted = items[start:len(items) - len(held):2]
+                self.levels[level] = held
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate(
+                    [self.levels[level + 1], promoted])
+            level += 1
+
+    def quantiles(self, fractions: Iterable[float]) -> list[float]:
+        items = np.concatenate(self.levels)
+        if not len(items):
+            return []
+        weights = np.concatenate([np.full(len(lv), 2.0 ** i)
+                                  for i, lv in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+        found = np.searchsorted(
+            cumulative, [f * cumulative[-1] for f in fractions])
+        return [float(items[min(i, len(items) - 1)]) for i in found]
+
+
+class _TopK:
+    """Misra-Gries frequent value counters."""
+
+    def __init__(self, capacity: int = TOPK_CAPACITY) -> None:
+        self.capacity = capacity
+        self.counts: dict[Any, int] = {}
+        self.exact = True
+
+    def add(self, values: pd.Series) -> None:
+        counts = self.counts
+        for value, count in values.value_counts(sort=False).items():
+            counts[value] = counts.get(value, 0) + int(count)
+        if len(counts) > self.capacity:
+            cut = sorted(counts.values(), reverse=True)[self.capacity]
+            self.counts = {v: c - cut for v, c in counts.items() if c > cut}
+            self.exact = False
+
+    def top(self, k: int) -> list[tuple[Any, int]]:
+        ranked = sorted(self.counts.items(), key=lambda vc: -vc[1])[:k]
+        return [(_plain(v), c) for v, c in ranked]
+
+
+class _Range:
+    """Exact min, max and mean, plus a quantile sketch."""
+
+    def __init__(self) -> None:
+        self.sketch = _QuantileSketch()
+        self.count = 0
+        self.total = 0.0
+        self.low = math.inf
+        self.high = -math.inf
+
+    def add(self, values: np.ndarray) -> None:
+        if not len(values):
+            return
+        self.sketch.add(values)
+        self.count += len(values)
+        self.total += float(values.sum())
+        self.low = min(self.low, float(values.min()))
+        self.high = max(self.high, float(values.max()))
+
+    def summary(self) -> tuple[float, float, float, dict[str, float]]:
+        found = self.sketch.quantiles(QUANTILES.values())
+        quantiles = dict(zip(QUANTILES, found))
+        return self.low, self.high, self.total / self.count, quantiles
+
+
+# ----------------------------------------------------------------------
+# Internal helpers
+# ----------------------------------------------------------------------
+
+
+def _plain(value: Any) -> Any:
+    """A JSON friendly, bounded form of a value."""
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, str) and len(value) > _MAX_VALUE_CHARS:
+        return value[:_MAX_VALUE_CHARS] + "…"
+    return value
+
+
+def _length_bins(lengths: np.ndarray) -> np.ndarray:
+    """Power-of-two bin of each length: 0, 1, 2-3, 4-7, ..."""
+    bins = np.zeros(len(lengths), dtype=np.intp)
+    positive = lengths > 0
+    bins[positive] = np.floor(
+        np.log2(lengths[positive].astype(np.float64))).astype(np.intp) + 1
+    return bins
+
+
+def _bin_label(idx: int) -> str:
+    if idx < 2:
+        return str(idx)
+    return f"{2 ** (idx - 1)}-{2 ** idx - 1}"
+
+
+def _columns(chunk: Any) -> dict[str, pd.Series]:
+    """The columns of a chunk; records missing a field hold NaN."""
+    if not isinstance(chunk, pd.DataFrame):
+        if chunk and not isinstance(chunk[0], dict):
+            return {"value": pd.Series(chunk, dtype=object)}
+        # typed columns make the numeric paths below vectorised
+        chunk = pd.DataFrame(chunk)
+    return {str(name): chunk[name] for name in chunk.columns}
+
+
+class _Column:
+    """The running statistics of one column.
+
+    Only present values are counted; every other row (including rows
+    from chunks that lack the column) is missing.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.count = 0
+        self.kinds: set[str] = set()
+        self.integral = True
+        # text that has parsed as numbers so far (e.g. CSV)
+        self.numeric_text = True
+        self.hll = _HyperLogLog()
+        self.topk = _TopK()
+        self.values = _Range()
+        self.lengths = _Range()
+        self.histogram = np.zeros(0, dtype=np.int64)
+
+    def add(self, series: pd.Series) -> None:
+        missing = np.array(series.isna(), dtype=bool)
+        if not (pd.api.types.is_numeric_dtype(series)
+                or pd.api.types.is_bool_dtype(series)):
+            values = series.to_numpy(dtype=object)
+            missing[~missing] = values[~missing] == ""
+        present = series[~missing]
+        self.count += len(present)
+        if not len(present):
+            return
+
+        if pd.api.types.is_bool_dtype(present):
+            kind = "boolean"
+        elif pd.api.types.is_numeric_dtype(present):
+            kind = "floating"
+        else:
+            kind = pd.api.types.infer_dtype(present, skipna=False)
+
+        if kind == "boolean":
+            self.kinds.add("bool")
+            hashed = present.to_numpy(dtype=bool)
+        elif kind in _NUMERIC:
+            hashed = present.to_numpy(dtype=np.float64)
+            self._add_numbers(hashed)
+            self.kinds.add("number")
+        elif kind == "string":
+            self._add_text(present)
+            self.kinds.add("str")
+            hashed = present.to_numpy(dtype=object)
+        else:
+            # e.g. nested records, counted by their text form
+            present = present.astype(str)
+            self.kinds.add("mixed")
+            hashed = present.to_numpy(dtype=object)
+
+        self.hll.add(pd.util.hash_array(hashed))
+        self.topk.add(present)
+
+    def _add_numbers(self, numbers: np.ndarray) -> None:
+        numbers = numbers[np.isfinite(numbers)]
+        if self.integral and len(numbers):
+            self.integral = bool(np.all(numbers == np.floor(numbers)))
+        self.values.add(numbers)
+
+    def _add_text(self, present: pd.Series) -> None:
+        lengths = present.str.len().to_numpy(dtype=np.int64)
+        self.lengths.add(lengths.astype(np.float64))
+        counts = np.bincount(_length_bins(lengths))
+        if len(counts) > len(self.histogram):
+            self.histogram = np.pad(
+                self.histogram, (0, len(counts) - len(self.histogram)))
+        self.histogram[:len(counts)] += counts
+        if self.numeric_text:
+            parsed = pd.to_numeric(present, errors="coerce")
+            if parsed.isna().any():
+                self.numeric_text = False
+            else:
+                self._add_numbers(parsed.to_numpy(dtype=np.float64))
+
+    def _kind(self) -> ColumnKinds:
+        if not self.kinds:
+            return "empty"
+        if self.kinds == {"bool"}:
+            return "bool"
+        numeric = self.kinds == {"number"} or (
+            self.numeric_text and self.kinds <= {"number", "str"})
+        if numeric:
+            return "int" if self.integral else "float"
+        if self.kinds == {"str"}:
+            return "str"
+        return "mixed"
+
+    def result(self, rows: int, top_k: int) -> ColumnProfile:
+        kind = self._kind()
+        exact = self.topk.exact
+        top = self.topk.top(top_k)
+        if kind == "int":
+            # missing values turn integer columns into floats
+            top = [(int(v) if isinstance(v, float) else v, c)
+                   for v, c in top]
+        profile = ColumnProfile(
+            name=self.name,
+            type=kind,
+            count=self.count,
+            nulls=rows - self.count,
+            null_rate=(rows - self.count) / rows if rows else 0.0,
+            distinct=len(self.topk.counts) if exact else self.hll.estimate(),
+            distinct_exact=exact,
+            top=top,
+            top_exact=exact,
+        )
+        if kind in ("int", "float") and self.values.count:
+            (profile.min, profile.max, profile.mean,
+             profile.quantiles) = self.values.summary()
+        elif kind == "str" and self.lengths.count:
+            low, high, mean, quantiles = self.lengths.summary()
+            profile.length_min = int(low)
+            profile.length_max = int(high)
+            profile.length_mean = mean
+            profile.length_quantiles = quantiles
+            profile.length_histogram = [
+                (_bin_label(i), int(c))
+                for i, c in enumerate(self.histogram) if c]
+        return profile
+
+
+# ----------------------------------------------------------------------
+# Public API
+# ----------------------------------------------------------------------
+
+
+def profile_chunks(
+    chunks: Iterable[Any],
+    digest: str = "",
+    top_k: int = DEFAULT_TOP_K,
+) -> DatasetProfile:
+    """Profiles every column of a dataset in one pass.
+
+    Args:
+        chunks: Lists of records (dicts, or plain values profiled as the
+            column "value") or DataFrames, e.g. from iter_file.
+        digest: The fingerprint digest of the content being profiled.
+        top_k: The most frequent values kept per column.
+
+    Returns:
+        The profile, with columns in the order they were first seen.
+    """
+    started = time.perf_counter()
+    columns: dict[str, _Column] = {}
+    rows = 0
+    for chunk in chunks:
+        for name, series in _columns(chunk).items():
+            if name not in columns:
+                columns[name] = _Column(name)
+            columns[name].add(series)
+        rows += len(chunk)
+    return DatasetProfile(
+        digest=digest,
+        rows=rows,
+        columns=[c.result(rows, top_k) for c in columns.values()],
+        profiled_at=datetime.datetime.now().isoformat(timespec="seconds"),
+        seconds=round(time.perf_counter() - started, 3),
+    )
+
+
+def stored_profile(file_def: FileDefinition) -> Optional[DatasetProfile]:
+    """Return the profile held in a file definition, if any."""
+    raw = (file_def.extended_metadata or {}).get(PROFILE_KEY)
+    if not isinstance(raw, dict) or raw.get("version") != PROFILE_VERSION:
+        return None
+    try:
+        return DatasetProfile(**raw)
+    except ValidationError:
+        return None
+
+
+def current_profile(file_def: FileDefinition) -> Optional[DatasetProfile]:
+    """The stored profile while it still describes the file.
+
+    Nothing is read: the profile's digest is compared with the stored
+    fingerprint, whose size and mtime must still match the file. For
+    sharded datasets the stored shard fingerprints are used.
+
+    Returns:
+        The profile, or None when there is none or it may be stale.
+    """
+    profile = stored_profile(file_def)
+    if profile is None:
+        return None
+    if is_sharded(file_def):
+        digest = combined_fingerprint(stored_shards(file_def)[1]).digest
+    else:
+        fingerprint = stored_fingerprint(file_def)
+        if fingerprint is None or not is_current(file_def):
+            return None
+        digest = fingerprint.digest
+    return profile if profile.digest == digest else None
+
+
+def with_profile(
+    extended_metadata: Optional[dict],
+    profile: DatasetProfile,
+) -> dict:
+    """Return a copy of extended_metadata holding profile."""
+    meta = dict(extended_metadata or {})
+    meta[PROFILE_KEY] = profile.model_dump(mode="json")
+    return meta
+
+
+def _number(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    if value == int(value) and abs(value) < 1e15:
+        return f"{int(value):,}"
+    return f"{value:,.4g}"
+
+
+def format_profile(profile: DatasetProfile, title: str = "") -> str:
+    """A plain-text table of a profile for terminal reports.
+
+    Args:
+        profile: The profile to show.
+        title: Printed before the row count, e.g. the file ID.
+    """
+    head = f"{title} - " if title else ""
+    lines = [
+        f"{head}{profile.rows:,} rows, profiled {profile.profiled_at} "
+        f"in {profile.seconds:.2f}s",
+        f"    {'Column':<24} | {'Type':<5} | {'Nulls':>6} | "
+        f"{'Distinct':>9} | {'Min / median / max':<30} | Top values",
+    ]
+    for col in profile.columns:
+        distinct = f"{'' if col.distinct_exact else '~'}{col.distinct:,}"
+        if col.quantiles is not None:
+            spread = " / ".join(_number(v) for v in (
+                col.min, col.quantiles["p50"], col.max))
+        elif col.length_quantiles is not None:
+            spread = "len " + " / ".join(_number(v) for v in (
+                col.length_min, col.length_quantiles["p50"],
+                col.length_max))
+        else:
+            spread = "-"
+        top = ", ".join(f"{str(v)[:20]} ({c:,})" for v, c in col.top[:3])
+        lines.append(
+            f"    {col.name[:24]:<24} | {col.type:<5} | "
+            f"{col.null_rate:>6.1%} | {distinct:>9} | {spread[:30]:<30} | "
+            f"{top}")
+    return "\n".join(lines)
@@ -0,0 +1,214 @@
+"""Seeded uniform and stratified sampling without loading a whole file.
+
+Both samplers stream the chunks produced by iter_file and use bottom-k
+sampling: every record gets a uniform random key from a seeded
+generator and the sample is the n records with the smallest keys. That
+is a uniform sample without replacement, taken in one pass with memory
+for n records, and it depends only on the seed and the record order (not
+on the chunk size). Once the sample is full only records whose key
+beats the current n-th smallest are looked at, so most chunks cost one
+vectorised comparison.
+
+Stratified sampling keeps one bottom-k sample per value of a column, so
+each stratum is itself a uniform sample.
+
+Samples are returned in file order, as a list of records or a DataFrame
+like the chunks they came from. When random access is cheaper (JSONL
+files with an offset index, Parquet and Feather files) positions can be
+drawn directly instead; see DatasetManager.sample.
+"""
+
+from typing import Any, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# ----------------------------------------------------------------------
+# Internal helpers
+# ----------------------------------------------------------------------
+
+
+def _take(items: Any, idx: np.ndarray) -> Any:
+    if isinstance(items, pd.DataFrame):
+        return items.iloc[idx]
+    return [items[i] for i in idx]
+
+
+def _concat(left: Any, right: Any) -> Any:
+    if left is None:
+        return right
+    if isinstance(right, pd.DataFrame):
+        return pd.concat([left, right])
+    return left + right
+
+
+class _BottomK:
+    """The k items with the smallest keys offered so far."""
+
+    def __init__(self, k: int) -> None:
+        self.k = k
+        self.keys = np.empty(0)
+        self.positions = np.empty(0, dtype=np.int64)
+        self.items: Any = None
+
+    @property
+    def threshold(self) -> float:
+        """Keys at or above this cannot enter the sample."""
+        if len(self.keys) < self.k:
+            return np.inf
+        return float(self.keys.max())
+
+    def offer(
+        self,
+        keys: np.ndarray,
+        positions: np.ndarray,
+        chunk: Any,
+        idx: np.ndarray,
+    ) -> None:
+        """Offer chunk rows idx, whose keys and positions are given."""
+        keep = keys < self.threshold
+        if not keep.any():
+            return
+        idx = idx[keep]
+        self.keys = np.concatenate([self.keys, keys[keep]])
+        self.positions = np.concatenate([self.positions, positions[keep]])
+        self.items = _concat(self.items, _take(chunk, idx))
+        if len(self.keys) > self.k:
+            best = np.argpartition(self.keys, self.k - 1)[:self.k]
+            self.keys = self.keys[best]
+            self.positions = self.positions[best]
+            self.items = _take(self.items, best)
+
+    def result(self, limit: Optional[int] = None) -> tuple[np.ndarray, Any]:
+        """(positions, items) of the best limit items, in file order."""
+        order = np.argsort(self.keys, kind="stable")[:limit]
+        order = order[np.argsort(self.positions[order], kind="stable")]
+        if self.items is None:
+            return np.empty(0, dtype=np.int64), []
+        return self.positions[order], _take(self.items, order)
+
+
+def _finish(parts: list[tuple[np.ndarray, Any]]) -> Any:
+    """Merge per-stratum results into one sample in file order."""
+    parts = [p for p in parts if len(p[0])]
+    if not parts:
+        return []
+    positions = np.concatenate([p[0] for p in parts])
+    items = parts[0][1]
+    for _, more in parts[1:]:
+        items = _concat(items, more)
+    order = np.argsort(positions, kind="stable")
+    items = _take(items, order)
+    if isinstance(items, pd.DataFrame):
+        return items.reset_index(drop=True)
+    return items
+
+
+def _column_values(chunk: Any, column: str) -> np.ndarray:
+    if isinstance(chunk, pd.DataFrame):
+        return chunk[column].to_numpy()
+    return np.array([row[column] for row in chunk], dtype=object)
+
+
+# ----------------------------------------------------------------------
+# Public API
+# ----------------------------------------------------------------------
+
+
+def reservoir_sample(
+    chunks: Iterable[Any],
+    n: int,
+    seed: Optional[int] = None,
+) -> Any:
+    """Draws n records uniformly without replacement in one pass.
+
+    Args:
+        chunks: Lists of records or DataFrames, e.g. from iter_file.
+        n: The sample size; all records are returned if there are fewer.
+        seed: Seed for a reproducible sample.
+
+    Raises:
+        ValueError: If n is negative.
+
+    Returns:
+        The sampled records in file order, as a list or a DataFrame.
+    """
+    if n < 0:
+        raise ValueError("n must not be negative")
+    rng = np.random.default_rng(seed)
+    sample = _BottomK(n)
+    seen = 0
+    for chunk in chunks:
+        size = len(chunk)
+        keys = rng.random(size)
+        if n:
+            sample.offer(keys, np.arange(seen, seen + size), chunk,
+                         np.arange(size))
+        seen += size
+    return _finish([sample.result()])
+
+
+def stratified_sample(
+    chunks: Iterable[Any],
+    column: str,
+    n: int,
+    seed: Optional[int] = None,
+    per_stratum: bool = True,
+) -> Any:
+    """Draws a uniform sample within each value of a column in one pass.
+
+    Args:
+        chunks: Lists of records or DataFrames, e.g. from iter_file.
+        column: The field whose values define the strata.
+        n: Records per stratum, or in total when per_stratum is False.
+        seed: Seed for a reproducible sample.
+        per_stratum: Take n records from every stratum (or all of a
+            smaller one). When False, n records in total are shared
+            between strata in proportion to their sizes.
+
+    Raises:
+        ValueError: If n is negative.
+        KeyError: If a record lacks the column.
+
+    Returns:
+        The sampled records in file order, as a list or a DataFrame.
+    """
+    if n < 0:
+        raise ValueError("n must not be negative")
+    rng = np.random.default_rng(seed)
+    strata: dict[Any, _BottomK] = {}
+    sizes: dict[Any, int] = {}
+    seen = 0
+    for chunk in chunks:
+        size = len(chunk)
+        keys = rng.random(size)
+        positions = np.arange(seen, seen + size)
+        codes, values = pd.factorize(
+            pd.Series(_column_values(chunk, column)), use_na_sentinel=False)
+        for code, value in enumerate(values):
+            idx = np.flatnonzero(codes == code)
+            sizes[value] = sizes.get(value, 0) + len(idx)
+            if n:
+                stratum = strata.setdefault(value, _BottomK(n))
+                stratum.offer(keys[idx], positions[idx], chunk, idx)
+        seen += size
+
+    if per_stratum:
+        return _finish([s.result() for s in strata.values()])
+    return _finish([strata[v].result(limit)
+                    for v, limit in _allocate(sizes, n).items() if limit])
+
+
+def _allocate(sizes: dict[Any, int], n: int) -> dict[Any, int]:
+    """Share n between strata in proportion to size (largest remainder)."""
+    total = sum(sizes.values())
+    if total <= n:
+        return dict(sizes)
+    exact = {v: n * s / total for v, s in sizes.items()}
+    shares = {v: int(e) for v, e in exact.items()}
+    left = n - sum(shares.values())
+    for v in sorted(exact, key=lambda v: exact[v] - shares[v],
+                    reverse=True)[:left]:
+        shares[v] += 1
+    return shares
@@ -0,0 +1,372 @@
+"""Datasets written as many shard files and registered as one entry.
+
+A sharded dataset is a single inventory entry whose path and filename
+name the folder holding the shards. extended_metadata[SHARDS_KEY]
+records the glob pattern the shards match and, for every shard, its
+name relative to that folder with its fingerprint:
+
+    {"pattern": "part-*.jsonl",
+     "files": [{"filename": "part-00000.jsonl", "digest": "...",
+                "size": 1048576, "mtime_ns": ...}, ...]}
+
+Shards share the entry's encoding and are read with the single-file
+loaders through the FileDefinitions built by shard_definitions. Each
+one carries its shard's fingerprint, so the parsed-dataset cache does
+not hash the shard again. Shards are listed in natural order
+(part-2 before part-10).
+
+load_shards reads shards in parallel on a thread pool, or on a process
+pool for parsers that hold the GIL (csv, json), and joins the results.
+iter_shards streams the chunks of each shard in order while the next
+few shards are read in the background. select_shards gives worker i of
+N the shards i::N, so N workers read disjoint parts of a dataset.
+"""
+
+import glob
+import json
+import os
+import re
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+import pandas as pd
+from pydantic import ValidationError
+
+from adgtk.data.fingerprint import (
+    FINGERPRINT_KEY,
+    Fingerprint,
+    submit_path,
+)
+from adgtk.data.pipeline import process_pool
+from adgtk.data.structure import FileDefinition
+from adgtk.utils.file import content_hash
+
+T = TypeVar("T")
+
+# extended_metadata key holding the pattern and shard list
+SHARDS_KEY = "shards"
+# shards read at once when max_workers is not given
+MAX_SHARD_WORKERS = min(8, os.cpu_count() or 1)
+
+_MAGIC = re.compile(r"[*?\[]")
+
+
+# ----------------------------------------------------------------------
+# Models
+# ----------------------------------------------------------------------
+
+
+class Shard(Fingerprint):
+    """One shard: its name under the dataset folder and its fingerprint."""
+    filename: str
+
+
+# ----------------------------------------------------------------------
+# Internal helpers
+# ----------------------------------------------------------------------
+
+
+def _natural_key(name: str) -> list:
+    return [int(part) if part.isdigit() else part
+            for part in re.split(r"(\d+)", name)]
+
+
+def _match(folder: str, pattern: str) -> list[str]:
+    """Names of the files under folder matching pattern, in natural order."""
+    found = glob.glob(os.path.join(folder, pattern), recursive=True)
+    names = [os.path.relpath(path, folder) for path in found
+             if os.path.isfile(path)]
+    return sorted(names, key=_natural_key)
+
+
+def _load_one(file_def: FileDefinition, use_cache: bool) -> Any:
+    from adgtk.data.utils import load_data_from_file
+    return load_data_from_file(file_def, use_cache=use_cache)
+
+
+def _read_chunks(file_def: FileDefinition, chunk_size: int) -> list:
+    from adgtk.data.utils import iter_data_from_file
+    return list(iter_data_from_file(file_def, chunk_size=chunk_size))
+
+
+def _executor(max_workers: Optional[int], processes: bool) -> Executor:
+    workers = max_workers or MAX_SHARD_WORKERS
+    if processes:
+        return process_pool(workers)
+    return ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="adgtk-shards")
+
+
+def _ordered(
+    pool: Executor,
+    fn: Callable[[T], Any],
+    items: Iterable[T],
+    window: int,
+) -> Iterator[Any]:
+    """Results of fn in item order, with at most window calls in flight."""
+    pending: deque[Future] = deque()
+    source = iter(items)
+    while True:
+        for item in source:
+            pending.append(pool.submit(fn, item))
+            if len(pending) >= window:
+                break
+        if not pending:
+            return
+        yield pending.popleft().result()
+
+
+def _combine(parts: list) -> Any:
+    """Join per-shard results: lists are concatenated, as are DataFrames."""
+    if all(isinstance(p, pd.DataFrame) for p in parts) and parts:
+        return pd.concat(parts, ignore_index=True)
+    if all(isinstance(p, list) for p in parts):
+        combined: list = []
+        for part in parts:
+            combined.extend(part)
+        return combined
+    raise ValueError(
+        "Only shards that load as lists or DataFrames can be combined")
+
+
+# ----------------------------------------------------------------------
+# Public API
+# ----------------------------------------------------------------------
+
+
+def split_source(source: str) -> tuple[str, str]:
+    """Splits a folder or glob into (folder, pattern).
+
+    A folder selects every file in it ("*"). In a glob, the leading
+    path components without wildcards form the folder, so
+    "data/gen/**/part-*.jsonl" gives ("data/gen", "**/part-*.jsonl").
+
+    Raises:
+        ValueError: If source is neither a folder nor a glob.
+    """
+    source = os.path.abspath(source)
+    if os.path.isdir(source):
+        return source, "*"
+    parts = source.split(os.sep)
+    for idx, part in enumerate(parts):
+        if _MAGIC.search(part):
+            return os.sep.join(parts[:idx]) or os.sep, os.sep.join(parts[idx:])
+    raise ValueError(f"{source} is neither a folder nor a glob pattern")
+
+
+def scan_shards(
+    folder: str,
+    pattern: str,
+    previous: Optional[Sequence[Shard]] = None,
+) -> list[Shard]:
+    """Finds and fingerprints the shards matching pattern, in parallel.
+
+    Args:
+        folder: The dataset folder.
+        pattern: A glob relative to folder; "**" matches sub-folders.
+        previous: Shards from an earlier scan. Their fingerprints are
+            reused while the shard's size and mtime are unchanged.
+
+    Raises:
+        FileNotFoundError: If no file matches.
+
+    Returns:
+        The shards in natural order of their names.
+    """
+    names = _match(folder, pattern)
+    if not names:
+        raise FileNotFoundError(
+            f"No shards match {os.path.join(folder, pattern)}")
+    known = {s.filename: s for s in previous or []}
+    futures = [submit_path(os.path.join(folder, name), known.get(name))
+               for name in names]
+    shards = []
+    for name, future in zip(names, futures):
+        # an unchanged shard comes back as its previous Shard
+        fp = future.result()
+        shards.append(Shard(filename=name, digest=fp.digest, size=fp.size,
+                            mtime_ns=fp.mtime_ns))
+    return shards
+
+
+def shards_metadata(
+    pattern: str,
+    shards: Sequence[Shard],
+    extended_metadata: Optional[dict] = None,
+) -> dict:
+    """Returns a copy of extended_metadata recording pattern and shards."""
+    meta = dict(extended_metadata or {})
+    meta[SHARDS_KEY] = {
+        "pattern": pattern,
+        "files": [s.model_dump() for s in shards],
+    }
+    return meta
+
+
+def is_sharded(file_def: FileDefinition) -> bool:
+    """True when the definition describes a sharded dataset."""
+    return SHARDS_KEY in (file_def.extended_metadata or {})
+
+
+def stored_shards(file_def: FileDefinition) -> tuple[str, list[Shard]]:
+    """The pattern and shards recorded in a sharded dataset's definition.
+
+    Raises:
+        ValueError: If the definition is not a valid sharded dataset.
+    """
+    raw = (file_def.extended_metadata or {}).get(SHARDS_KEY)
+    if not isinstance(raw, dict):
+        raise ValueError(f"{file_def.file_id} is not a sharded dataset")
+    try:
+        return raw["pattern"], [Shard(**s) for s in raw["files"]]
+    except (KeyError, TypeError, ValidationError) as e:
+        raise ValueError(
+            f"Invalid shard list for {file_def.file_id}") from e
+
+
+def select_shards(
+    items: Sequence[T],
+    worker: int,
+    num_workers: int,
+) -> list[T]:
+    """The items read by worker of num_workers: items[worker::num_workers].
+
+    Raises:
+        ValueError: If worker is not in [0, num_workers).
+    """
+    if not 0 <= worker < num_workers:
+        raise ValueError("worker must be in [0, num_workers)")
+    return list(items[worker::num_workers])
+
+
+def shard_definitions(
+    file_def: FileDefinition,
+    worker: int = 0,
+    num_workers: int = 1,
+) -> list[FileDefinition]:
+    """One FileDefinition per shard of a sharded dataset.
+
+    Each shard is given the ID <file_id>/<shard name>, the dataset's
+    encoding and other extended_metadata (e.g. hf_mode), and its stored
+    fingerprint.
+
+    Args:
+        file_def: The sharded dataset.
+        worker: Return only this worker's shards; see select_shards.
+        num_workers: The number of workers sharing the dataset.
+
+    Raises:
+        ValueError: If file_def is not a sharded dataset or worker is out
+            of range.
+    """
+    _, shards = stored_shards(file_def)
+    folder = os.path.join(file_def.path, file_def.filename)
+    shared = {k: v for k, v in (file_def.extended_metadata or {}).items()
+              if k not in (SHARDS_KEY, FINGERPRINT_KEY)}
+    definitions = []
+    for shard in select_shards(shards, worker, num_workers):
+        meta = dict(shared)
+        meta[FINGERPRINT_KEY] = Fingerprint(
+            digest=shard.digest, size=shard.size,
+            mtime_ns=shard.mtime_ns).model_dump()
+        path, filename = os.path.split(os.path.join(folder, shard.filename))
+        definitions.append(FileDefinition(
+            file_id=f"{file_def.file_id}/{shard.filename}",
+            filename=filename,
+            path=path,
+            encoding=file_def.encoding,
+            extended_metadata=meta,
+        ))
+    return definitions
+
+
+def combined_fingerprint(shards: Sequence[Shard]) -> Fingerprint:
+    """One fingerprint for a whole sharded dataset.
+
+    The digest covers every shard's name and digest; size is the total
+    and mtime_ns the newest shard's.
+    """
+    payload = json.dumps([[s.filename, s.digest] for s in shards])
+    return Fingerprint(
+        digest=content_hash(payload.encode("utf-8")),
+        size=sum(s.size for s in shards),
+        mtime_ns=max((s.mtime_ns for s in shards), default=0),
+    )
+
+
+def load_shards(
+    file_defs: Sequence[FileDefinition],
+    max_workers: Optional[int] = None,
+    processes: bool = False,
+    use_cache: bool = True,
+) -> Any:
+    """Loads shards in parallel and joins them in order.
+
+    Args:
+        file_defs: The shards, e.g. from shard_definitions.
+        max_workers: Shards loaded at once. Defaults to
+            MAX_SHARD_WORKERS.
+        processes: Load in worker processes rather than threads. Faster
+            for csv and json parsing, which holds the GIL, at the cost of
+            sending every record back to this process.
+        use_cache: Use the parsed-dataset cache for each shard.
+
+    Raises:
+        ValueError: If the shards do not all load as lists or as
+            DataFrames.
+
+    Returns:
+        The records of every shard: a list, or a DataFrame.
+    """
+    load = partial(_load_one, use_cache=use_cache)
+    if len(file_defs) <= 1 or (max_workers == 1 and not processes):
+        return _combine([load(fd) for fd in file_defs])
+    with _executor(max_workers, processes) as pool:
+        return _combine(list(pool.map(load, file_defs)))
+
+
+def iter_shards(
+    file_defs: Sequence[FileDefinition],
+    chunk_size: int,
+    max_workers: Optional[int] = None,
+    processes: bool = False,
+) -> Iterator[Any]:
+    """Streams the chunks of each shard, reading shards ahead in parallel.
+
+    Shards are yielded in order. While one is consumed, up to
+    max_workers further shards are read in the background, so memory
+    holds about max_workers + 1 shards.
+
+    Args:
+        file_defs: The shards, e.g. from shard_definitions.
+        chunk_size: The maximum records per chunk.
+        max_workers: Shards read at once. Defaults to MAX_SHARD_WORKERS.
+        processes: Read in worker processes rather than threads.
+
+    Raises:
+        ValueError: If chunk_size is not positive.
+
+    Returns:
+        An iterator over the chunks iter_data_from_file yields for each
+        shard.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    read = partial(_read_chunks, chunk_size=chunk_size)
+    window = (max_workers or MAX_SHARD_WORKERS) + 1
+
+    def _chunks() -> Iterator[Any]:
+        with _executor(max_workers, processes) as pool:
+            for chunks in _ordered(pool, read, file_defs, window):
+                yield from chunks
+    return _chunks()
@@ -0,0 +1,395 @@
+"""Deterministic, streaming train/test/validate splits.
+
+Each record is assigned to a split by hashing the value of a key field
+(or the whole record when no key is given) together with a seed:
+
+    bucket = blake2b(f"{seed}:{value}") / 2**64      in [0, 1)
+
+and walking the cumulative split ratios. The assignment depends only on
+the seed, the ratios and the record itself, so it is reproducible across
+machines, Python processes (no PYTHONHASHSEED) and file formats: the
+key value 7 read from a CSV file ("7") or a Parquet file (7) lands in the
+same split. Nothing is shuffled and only one chunk is in memory at a
+time, so files larger than memory can be split.
+
+SplitWriter writes the records of each split to its own file in one
+pass, in the source file's format family (see OUTPUT_FORMATS).
+"""
+
+import csv
+import hashlib
+import json
+import math
+import os
+from typing import Any, Iterable, Iterator, Optional
+
+import pandas as pd
+
+# the default train/test/validate proportions
+DEFAULT_RATIOS = {"train": 0.8, "test": 0.1, "validate": 0.1}
+# extended_metadata key recording how a split file was produced
+SPLIT_KEY = "split"
+# source encoding -> (encoding, extension) of the written split files
+OUTPUT_FORMATS = {
+    "csv": ("csv", ".csv"),
+    "jsonl": ("jsonl", ".jsonl"),
+    "hf-json": ("hf-json", ".jsonl"),
+    "pandas": ("pandas", ".csv"),
+    "parquet": ("parquet", ".parquet"),
+    "feather": ("feather", ".feather"),
+}
+_SCALE = float(2 ** 64)
+
+
+# ----------------------------------------------------------------------
+# Internal helpers
+# ----------------------------------------------------------------------
+
+
+def _canonical(value: Any) -> str:
+    """A text form of value that is the same whichever format it came from."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and math.isnan(value):
+        return ""
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, sort_keys=True, default=str)
+    if hasattr(value, "item"):
+        # numpy scalars from DataFrame chunks
+        value = value.item()
+        if isinstance(value, float) and math.isnan(value):
+            return ""
+    return str(value)
+
+
+# ----------------------------------------------------------------------
+# Assignment
+# ----------------------------------------------------------------------
+
+
+class SplitAssigner:
+    """Maps records to split names by hashing a key with a seed.
+
+    Example:
+        assign = SplitAssigner(key="id", seed=7)
+        assign.split_of({"id": 42, "text": "..."})     # "train"
+    """
+
+    def __init__(
+        self,
+        key: Optional[str] = None,
+        ratios: Optional[dict[str, float]] = None,
+        seed: int = 0,
+    ) -> None:
+        """Validates the ratios.
+
+        Args:
+            key: The record field to hash. None hashes the whole record,
+                which is slower and only stable for identical records.
+            ratios: Split name to proportion; must sum to 1. Defaults to
+                DEFAULT_RATIOS.
+            seed: Changes the assignment while keeping it reproducible.
+
+        Raises:
+            ValueError: If the ratios are empty, negative or do not sum
+                to 1.
+        """
+        ratios = dict(DEFAULT_RATIOS if ratios is None else ratios)
+        if not ratios or any(r < 0 for r in ratios.values()):
+            raise ValueError("Split ratios must be non-negative")
+        if not math.isclose(sum(ratios.values()), 1.0, abs_tol=1e-9):
+            raise ValueError("Split ratios must sum to 1")
+        self.key = key
+        self.ratios = ratios
+        self.seed = seed
+        self._names = list(ratios)
+        bounds = []
+        total = 0.0
+        for name in self._names:
+            total += ratios[name]
+            bounds.append(total)
+        bounds[-1] = 1.0
+        self._bounds = bounds
+        self._prefix = f"{seed}:".encode("utf-8")
+
+    def split_of_value(self, value: Any) -> str:
+        """The split a key value belongs to."""
+        digest = hashlib.blake2b(
+            self._prefix + _canonical(value).encode("utf-8"),
+            digest_size=8).digest()
+        bucket = int.from_bytes(digest, "big") / _SCALE
+        for name, bound in zip(self._names, self._bounds):
+            if bucket < bound:
+                return name
+        return self._names[-1]
+
+    def split_of(self, record: Any) -> str:
+        """The split a record belongs to.
+
+        Raises:
+            KeyError: If the record lacks the key field.
+        """
+        if self.key is None:
+            return self.split_of_value(
+                json.dumps(record, sort_keys=True, default=str))
+        return self.split_of_value(record[self.key])
+
+    def assign(self, chunk: Any) -> Iterator[tuple[str, Any]]:
+        """Splits one chunk into per-split sub-chunks.
+
+        Args:
+            chunk: A list of records or a DataFrame.
+
+        Returns:
+            (split name, sub-chunk) pairs for the non-empty splits, in
+            ratio order. Records keep their order within a split.
+        """
+        if isinstance(chunk, pd.DataFrame):
+            if self.key is None:
+                labels = [self.split_of(r)
+                          for r in chunk.to_dict(orient="records")]
+            else:
+                labels = [self.split_of_value(v) for v in chunk[self.key]]
+            marks = pd.Series(labels, index=chunk.index)
+            for name in self._names:
+                part = chunk[marks == name]
+                if len(part):
+                    yield name, part
+            return
+
+        grouped: dict[str, list] = {name: [] for name in self._names}
+        for record in chunk:
+            grouped[self.split_of(record)].append(record)
+        for name in self._names:
+            if grouped[name]:
+                yield name, grouped[name]
+
+    def iter_split(
+        self,
+        chunks: Iterable[Any],
+        split: str,
+    ) -> Iterator[Any]:
+        """Streams only the records of one split.
+
+        Args:
+            chunks: Lists of records or DataFrames, e.g. from iter_file.
+            split: The split to keep.
+
+        Raises:
+            ValueError: If split is not one of the ratio names.
+
+        Returns:
+            An iterator over the non-empty sub-chunks of that split.
+        """
+        if split not in self.ratios:
+            raise ValueError(f"Unknown split {split}")
+
+        def _chunks() -> Iterator[Any]:
+            for chunk in chunks:
+                for name, part in self.assign(chunk):
+                    if name == split:
+                        yield part
+        return _chunks()
+
+
+# ----------------------------------------------------------------------
+# Writing
+# ----------------------------------------------------------------------
+
+
+def _conform(table: Any, schema: Any) -> Any:
+    """Casts a pyarrow table to schema, adding missing columns as nulls."""
+    import pyarrow as pa
+
+    arrays = []
+    for field in schema:
+        if field.name in table.column_names:
+            arrays.append(table.column(field.name).cast(field.type))
+        else:
+            arrays.append(pa.nulls(table.num_rows, field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+class SplitWriter:
+    """Writes the sub-chunks of each split to its own file.
+
+    Files are written under temporary names and renamed into place by
+    close(); abort() removes them instead. Use as a context manager to
+    get that behaviour on success and on error.
+
+    Later sub-chunks may add fields or widen types (a column that was all
+    None, or int then float). The file is then rewritten once with the
+    wider columns (and the csv header); earlier rows get empty values.
+    """
+
+    def __init__(self, paths: dict[str, str], encoding: str) -> None:
+        """Prepares one output per split; files open on first write.
+
+        Args:
+            paths: Split name to the final output path.
+            encoding: The output encoding (a value of OUTPUT_FORMATS).
+        """
+        self.paths = paths
+        self.encoding = encoding
+        self.counts: dict[str, int] = {name: 0 for name in paths}
+        # split name -> path, filled by close()
+        self.written: dict[str, str] = {}
+        self._outputs: dict[str, Any] = {}
+        # split name -> csv header, or pyarrow schema for tables
+        self._columns: dict[str, list] = {}
+        self._schemas: dict[str, Any] = {}
+
+    def __enter__(self) -> "SplitWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _tmp(self, name: str) -> str:
+        return f"{self.paths[name]}.{os.getpid()}.tmp"
+
+    def write(self, name: str, part: Any) -> None:
+        """Appends a sub-chunk (list of records or DataFrame) to a split."""
+        if self.encoding in ("parquet", "feather"):
+            self._write_table(name, part)
+        elif isinstance(part, pd.DataFrame):
+            first = name not in self._outputs
+            if first:
+                self._outputs[name] = open(
+                    self._tmp(name), "w", newline="", encoding="utf-8")
+            part.to_csv(self._outputs[name], header=first, index=False)
+        elif self.encoding == "csv":
+            self._write_csv(name, part)
+        else:
+            if name not in self._outputs:
+                self._outputs[name] = open(
+                    self._tmp(name), "w", encoding="utf-8")
+            out = self._outputs[name]
+            for record in part:
+                out.write(json.dumps(record))
+                out.write("\n")
+        self.counts[name] += len(part)
+
+    def _write_csv(self, name: str, part: list) -> None:
+        fields = self._columns.get(name, [])
+        seen = set(fields)
+        added = [k for k in dict.fromkeys(k for r in part for k in r)
+                 if k not in seen]
+        if name in self._outputs:
+            if added:
+                self._widen_csv(name, fields + added)
+        else:
+            self._columns[name] = fields + added
+            self._open_csv(name, "w", header=True)
+        self._outputs[name][1].writerows(part)
+
+    def _open_csv(self, name: str, mode: str, header: bool) -> None:
+        out = open(self._tmp(name), mode, newline="", encoding="utf-8")
+        writer = csv.DictWriter(
+            out, fieldnames=self._columns[name], restval="")
+        if header:
+            writer.writeheader()
+        self._outputs[name] = (out, writer)
+
+    def _widen_csv(self, name: str, fields: list) -> None:
+        """Rewrites a split's csv under a header with more columns."""
+        self._outputs.pop(name)[0].close()
+        tmp = self._tmp(name)
+        old = f"{tmp}.old"
+        os.replace(tmp, old)
+        pad = [""] * (len(fields) - len(self._columns[name]))
+        with open(old, newline="", encoding="utf-8") as src, \
+                open(tmp, "w", newline="", encoding="utf-8") as dst:
+            rows = csv.reader(src)
+            next(rows, None)
+            out = csv.writer(dst)
+            out.writerow(fields)
+            for row in rows:
+                out.writerow(row + pad)
+        os.remove(old)
+        self._columns[name] = fields
+        self._open_csv(name, "a", header=False)
+
+    def _write_table(self, name: str, part: pd.DataFrame) -> None:
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(part, preserve_index=False)
+        schema = self._schemas.get(name)
+        if schema is None:
+            self._open_table(name, table.schema)
+        else:
+            try:
+                wider = pa.unify_schemas(
+                    [schema, table.schema], promote_options="permissive")
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                raise ValueError(
+                    f"Column types of the {name} split conflict: {e}") from e
+            if not wider.equals(schema):
+                self._widen_table(name, wider)
+            table = _conform(table, wider)
+        self._outputs[name].write_table(table)
+
+    def _open_table(self, name: str, schema: Any) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self.encoding == "parquet":
+            self._outputs[name] = pq.ParquetWriter(self._tmp(name), schema)
+        else:
+            self._outputs[name] = pa.ipc.new_file(self._tmp(name), schema)
+        self._schemas[name] = schema
+
+    def _widen_table(self, name: str, schema: Any) -> None:
+        """Rewrites a split's table file with a wider schema."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._outputs.pop(name).close()
+        tmp = self._tmp(name)
+        old = f"{tmp}.old"
+        os.replace(tmp, old)
+        self._open_table(name, schema)
+        writer = self._outputs[name]
+        if self.encoding == "parquet":
+            for batch in pq.ParquetFile(old).iter_batches():
+                writer.write_table(
+                    _conform(pa.Table.from_batches([batch]), schema))
+        else:
+            with pa.memory_map(old) as source:
+                reader = pa.ipc.open_file(source)
+                for i in range(reader.num_record_batches):
+                    writer.write_table(_conform(
+                        pa.Table.from_batches([reader.get_batch(i)]),
+                        schema))
+        os.remove(old)
+
+    def _close_outputs(self) -> None:
+        for output in self._outputs.values():
+            if isinstance(output, tuple):
+                output = output[0]
+            output.close()
+
+    def close(self) -> dict[str, str]:
+        """Finishes every file that received records.
+
+        Returns:
+            Split name to output path, for the splits that were written.
+        """
+        self._close_outputs()
+        for name in self._outputs:
+            os.replace(self._tmp(name), self.paths[name])
+            self.written[name] = self.paths[name]
+        self._outputs = {}
+        return dict(self.written)
+
+    def abort(self) -> None:
+        """Discards everything written so far."""
+        self._close_outputs()
+        for name in self.paths:
+            for path in (self._tmp(name), f"{self._tmp(name)}.old"):
+                if os.path.exists(path):
+                    os.remove(path)
+        self._outputs = {}
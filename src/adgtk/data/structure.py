@@ -23,6 +23,7 @@ OrientationTypes = Literal[
      "list_contains_dict",
      "list_contains_string",
      "pandas",
+     "columnar",
      "other"]
 
 # what structure will be found on load? helps inform how to load.
@@ -30,8 +31,11 @@ FileEncodingTypes = Literal[
     "csv",
     "hf-json",
     "json",
+    "jsonl",
     "pickle",
     "pandas",
+    "parquet",
+    "feather",
     "text",
 ]
 
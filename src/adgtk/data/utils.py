@@ -7,22 +7,53 @@ import json
 import os
 import pickle
 import random
-from typing import cast, Any, Iterable, Optional, Union
+from itertools import islice
+from typing import cast, Any, Iterable, Iterator, Literal, Optional, Union
 from datasets import load_dataset
 import pandas as pd
 from pydantic import ValidationError
+from adgtk.data.cache import load_cached
+from adgtk.data.columnar import ColumnarDataset
+from adgtk.data.ingest import (
+    TABULAR_ENCODINGS,
+    iter_table,
+    read_csv_columns,
+    read_table,
+)
+from adgtk.data.shards import (
+    is_sharded,
+    iter_shards,
+    load_shards,
+    shard_definitions,
+)
 from adgtk.data.structure import (
     OrientationTypes,
     FileDataDefinition,
     FileDefinition,
     InMemoryDataDefinition
 )
+from adgtk.utils.defaults import CACHE_FOLDER, TRACKING_FOLDER
+from adgtk.utils.file import load_data_from_csv_file
 
 # ----------------------------------------------------------------------
 # Constants and types
 # ----------------------------------------------------------------------
 
-ReturnDataTypes = Union[dict, list, pd.DataFrame, None]
+ReturnDataTypes = Union[dict, list, pd.DataFrame, ColumnarDataset, None]
+ChunkTypes = Union[list, pd.DataFrame]
+
+# records per chunk when streaming a file
+DEFAULT_CHUNK_SIZE = 10_000
+# encodings iter_data_from_file can stream
+STREAMABLE_ENCODINGS = (
+    "csv", "jsonl", "pandas", "hf-json", "parquet", "feather")
+
+# how hf-json files load; set per file in extended_metadata[HF_MODE_KEY]
+HfModeTypes = Literal["dataset_dict", "memory_map", "streaming"]
+HF_MODES: tuple[str, ...] = ("dataset_dict", "memory_map", "streaming")
+HF_MODE_KEY = "hf_mode"
+# the project's datasets cache, under .tracking/cache/
+HF_CACHE_DIR = "hf"
 
 # ----------------------------------------------------------------------
 # Inspection Functions
@@ -58,6 +89,8 @@ def inspect_current_orientation(data: ReturnDataTypes) -> OrientationTypes:
     found_orientation = "other"
     if isinstance(data, pd.DataFrame):
         found_orientation = "pandas"
+    elif isinstance(data, ColumnarDataset):
+        found_orientation = "columnar"
     elif isinstance(data, list):
         if isinstance(data[0], dict):
             found_orientation = "list_contains_dict"
@@ -78,39 +111,188 @@ def inspect_current_orientation(data: ReturnDataTypes) -> OrientationTypes:
 # Loading Functions
 # ----------------------------------------------------------------------
 
-def load_data_from_csv_file(filename: str) -> list:
-    """Loads a CSV file into a list of dictionaries.
+def load_data_from_jsonl_file(filename: str) -> list:
+    """Loads a JSON Lines file into a list of records.
 
     Args:
-        filename: The path to the CSV file.
+        filename: The path to the JSONL file.
 
     Returns:
-        A list of dictionaries representing the CSV rows.
+        A list with one decoded value per non-blank line.
     """
-    columns: list[str] = []
-    records: list[dict] = []
+    records: list = []
+    for chunk in _iter_jsonl(filename, DEFAULT_CHUNK_SIZE):
+        records.extend(chunk)
+    return records
 
-    with open(filename, "r") as infile:
+
+def _batched(records: Iterable, chunk_size: int) -> Iterator[list]:
+    """Groups an iterable into lists of at most chunk_size items."""
+    it = iter(records)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _iter_csv(filename: str, chunk_size: int) -> Iterator[list[dict]]:
+    """Streams a CSV file as lists of row dicts, as load_data_from_csv_file.
+    """
+    with open(filename, "r", newline="", encoding="utf-8") as infile:
         csv_reader = csv.reader(infile)
-        for row in csv_reader:
-            # we are on the first row when len == 0
-            if len(columns) == 0:
-                columns = row
-            else:
-                data: dict[Any, Any] = {}
-                for idx, col in enumerate(columns):
-                    data[col] = row[idx]
-                records.append(data)
-    return records
+        columns = next(csv_reader, None)
+        if columns is None:
+            return
+        rows = (dict(zip(columns, row)) for row in csv_reader if row)
+        yield from _batched(rows, chunk_size)
+
+
+def _iter_jsonl(filename: str, chunk_size: int) -> Iterator[list]:
+    """Streams a JSON Lines file as lists of decoded records."""
+    with open(filename, "r", encoding="utf-8") as infile:
+        def _records() -> Iterator[Any]:
+            for line_no, line in enumerate(infile, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.decoder.JSONDecodeError:
+                    raise ValueError(
+                        f"JSON error on line {line_no} of {filename}")
+        yield from _batched(_records(), chunk_size)
+
+
+def _iter_pandas_csv(
+    filename: str,
+    chunk_size: int,
+) -> Iterator[pd.DataFrame]:
+    """Streams a CSV file as DataFrames of up to chunk_size rows."""
+    with pd.read_csv(filename, chunksize=chunk_size) as reader:
+        yield from reader
+
+
+def _iter_hf_json(filename: str, chunk_size: int) -> Iterator[list[dict]]:
+    """Streams a JSON/JSONL file through datasets' streaming reader."""
+    yield from _batched(load_hf_json(filename, "streaming"), chunk_size)
+
+
+def hf_cache_dir() -> str:
+    """The project's cache folder for prepared hf-json (Arrow) files."""
+    return os.path.abspath(
+        os.path.join(TRACKING_FOLDER, CACHE_FOLDER, HF_CACHE_DIR))
+
+
+def load_hf_json(filename: str, mode: HfModeTypes = "dataset_dict") -> Any:
+    """Loads a JSON/JSONL file with the datasets library.
+
+    The first non-streaming load converts the file to Arrow in the
+    project's cache folder (see hf_cache_dir); later loads of the
+    unchanged file memory-map those Arrow files and take milliseconds
+    regardless of size.
+
+    Args:
+        filename: The path to the JSON or JSONL file.
+        mode: "dataset_dict" returns the DatasetDict as before,
+            "memory_map" the Arrow-backed train Dataset without any
+            conversion, and "streaming" an IterableDataset that reads
+            the file lazily and writes no cache. Defaults to
+            "dataset_dict".
+
+    Raises:
+        ValueError: If the mode is unknown.
+
+    Returns:
+        A DatasetDict, Dataset or IterableDataset.
+    """
+    if mode == "streaming":
+        return load_dataset(
+            "json", data_files=filename, streaming=True, split="train")
+    if mode == "memory_map":
+        return load_dataset(
+            "json", data_files=filename, cache_dir=hf_cache_dir(),
+            split="train")
+    if mode == "dataset_dict":
+        return load_dataset(
+            "json", data_files=filename, cache_dir=hf_cache_dir())
+    raise ValueError(f"Unknown hf-json mode {mode}")
+
+
+def iter_data_from_file(
+    file_def: FileDefinition,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[ChunkTypes]:
+    """Streams data from disk in bounded chunks.
+
+    Only one chunk is held in memory at a time, so files far larger than
+    memory can be processed or sampled. The records in each chunk match
+    what load_data_from_file would return for the same file:
+
+      - csv: lists of row dicts
+      - jsonl: lists of decoded lines
+      - pandas (.csv): DataFrames of up to chunk_size rows
+      - hf-json: lists of row dicts from the streaming datasets reader
+      - parquet, feather: DataFrames, one row group or record batch at a
+        time (see adgtk.data.ingest.iter_table)
+
+    Sharded datasets yield the chunks of each shard in turn, with the
+    next shards read in the background (see adgtk.data.shards).
+
+    Args:
+        file_def: The definition of the file to stream.
+        chunk_size: The maximum records per chunk. Defaults to
+            DEFAULT_CHUNK_SIZE.
+
+    Raises:
+        ValueError: If the encoding (or pandas file type) cannot be
+            streamed, or chunk_size is not positive. Raised on the call,
+            before any chunk is read.
+
+    Returns:
+        An iterator over lists of records, or over DataFrames for the
+        pandas, parquet and feather encodings.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if is_sharded(file_def):
+        if file_def.encoding not in STREAMABLE_ENCODINGS:
+            raise ValueError(
+                f"Streaming is not supported for encoding {file_def.encoding}")
+        return iter_shards(shard_definitions(file_def), chunk_size)
+    file_w_path = os.path.join(file_def.path, file_def.filename)
+    encoding = file_def.encoding
+
+    if encoding == "csv":
+        return _iter_csv(file_w_path, chunk_size)
+    if encoding == "jsonl":
+        return _iter_jsonl(file_w_path, chunk_size)
+    if encoding == "pandas" and file_w_path.endswith(".csv"):
+        return _iter_pandas_csv(file_w_path, chunk_size)
+    if encoding == "hf-json":
+        return _iter_hf_json(file_w_path, chunk_size)
+    if encoding in TABULAR_ENCODINGS:
+        return iter_table(file_w_path, encoding, chunk_size=chunk_size)
+    raise ValueError(
+        f"Streaming is not supported for encoding {encoding} "
+        f"({file_def.filename})")
 
 
 def load_data_from_file(
-    file_def: FileDefinition
+    file_def: FileDefinition,
+    use_cache: bool = True,
 ) -> ReturnDataTypes:
     """Loads data from disk based on a FileDefinition.
 
+    Parsed csv, json, jsonl and pandas files are kept in the dataset cache
+    (see data/cache.py), so loading an unchanged file again skips parsing.
+    hf-json files load as set by extended_metadata["hf_mode"]; see
+    load_hf_json. Sharded datasets load every shard in parallel and
+    join them (see adgtk.data.shards).
+
     Args:
         file_def: The definition of the file to load.
+        use_cache: Read and fill the parsed-dataset cache. Defaults to
+            True.
 
     Raises:
         ValueError: If the file extension is unexpected or encoding is
@@ -119,6 +301,12 @@ def load_data_from_file(
     Returns:
         The loaded data in its native or requested format.
     """
+    if is_sharded(file_def):
+        return load_shards(shard_definitions(file_def), use_cache=use_cache)
+    if use_cache:
+        return load_cached(
+            file_def, lambda: load_data_from_file(file_def, use_cache=False))
+
     file_w_path = os.path.join(file_def.path, file_def.filename)
     encoding = file_def.encoding
 
@@ -129,7 +317,11 @@ def load_data_from_file(
     if encoding == "csv":
         data = load_data_from_csv_file(file_w_path)
     elif encoding == "hf-json":
-        data = load_dataset("json", data_files=file_w_path)
+        mode = (file_def.extended_metadata or {}).get(
+            HF_MODE_KEY, "dataset_dict")
+        data = load_hf_json(file_w_path, mode)
+    elif encoding == "jsonl":
+        data = load_data_from_jsonl_file(file_w_path)
     elif encoding == "json":
         with open(file_w_path, encoding="utf-8", mode="r") as infile:
             try:
@@ -146,6 +338,8 @@ def load_data_from_file(
             data = pd.read_pickle(file_w_path)
         else:
             raise ValueError("Unexpected file extension")
+    elif encoding in TABULAR_ENCODINGS:
+        data = read_table(file_w_path, encoding)
     else:
         logging.warning(
             f"Unknown encoding defined for {file_def}")
@@ -178,6 +372,22 @@ def change_orientation(
     if found_orientation == target_orientation:
         return data
 
+    # columnar is reachable from every tabular form and converts back
+    # only at this edge
+    if target_orientation == "columnar":
+        try:
+            return ColumnarDataset.from_data(data)
+        except (ValueError, TypeError):
+            raise RuntimeError("Failed to transform.")
+    if isinstance(data, ColumnarDataset):
+        if target_orientation == "list_contains_dict":
+            return data.to_records()
+        elif target_orientation == "dict_contains_list":
+            return data.to_dict()
+        elif target_orientation == "pandas":
+            return data.to_pandas()
+        raise RuntimeError("Failed to transform.")
+
     # ------- target transformations -------
     if found_orientation == "list_contains_string":
         if target_orientation == "list_contains_string":
@@ -198,7 +408,7 @@ def change_orientation(
                 target_orientation)
             return data.to_dict()   # type: ignore
     elif found_orientation == "list_contains_dict":
-        data = cast(list, dict)
+        data = cast(list, data)
         if target_orientation == "list_contains_dict":
             return data
         elif target_orientation == "dict_contains_list":
@@ -276,11 +486,8 @@ def flip_from_dict_to_list(data: dict) -> list:
         raise ValueError(msg)
 
     keys = list(data.keys())
-    for idx in range(len(data[keys[0]])):
-        to_insert = {}
-        for key in keys:
-            to_insert[key] = data[key][idx]
-        dest.append(to_insert)
+    for values in zip(*(data[key] for key in keys)):
+        dest.append(dict(zip(keys, values)))
     return dest
 
 
@@ -303,6 +510,8 @@ def remap_data(
 
     if isinstance(data, pd.DataFrame):
         return data.rename(columns=key_map)
+    elif isinstance(data, ColumnarDataset):
+        return data.rename(key_map)
     elif isinstance(data, dict):
         for old_key, new_key in key_map.items():
             if old_key in data.keys():
@@ -358,6 +567,9 @@ def shuffle_data(data: ReturnDataTypes) -> ReturnDataTypes:
         return shuffle_dict_of_lists(data)
     elif isinstance(data, pd.DataFrame):
         return data.sample(frac=1).reset_index(drop=True)
+    elif isinstance(data, ColumnarDataset):
+        # a new permutation over the same columns
+        return data.shuffle()
     raise ValueError("Unexpected data type")
 
 
@@ -386,13 +598,14 @@ def split_dict(data: dict, keys: list) -> tuple:
 
 
 def split_data_into_left_right(
-    data: Union[list, dict, pd.DataFrame],
+    data: Union[list, dict, pd.DataFrame, ColumnarDataset],
     keys: list
 ) -> tuple:
     """Splits a data structure into left and right components.
 
     Args:
-        data: The data structure (list, dict, or DataFrame) to split.
+        data: The data structure (list, dict, DataFrame or
+            ColumnarDataset) to split.
         keys: The keys or columns to move to the right component.
 
     Returns:
@@ -401,6 +614,9 @@ def split_data_into_left_right(
 
     if isinstance(data, dict):
         return split_dict(data=data, keys=keys)
+    elif isinstance(data, ColumnarDataset):
+        # two views over the same column arrays
+        return data.split(keys)
     elif isinstance(data, pd.DataFrame):
         left = data.drop(columns=keys, errors="ignore")
         right = data[keys].copy()
@@ -428,8 +644,10 @@ def load_data(
 ) -> ReturnDataTypes:
     """Loads and transforms data according to a definition.
 
-    Handles loading from disk or memory, followed by shuffling,
-    orientation changes, and key remapping as specified.
+    Handles loading from disk or memory, followed by orientation changes,
+    key remapping and shuffling as specified. A target_orientation of
+    "columnar" returns a ColumnarDataset, on which the shuffle (and any
+    later split or rename) is a view rather than a copy.
 
     Args:
         data_def: The definition specifying how to load and process data.
@@ -460,19 +678,41 @@ def load_data(
         except ValidationError:
             raise ValueError("Unexpected data definition. Unable to load")
 
-    # now processing
-    if isinstance(data_def, FileDataDefinition):
-        data = load_data_from_file(file_def=data_def.file_definition)
-    elif isinstance(data_def, InMemoryDataDefinition):
-        data = data_def.data
-    elif isinstance(data_def, FileDefinition):
+    if isinstance(data_def, FileDefinition):
         data_def = FileDataDefinition(
             shuffle_on_load=False,
             key_rename_map=None,
             target_orientation=None,
             file_definition=data_def
         )
-        load_data_from_file(file_def=data_def.file_definition)
+
+    # now processing
+    if isinstance(data_def, FileDataDefinition):
+        # orientation and remapping are deterministic, so their result is
+        # what gets cached; the shuffle below stays per load
+        file_def = data_def.file_definition
+        target_orientation = data_def.target_orientation
+        key_rename_map = data_def.key_rename_map
+
+        def _build() -> ReturnDataTypes:
+            if target_orientation == "columnar" and file_def.encoding == "csv":
+                # straight into columns; same string values as the csv path
+                loaded: ReturnDataTypes = read_csv_columns(
+                    os.path.join(file_def.path, file_def.filename),
+                    infer_types=False)
+            else:
+                loaded = load_data_from_file(
+                    file_def=file_def, use_cache=False)
+            return _transform(loaded, target_orientation, key_rename_map)
+
+        data = load_cached(file_def, _build, options={
+            "target_orientation": target_orientation,
+            "key_rename_map": key_rename_map,
+        })
+    elif isinstance(data_def, InMemoryDataDefinition):
+        data = _transform(
+            data_def.data, data_def.target_orientation,
+            data_def.key_rename_map)
 
     # confirm load? None is acceptable to return.
     if data is None:
@@ -483,15 +723,25 @@ def load_data(
         if data_def.shuffle_on_load:
             data = shuffle_data(data)
 
+    # and return
+    return data
+
+
+def _transform(
+    data: ReturnDataTypes,
+    target_orientation: Optional[OrientationTypes],
+    key_rename_map: Optional[dict[str, str]],
+) -> ReturnDataTypes:
+    """Applies the orientation change and key remapping of load_data."""
+    if data is None:
+        return None
+
     # change orientation?
-    target_orientation = data_def.target_orientation
     if target_orientation is not None:
         data = change_orientation(
             data=data, target_orientation=target_orientation)
 
     # remapping requested?
-    if data_def.key_rename_map is not None:
-        data = remap_data(data=data, key_map=data_def.key_rename_map)
-
-    # and return
+    if key_rename_map is not None:
+        data = remap_data(data=data, key_map=key_rename_map)
     return data
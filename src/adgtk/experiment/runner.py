@@ -40,7 +40,13 @@ import adgtk.factory.component as factory
 import adgtk.tracking.project as project_manager
 import adgtk.tracking.observations as observations
 import adgtk.tracking.runs as run_registry
+from adgtk.tracking.base import clear_saved_series
 from adgtk.tracking.manifest import build_manifest, save as save_manifest
+from adgtk.tracking.metric_store import append_run as store_run_metrics
+from adgtk.tracking.usage import (
+    clear_loaded_datasets,
+    record_run_datasets,
+)
 from adgtk.tracking.structure import (
     AvailableExperimentModel,
     ExperimentRunFolders,
@@ -443,6 +449,8 @@ def run_scenario(
             "Experiment Runner found an active task. Cancelling request")
         raise ActiveTaskFound()
     observations.reset()
+    clear_saved_series()
+    clear_loaded_datasets()
     if filename is None:
         exp_name = _select_experiment()
         exp_name += ".yaml"
@@ -528,6 +536,8 @@ def run_scenario(
             folders=folders,
         )
         save_manifest(manifest, folders.conclusion)
+        store_run_metrics(experiment_name, run_id, folders.metrics)
+        record_run_datasets(experiment_name, run_id)
 
         run_registry.add_run(RunEntryModel(
             run_id=run_id,
@@ -21,9 +21,10 @@ import numpy as np
 
 from adgtk.utils.defaults import STUDY_RESULTS_DIR
 from adgtk.experiment.study.structure import StudyBlueprint
-from adgtk.tracking.manifest import RunManifest
+from adgtk.tracking.manifest import RunSummary
 from adgtk.tracking.report import collect_experiment_data
-from adgtk.tracking.structure import MetricSummary  # noqa: F401
+from adgtk.tracking.metric_store import pooled_summaries
+from adgtk.tracking.structure import MetricSummary
 
 STUDY_REPORT_FILE = "study_report.md"
 STUDY_CSV_FILE = "study_results.csv"
@@ -52,16 +53,18 @@ class ExperimentData:
     def __init__(
         self,
         name: str,
-        manifests: list[RunManifest],
+        manifests: list[RunSummary],
         skipped: list[str],
         deviating: list[str],
         first_run_config: Optional[dict],
+        pooled: Optional[dict[str, MetricSummary]] = None,
     ):
         self.name = name
         self.manifests = manifests
         self.skipped = skipped
         self.deviating = deviating
         self.first_run_config = first_run_config
+        self.pooled = pooled or {}
 
 
 # ----------------------------------------------------------------------
@@ -110,6 +113,11 @@ def collect_study_data(
                     first_run_config = run_configs[rid]
                     break
 
+        run_labels: dict[str, list[str]] = {}
+        for m in manifests:
+            for k in m.metric_summaries:
+                run_labels.setdefault(k, []).append(m.run_id)
+
         experiment_data.append(
             ExperimentData(
                 name=exp_name,
@@ -117,6 +125,7 @@ def collect_study_data(
                 skipped=skipped,
                 deviating=deviating,
                 first_run_config=first_run_config,
+                pooled=pooled_summaries(exp_name, run_labels),
             )
         )
 
@@ -155,7 +164,7 @@ def _config_summary(config: Optional[dict]) -> str:
 # Per-experiment stats
 # ----------------------------------------------------------------------
 
-def _experiment_stats(manifests: list[RunManifest]) -> dict:
+def _experiment_stats(manifests: list[RunSummary]) -> dict:
     """Compute aggregate statistics for a list of manifests."""
     n = len(manifests)
     if n == 0:
@@ -566,6 +575,22 @@ def generate_study_markdown(
                 )
             lines.append("")
 
+        # Pooled sample statistics from the experiment's metric store
+        if ed.pooled:
+            lines.append("#### Pooled Sample Statistics (all samples)")
+            lines.append("")
+            lines.append(
+                "| Metric | Samples | Mean | Std | p50 | p95 | Min | Max |")
+            lines.append(
+                "|--------|--------:|-----:|----:|----:|----:|----:|----:|")
+            for k, p in ed.pooled.items():
+                lines.append(
+                    f"| {k} | {p.n} | {p.mean:.4f} | {p.std:.4f} | "
+                    f"{p.p50:.4f} | {p.p95:.4f} | {p.min:.4f} | "
+                    f"{p.max:.4f} |"
+                )
+            lines.append("")
+
         # Config deviations warning
         if ed.deviating:
             lines.append("#### Configuration Deviations")
@@ -606,7 +631,7 @@ def save_study_csv(
     os.makedirs(output_dir, exist_ok=True)
     csv_path = os.path.join(output_dir, STUDY_CSV_FILE)
 
-    all_manifests: list[RunManifest] = []
+    all_manifests: list[RunSummary] = []
     for ed in experiment_data:
         all_manifests.extend(ed.manifests)
 
@@ -220,12 +220,31 @@ def get_run_details(experiment_name: str, run_id: str) -> dict:
 def export_results(experiment_name: str, format: str = "json") -> dict:
     """Export all run records for an experiment.
 
+    Each record holds the registry entry plus the run's result metrics and
+    per-metric sample count and mean.
+
     Args:
         experiment_name: Name of the experiment.
         format: Output format — "json" (default) or "csv".
     """
+    from adgtk.tracking.manifest import load_run_summary
     from adgtk.tracking.runs import get_runs
-    runs = [_to_dict(r) for r in get_runs(experiment_name)]
+
+    runs = []
+    for r in get_runs(experiment_name):
+        record = _to_dict(r)
+        # Rollup facts come from the slim run.summary.json sidecar, never
+        # from the full manifest with its observations.
+        summary = load_run_summary(
+            os.path.join(str(r.results_path), "conclusions"))
+        if summary is not None:
+            record["verdict_note"] = summary.verdict_note
+            for k, v in summary.result_metrics.items():
+                record[f"metric_{k}"] = v
+            for k, s in summary.metric_summaries.items():
+                record[f"meas_{k}_n"] = s.n
+                record[f"meas_{k}_mean"] = s.mean
+        runs.append(record)
 
     if format == "csv":
         import io
@@ -290,6 +290,55 @@ class MeasurementEngine:
         elif record_as == "raw":
             self.metric_tracker.add_raw_data(label=label, values=results)
 
+    def _measure_with(self, label: str, meas: Any, data: Iterable) -> list:
+        """
+        Apply one measurement to a dataset and return its raw results.
+
+        Args:
+            label: Metric label of the measurement.
+            meas: The measurement callable or class instance.
+            data: Input dataset.
+
+        Returns:
+            The results collected for data.
+        """
+        all_results: list = []
+        if inspect.isclass(meas):
+            meas = cast(ClassBasedMeasurement, meas)
+        else:
+            meas = cast(direct_measurement, meas)
+
+        # first, does the measurement want all the data?
+        if supports_measurement_type(meas, data):
+            try:
+                result = meas(data)
+                all_results.append(result)
+            except UnableToMeasureException:
+                # NO-OP
+                pass
+        else:
+            # if not, then iterate over the values
+            # this is a fallback. measurements should be designed to
+            # consider iterable values.
+            for entry in data:
+                # Verify if the measurement type is supported
+                try:
+                    if supports_measurement_type(meas, entry):
+                        result = meas(entry)
+                        if isinstance(result, (int, float)):
+                            all_results.append(result)
+                        elif isinstance(result, list):
+                            all_results.extend(result)
+                    else:
+                        self.logger.warning(
+                            f"{self.engine_id} No valid data for {label}. "
+                            "skipping measure")
+                        break
+                except UnableToMeasureException:
+                    # NO-OP
+                    pass
+        return all_results
+
     def measure(
         self,
         data: Iterable,
@@ -306,44 +355,38 @@ class MeasurementEngine:
             record_as: Aggregation/storage mode for recorded results.
         """
         for label, meas in self.measurements.items():
-            all_results = []
-            if inspect.isclass(meas):
-                meas = cast(ClassBasedMeasurement, meas)
-            else:
-                meas = cast(direct_measurement, meas)
-
-            # first, does the measurement want all the data?
-            if supports_measurement_type(meas, data):
-                try:
-                    result = meas(data)
-                    all_results.append(result)
-                except UnableToMeasureException:
-                    # NO-OP
-                    pass
-            else:
-                # if not, then iterate over the values
-                # this is a fallback. measurements should be designed to
-                # consider iterable values.
-                for entry in data:
-                    # Verify if the measurement type is supported
-                    try:
-                        if supports_measurement_type(meas, entry):
-                            result = meas(entry)
-                            if isinstance(result, (int, float)):
-                                all_results.append(result)
-                            elif isinstance(result, list):
-                                all_results.extend(result)
-                        else:
-                            self.logger.warning(
-                                f"{self.engine_id} No valid data for {label}. "
-                                "skipping measure")
-                            break
-                    except UnableToMeasureException:
-                        # NO-OP
-                        pass
+            all_results = self._measure_with(label, meas, data)
             self._update_tracker(
                 label=label, results=all_results, record_as=record_as)
 
+    def measure_chunks(
+        self,
+        chunks: Iterable[Iterable],
+        record_as: calculation_type = "avg"
+    ) -> None:
+        """
+        Run registered measurements over a dataset streamed in chunks.
+
+        Each chunk is measured as `measure` would measure a dataset, and
+        the results of all chunks are recorded together once the stream is
+        exhausted, so only one chunk is in memory at a time. Measurements
+        that take the whole dataset see one chunk per call. Pairs with
+        DatasetManager.iter_file.
+
+        Args:
+            chunks: Iterable of dataset chunks (lists or DataFrames).
+            record_as: Aggregation/storage mode for recorded results.
+        """
+        all_results: dict[str, list] = {
+            label: [] for label in self.measurements}
+        for chunk in chunks:
+            for label, meas in self.measurements.items():
+                all_results[label].extend(
+                    self._measure_with(label, meas, chunk))
+        for label, results in all_results.items():
+            self._update_tracker(
+                label=label, results=results, record_as=record_as)
+
     def measure_dataset_distribution(self, dataset: Iterable) -> None:
         """Run distribution measurements that operate on the full dataset.
 
@@ -27,7 +27,14 @@ import adgtk.tracking.observations as observations
 from .observation_writer import ObservationWriter
 from .observation_writer import track_step as observation_track_step
 
-from .manifest import RunManifest, build_manifest, generate_markdown
+from .manifest import (
+    RunManifest,
+    RunSummary,
+    build_manifest,
+    generate_markdown,
+    load_manifest,
+    load_manifests,
+)
 
 from .report import generate_experiment_report
 
@@ -69,8 +76,11 @@ __all__ = [
     "observation_track_step",
     # manifest
     "RunManifest",
+    "RunSummary",
     "build_manifest",
     "generate_markdown",
+    "load_manifest",
+    "load_manifests",
     # report
     "generate_experiment_report",
     # experiment journal
@@ -6,19 +6,59 @@ the batch_ measurements
 
 import copy
 import csv
+import io
 import os
 import logging
-from typing import Iterable, Union
+from typing import Iterable, Optional, Union
 import numpy as np
 from adgtk.data.structure import PurposeTypes
 import adgtk.tracking.observations as observations
 from adgtk.utils.defaults import SCENARIO_LOGGER_NAME
+from adgtk.utils.file import content_hash
 from .structure import ExperimentRunFolders
 # ----------------------------------------------------------------------
 # Constants
 # ----------------------------------------------------------------------
 DEBUG_TO_CONSOLE = False
 
+# ----------------------------------------------------------------------
+# Module-level state
+# ----------------------------------------------------------------------
+# Series written by MetricTracker.save_data during this process, keyed by
+# the absolute CSV path. Each entry holds (size, mtime_ns, hash, values)
+# so the manifest builder can summarise a metric without re-reading it,
+# as long as the file on disk is still the one that was written.
+_saved_series: dict[str, tuple[int, int, str, list]] = {}
+
+
+def clear_saved_series() -> None:
+    """Forget all in-memory series. Called by the runner between runs."""
+    _saved_series.clear()
+
+
+def get_saved_series(path: str) -> Optional[tuple[str, list]]:
+    """Returns the hash and values last written to a metric CSV.
+
+    Args:
+        path (str): The path to the metric CSV file.
+
+    Returns:
+        Optional[tuple[str, list]]: The content hash and the values, or
+            None if the file was not written by this process or has been
+            modified since.
+    """
+    entry = _saved_series.get(os.path.abspath(path))
+    if entry is None:
+        return None
+    size, mtime_ns, digest, values = entry
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+        return None
+    return digest, values
+
 # ----------------------------------------------------------------------
 # Tracking of data
 # ----------------------------------------------------------------------
@@ -317,9 +357,15 @@ class MetricTracker():
                         folders.metrics,
                         f"{self.name}.{key}.csv")
 
-            with open(filename, "w", newline="") as outfile:
-                writer = csv.writer(outfile)
-                writer.writerow(data)
+            buffer = io.StringIO()
+            csv.writer(buffer).writerow(data)
+            content = buffer.getvalue().encode("utf-8")
+            with open(filename, "wb") as outfile:
+                outfile.write(content)
+
+            stat = os.stat(filename)
+            _saved_series[os.path.abspath(filename)] = (
+                stat.st_size, stat.st_mtime_ns, content_hash(content), data)
 
             self.logger.info(
                 f"Saved {self.name}.{key} metric data to {filename}")
@@ -0,0 +1,266 @@
+"""blueprints.py — persistent index of the experiment blueprints.
+
+Listing the available experiments and finding which blueprints use a
+dataset used to parse or read every YAML file in blueprints/ on each call.
+The index keeps the facts those callers need for every blueprint:
+
+  - name and description
+  - a hash of the parsed config
+  - the factory IDs it instantiates
+  - the string values it references (dataset IDs among them)
+
+It is stored in .tracking/blueprints.index.json. Each refresh only stats
+the folder and re-parses files whose size or mtime changed; files that
+disappeared are dropped. Code that writes a blueprint calls
+index_blueprint so the index is current without any scan.
+
+The index also keeps the reverse map, referenced value → blueprint names,
+so "which blueprints use dataset X" is a dictionary lookup.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Optional
+
+import yaml
+from pydantic import BaseModel, ValidationError
+
+from adgtk.tracking.store import atomic_write, file_lock
+from adgtk.utils.defaults import EXP_DEF_DIR, TRACKING_FOLDER
+from adgtk.utils.file import content_hash
+from adgtk.utils import create_logger
+
+_logger = create_logger(
+    "adgtk.project.log",
+    logger_name=__name__,
+    subdir="framework"
+)
+
+INDEX_FILE = "blueprints.index.json"
+INDEX_VERSION = 2
+BLUEPRINT_SUFFIX = ".yaml"
+# keys whose string values are not references to other objects
+_NON_REFERENCE_KEYS = {"attribute", "description", "factory_id"}
+# libyaml's safe loader when available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# ----------------------------------------------------------------------
+# Models
+# ----------------------------------------------------------------------
+
+
+class BlueprintEntry(BaseModel):
+    """The indexed facts about one blueprint file."""
+    name: str
+    size: int
+    mtime_ns: int
+    description: Optional[str] = None
+    config_hash: Optional[str] = None
+    factory_ids: list[str] = []
+    references: list[str] = []
+    error: Optional[str] = None
+
+
+class BlueprintIndex(BaseModel):
+    """The on-disk blueprint index."""
+    version: int = INDEX_VERSION
+    folder: str = ""
+    entries: dict[str, BlueprintEntry] = {}
+    by_reference: dict[str, list[str]] = {}
+
+
+# ----------------------------------------------------------------------
+# Internal helpers
+# ----------------------------------------------------------------------
+
+
+def _index_path() -> str:
+    return os.path.join(TRACKING_FOLDER, INDEX_FILE)
+
+
+def _collect_strings(
+    node: Any,
+    factory_ids: set[str],
+    references: set[str],
+    key: Optional[str] = None,
+) -> None:
+    """Walk a parsed blueprint, sorting string leaves by their key."""
+    if isinstance(node, dict):
+        for k, v in node.items():
+            _collect_strings(v, factory_ids, references, str(k))
+    elif isinstance(node, list):
+        for item in node:
+            _collect_strings(item, factory_ids, references, key)
+    elif isinstance(node, str):
+        if key == "factory_id":
+            factory_ids.add(node)
+        elif key not in _NON_REFERENCE_KEYS:
+            references.add(node)
+
+
+def _index_file(path: str, size: int, mtime_ns: int) -> BlueprintEntry:
+    """Parse one blueprint into its index entry."""
+    name = os.path.basename(path).removesuffix(BLUEPRINT_SUFFIX)
+    entry = BlueprintEntry(name=name, size=size, mtime_ns=mtime_ns)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
+    except (OSError, UnicodeDecodeError, yaml.YAMLError):
+        _logger.error(f"Unable to process {path} on refresh.")
+        entry.error = "unparseable"
+        return entry
+
+    if not isinstance(data, dict) or "description" not in data:
+        _logger.error(f"missing required keys for {path}")
+        entry.error = "missing description"
+        return entry
+
+    factory_ids: set[str] = set()
+    references: set[str] = set()
+    _collect_strings(data, factory_ids, references)
+    entry.description = str(data["description"])
+    entry.config_hash = content_hash(
+        json.dumps(data, sort_keys=True, default=str).encode("utf-8"))
+    entry.factory_ids = sorted(factory_ids)
+    entry.references = sorted(references)
+    return entry
+
+
+def _load_index(folder: str) -> BlueprintIndex:
+    path = _index_path()
+    try:
+        with open(path, "rb") as f:
+            index = BlueprintIndex.model_validate_json(f.read())
+    except (OSError, ValidationError):
+        return BlueprintIndex(folder=folder)
+    if index.version != INDEX_VERSION or index.folder != folder:
+        return BlueprintIndex(folder=folder)
+    return index
+
+
+def _save_index(index: BlueprintIndex) -> None:
+    """Rebuild the reverse map and write the index. Caller holds the lock."""
+    by_reference: dict[str, list[str]] = {}
+    for entry in sorted(index.entries.values(), key=lambda e: e.name):
+        for ref in entry.references:
+            by_reference.setdefault(ref, []).append(entry.name)
+    index.by_reference = by_reference
+    atomic_write(_index_path(), index.model_dump_json())
+
+
+def _refresh(blueprints_dir: str) -> BlueprintIndex:
+    """Stat the folder, re-parse changed files and return the index."""
+    folder = os.path.abspath(blueprints_dir)
+    if not os.path.isdir(folder):
+        return BlueprintIndex(folder=folder)
+
+    with file_lock(_index_path()):
+        index = _load_index(folder)
+        current: dict[str, BlueprintEntry] = {}
+        changed = False
+        with os.scandir(folder) as it:
+            for dirent in it:
+                if not dirent.name.endswith(BLUEPRINT_SUFFIX):
+                    continue
+                if not dirent.is_file():
+                    continue
+                st = dirent.stat()
+                cached = index.entries.get(dirent.name)
+                if (cached is not None and cached.size == st.st_size
+                        and cached.mtime_ns == st.st_mtime_ns):
+                    current[dirent.name] = cached
+                    continue
+                current[dirent.name] = _index_file(
+                    dirent.path, st.st_size, st.st_mtime_ns)
+                changed = True
+
+        if changed or set(current) != set(index.entries):
+            index.entries = current
+            _save_index(index)
+    return index
+
+
+# ----------------------------------------------------------------------
+# Public API
+# ----------------------------------------------------------------------
+
+
+def refresh_blueprint_index(
+    blueprints_dir: str = EXP_DEF_DIR,
+) -> dict[str, BlueprintEntry]:
+    """Bring the blueprint index up to date and return its entries.
+
+    Only blueprints whose size or mtime changed since the last refresh
+    are parsed again; the index is written back only when something
+    changed.
+
+    Args:
+        blueprints_dir: The folder holding the blueprint YAML files.
+
+    Returns:
+        Mapping of blueprint filename to its BlueprintEntry.
+    """
+    return _refresh(blueprints_dir).entries
+
+
+def index_blueprint(path: str) -> Optional[BlueprintEntry]:
+    """Update the index for a single blueprint that was just written.
+
+    Called by the code paths that save blueprints (builder, web editor,
+    copy commands), so the index and its reverse map stay current without
+    scanning the folder. A path that no longer exists is dropped.
+
+    Args:
+        path: The blueprint YAML file.
+
+    Returns:
+        The new entry, or None if the file does not exist.
+    """
+    folder = os.path.abspath(os.path.dirname(path))
+    fname = os.path.basename(path)
+    with file_lock(_index_path()):
+        index = _load_index(folder)
+        try:
+            st = os.stat(path)
+        except OSError:
+            index.entries.pop(fname, None)
+            _save_index(index)
+            return None
+        entry = _index_file(path, st.st_size, st.st_mtime_ns)
+        index.entries[fname] = entry
+        _save_index(index)
+    return entry
+
+
+def blueprints_by_reference(
+    blueprints_dir: str = EXP_DEF_DIR,
+) -> dict[str, list[str]]:
+    """Return the reverse map: referenced value → sorted blueprint names."""
+    return _refresh(blueprints_dir).by_reference
+
+
+def list_blueprints(
+    blueprints_dir: str = EXP_DEF_DIR,
+) -> list[BlueprintEntry]:
+    """Return the valid blueprints (those with a description), by name."""
+    entries = refresh_blueprint_index(blueprints_dir).values()
+    return sorted(
+        (e for e in entries if e.error is None), key=lambda e: e.name)
+
+
+def find_blueprints_referencing(
+    value: str,
+    blueprints_dir: str = EXP_DEF_DIR,
+) -> list[str]:
+    """Return the names of blueprints holding value as a string setting.
+
+    Args:
+        value: The referenced value, e.g. a dataset ID.
+        blueprints_dir: The folder holding the blueprint YAML files.
+
+    Returns:
+        Sorted blueprint names.
+    """
+    return list(blueprints_by_reference(blueprints_dir).get(value, []))
@@ -8,14 +8,46 @@ Roadmap
 =======
 1. consider YAML and sqlite3 as additional file tracking solutions.
 2. refactor report for better UI experience.
+
+Concurrency
+===========
+Every change re-reads the inventory under an fcntl lock, applies the
+change to that fresh copy and writes it back atomically (see
+tracking/store.py), so trackers in different processes that share an
+inventory file do not overwrite each other. Reads reload the inventory
+when the file changed on disk. When the file has not changed since this
+tracker last saw it, the in-memory copy is used instead of re-parsing.
+
+Indexes
+=======
+Alongside the inventory the tracker keeps a tag → file IDs inverted index
+and a (filename, path) → file ID index, rebuilt whenever the inventory is
+reloaded or changed. Tag filters and get_file_id are lookups rather than
+scans. batch() groups many changes into one locked read and one write;
+register_many is built on it.
 """
 import logging
-import json
 import os
-from typing import Optional, Union
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, TypeVar, Union
 import uuid
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 from adgtk.data.structure import FileDefinition, FileEncodingTypes
+from adgtk.tracking.store import atomic_write, file_lock, file_stamp, read_json
+
+T = TypeVar("T")
+
+_INVENTORY_ADAPTER = TypeAdapter(dict[str, FileDefinition])
+
+
+def _tag_list(tags: Optional[Union[str, list[str]]]) -> list[str]:
+    """Normalise the tags field, which may be a single string."""
+    if tags is None:
+        return []
+    if isinstance(tags, str):
+        return [tags]
+    return list(tags)
 
 
 # ----------------------------------------------------------------------
@@ -45,9 +77,51 @@ class JsonFileTracker:
         self.label = label
         self.inventory_file = inventory_file
         self._inventory: dict[str, FileDefinition] = {}
+        self._stamp: Optional[tuple[int, int]] = None
+        # tag -> file IDs (dict used as an insertion-ordered set)
+        self._by_tag: dict[str, dict[str, None]] = {}
+        self._tagged: dict[str, None] = {}
+        self._by_location: dict[tuple[str, str], str] = {}
+        self._index_stale = False
+        # the inventory being changed inside batch(), else None
+        self._batch: Optional[dict[str, FileDefinition]] = None
+        # serialises writers within this process (e.g. background threads)
+        self._mutex = threading.RLock()
         self.logger = logger or logging.getLogger(__name__)
         self._load_from_disk()
 
+    def _parse_inventory(self, data: dict) -> dict[str, FileDefinition]:
+        """Validates raw inventory data against the FileDefinition schema.
+
+        Raises:
+            Exception: If an entry fails validation.
+        """
+        try:
+            return _INVENTORY_ADAPTER.validate_python(data)
+        except ValidationError:
+            msg = ("Potential corruption when loading from "
+                   f"disk : with file {self.inventory_file}")
+            self.logger.error(msg)
+            raise Exception(msg)
+
+    def _set_inventory(self, inventory: dict[str, FileDefinition]) -> None:
+        """Replaces the in-memory inventory and rebuilds its indexes."""
+        self._inventory = inventory
+        by_tag: dict[str, dict[str, None]] = {}
+        tagged: dict[str, None] = {}
+        by_location: dict[tuple[str, str], str] = {}
+        for file_id, file in inventory.items():
+            by_location.setdefault((file.filename, file.path), file_id)
+            if file.tags is None:
+                continue
+            tagged[file_id] = None
+            for tag in _tag_list(file.tags):
+                by_tag.setdefault(tag, {})[file_id] = None
+        self._by_tag = by_tag
+        self._tagged = tagged
+        self._by_location = by_location
+        self._index_stale = False
+
     def _load_from_disk(self) -> None:
         """Loads the inventory from disk.
 
@@ -55,46 +129,106 @@ class JsonFileTracker:
         initialized. The method expects the file to be in JSON format and
         validates entries against the FileDefinition schema.
         """
-        if os.path.exists(self.inventory_file):
-            with open(self.inventory_file, "r", encoding="utf-8") as infile:
-                self._inventory = json.load(infile)
-
-                for file_id, entry in self._inventory.items():
-                    if not isinstance(entry, FileDefinition):
-                        try:
-                            entry = FileDefinition(**entry)
-                            self._inventory[file_id] = entry
-                        except ValidationError:
-                            msg = ("Potential corruption when loading from "
-                                   f"disk : with file {self.inventory_file}")
-                            self.logger.error(msg)
-                            raise Exception(msg)
-                msg = (f"Loaded {len(self._inventory)} into "
-                       "JsonFileTracker from disk")
-                self.logger.debug(msg)
-
+        self._stamp = file_stamp(self.inventory_file)
+        if self._stamp is not None:
+            data = read_json(self.inventory_file, default={})
+            self._set_inventory(self._parse_inventory(data))
+            msg = (f"Loaded {len(self._inventory)} into "
+                   "JsonFileTracker from disk")
+            self.logger.debug(msg)
         else:
             self.logger.warning(
                 f"unable to load {self.inventory_file}. This is expected if "
                 "creating a new tracker.")
-            self._inventory = {}
+            self._set_inventory({})
 
-    def _save_to_disk(self) -> None:
-        """Saves the current inventory state to disk in JSON format.
+    def _refresh(self) -> None:
+        """Reloads the inventory if another process changed the file.
 
-        Serializes FileDefinition objects using model_dump before writing.
+        Inside batch() the pending inventory is used as is.
         """
-        with open(self.inventory_file, "w", encoding="utf-8") as outfile:
-            out_data = {}
-            for file_id, entry in self._inventory.items():
-                if isinstance(entry, FileDefinition):
-                    out_data[file_id] = entry.model_dump()
-                else:
-                    out_data[file_id] = entry
-            json.dump(out_data, outfile, indent=2)
+        with self._mutex:
+            if self._batch is None and (
+                    file_stamp(self.inventory_file) != self._stamp):
+                self._load_from_disk()
+            elif self._index_stale:
+                self._set_inventory(self._inventory)
+
+    def _read_locked(self) -> dict[str, FileDefinition]:
+        """Returns a fresh copy of the inventory. Caller holds the lock."""
+        if file_stamp(self.inventory_file) == self._stamp:
+            return dict(self._inventory)
+        data = read_json(self.inventory_file, default={})
+        return self._parse_inventory(data)
+
+    def _write_locked(self, inventory: dict[str, FileDefinition]) -> None:
+        """Writes the inventory and adopts it. Caller holds the lock."""
+        atomic_write(
+            self.inventory_file,
+            _INVENTORY_ADAPTER.dump_json(inventory, indent=2).decode("utf-8"))
+        self._set_inventory(inventory)
+        self._stamp = file_stamp(self.inventory_file)
         self.logger.info(
             f"{self.label} saved inventory to {self.inventory_file}")
 
+    def _update(self, change: Callable[[dict[str, FileDefinition]], T]) -> T:
+        """Applies a change to the on-disk inventory under lock.
+
+        The inventory is re-read under the lock, change mutates that fresh
+        copy (raising to abort) and the result is written back atomically.
+        Inside batch() the change is applied to the pending inventory and
+        written when the batch ends.
+
+        Args:
+            change: Mutates the inventory in place and returns a result.
+
+        Returns:
+            Whatever change returned.
+        """
+        with self._mutex:
+            if self._batch is not None:
+                result = change(self._batch)
+                self._index_stale = True
+                return result
+
+            with file_lock(self.inventory_file):
+                inventory = self._read_locked()
+                result = change(inventory)
+                self._write_locked(inventory)
+            return result
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Groups changes into a single locked read and write.
+
+        Register, update and retire calls made inside the block change a
+        pending copy of the inventory, which is written once on exit. An
+        exception inside the block discards every change in it. Other
+        writers wait on the inventory lock until the batch ends.
+
+        Example:
+            with tracker.batch():
+                for path in shard_paths:
+                    tracker.register_file(path, "jsonl", tags="shard")
+        """
+        with self._mutex:
+            if self._batch is not None:
+                # nested: the outer batch writes
+                yield
+                return
+            with file_lock(self.inventory_file):
+                self._batch = self._read_locked()
+                self._inventory = self._batch
+                try:
+                    yield
+                except BaseException:
+                    self._batch = None
+                    self._load_from_disk()
+                    raise
+                pending = self._batch
+                self._batch = None
+                self._write_locked(pending)
+
     def list_files(
         self,
         tag: Optional[Union[str, list]] = None
@@ -110,28 +244,21 @@ class JsonFileTracker:
             A list of FileDefinition objects matching the filter criteria.
         """
 
-        found: list[FileDefinition] = []
-        file: FileDefinition
-        for _, file in self._inventory.items():
-            # ensure consistent format
-            if isinstance(file, FileDefinition):
-                pass
-            else:
-                try:
-                    file = FileDefinition(**file)
-                except ValidationError:
-                    raise ValueError("Corrupted inventory")
-            # inspect each file. not fast but it works
-            if tag is None:
-                found.append(file)
-            elif file.tags is not None:
-                if isinstance(tag, list):
-                    if all(entry in file.tags for entry in tag):
-                        found.append(file)
-                elif isinstance(tag, str):
-                    if tag in file.tags:
-                        found.append(file)
-        return found
+        self._refresh()
+        if tag is None:
+            return list(self._inventory.values())
+        tags = [tag] if isinstance(tag, str) else list(tag)
+        if not tags:
+            # an empty tag list matches every file that has tags
+            ids = list(self._tagged)
+        else:
+            postings = [self._by_tag.get(t, {}) for t in tags]
+            postings.sort(key=len)
+            ids = list(postings[0])
+            if len(postings) > 1:
+                common = set(ids).intersection(*postings[1:])
+                ids = [i for i in ids if i in common]
+        return [self._inventory[i] for i in ids]
 
     def get_file_ids_only(
         self,
@@ -163,14 +290,12 @@ class JsonFileTracker:
             ValueError: If the inventory is found to be corrupted.
             FileNotFoundError: If no entry matches the filename and path.
         """
-        file: FileDefinition
-        for _, file in self._inventory.items():
-            # ensure consistent format
-            if not isinstance(file, FileDefinition):
-                file = FileDefinition(**file)
-
-            if file.filename == filename and file.path == path:
-                return file.file_id
+        self._refresh()
+        # every stored entry has a path, so None never matches
+        if path is not None:
+            file_id = self._by_location.get((filename, path))
+            if file_id is not None:
+                return file_id
 
         raise FileNotFoundError()
 
@@ -263,9 +388,6 @@ class JsonFileTracker:
         if file_id is None:
             file_id = str(uuid.uuid4())
 
-        if file_id in self._inventory.keys():
-            raise IndexError(f"ID: {file_id} already exists")
-
         if tags is None:
             tags = []
 
@@ -281,12 +403,69 @@ class JsonFileTracker:
             extended_metadata=extended_metadata,
         )
 
-        self._inventory[file_id] = entry
-        self._save_to_disk()
-        self.logger.info(
-            f"{self.label} created entry: {file_id} for file {source_file}")
+        def _register(inventory: dict[str, FileDefinition]) -> None:
+            if entry.file_id in inventory:
+                raise IndexError(f"ID: {entry.file_id} already exists")
+            inventory[entry.file_id] = entry
+
+        self._update(_register)
+        if self._batch is None:
+            self.logger.info(
+                f"{self.label} created entry: {file_id} for file "
+                f"{source_file}")
         return file_id
 
+    def register_many(
+        self,
+        source_files: list[str],
+        encoding: FileEncodingTypes,
+        tags: Optional[Union[str, list[str]]] = None,
+        file_ids: Optional[list[str]] = None,
+        description: Optional[str] = None,
+        extended_metadata: Optional[dict] = None,
+    ) -> list[str]:
+        """Registers many files sharing an encoding in one write.
+
+        Either every file is registered or, if any fails, none is.
+
+        Args:
+            source_files: The paths of the files to register.
+            encoding: The encoding/format type shared by the files.
+            tags: Optional tags applied to every file. Defaults to None.
+            file_ids: Optional explicit IDs, one per file. If None, UUIDs
+                are generated.
+            description: Optional description applied to every file.
+            extended_metadata: Optional dict of custom fields applied to
+                every file.
+
+        Returns:
+            The IDs assigned, in the order of source_files.
+
+        Raises:
+            ValueError: If file_ids and source_files differ in length.
+            FileNotFoundError: If a source file does not exist on disk.
+            IndexError: If an ID already exists in the inventory.
+        """
+        if file_ids is not None and len(file_ids) != len(source_files):
+            raise ValueError("file_ids must match source_files in length")
+        if isinstance(tags, str):
+            tags = [tags]
+
+        assigned: list[str] = []
+        with self.batch():
+            for idx, source_file in enumerate(source_files):
+                assigned.append(self.register_file(
+                    source_file=source_file,
+                    encoding=encoding,
+                    tags=list(tags) if tags is not None else None,
+                    file_id=file_ids[idx] if file_ids is not None else None,
+                    description=description,
+                    extended_metadata=extended_metadata,
+                ))
+        self.logger.info(
+            f"{self.label} registered {len(assigned)} files in one batch")
+        return assigned
+
     def retire_file(self, file_id: str) -> None:
         """Removes a file entry from the inventory.
 
@@ -296,14 +475,14 @@ class JsonFileTracker:
         Raises:
             IndexError: If the ID is not found in the inventory.
         """
-        if file_id not in self._inventory.keys():
-            raise IndexError(f"Unknown ID: {file_id}")
+        def _retire(inventory: dict[str, FileDefinition]) -> None:
+            if file_id not in inventory:
+                raise IndexError(f"Unknown ID: {file_id}")
+            del inventory[file_id]
 
-        # now delete the entry
-        del self._inventory[file_id]
+        self._update(_retire)
         self.logger.info(
             f"{self.label} retired entry: {file_id}")
-        self._save_to_disk()
 
     def get_file_definition(self, file_id: str) -> FileDefinition:
         """Retrieves the file definition for a given ID.
@@ -317,6 +496,7 @@ class JsonFileTracker:
         Raises:
             KeyError: If the file ID is not found.
         """
+        self._refresh()
         if file_id in self._inventory.keys():
             return self._inventory[file_id].model_copy()
 
@@ -348,33 +528,33 @@ class JsonFileTracker:
             KeyError: If the current ID is not found.
             IndexError: If new_id already exists in the inventory.
         """
-        source_id = file_id
-        if file_id not in self._inventory:
-            raise KeyError(f"Unknown ID: {file_id}")
-        entry = self._inventory[file_id].model_copy()
-
-        if new_tags is not None:
-            entry.tags = new_tags
-        if new_description is not None:
-            entry.description = new_description
-        if new_extended_metadata is not None:
-            entry.extended_metadata = new_extended_metadata
-
-        if new_id is not None and new_id != file_id:
-            if new_id in self._inventory:
-                raise IndexError(f"ID '{new_id}' already exists")
-            entry.file_id = new_id
-            del self._inventory[file_id]
-            self._inventory[new_id] = entry
-            self._save_to_disk()
-            return new_id
-
-        self._inventory[file_id] = entry
-        self._save_to_disk()
-        if new_id is not None:
-            if new_id != source_id:
-                self.logger.info("Changed id from %s to %s", source_id, new_id)
-        return file_id
+        def _apply(inventory: dict[str, FileDefinition]) -> str:
+            if file_id not in inventory:
+                raise KeyError(f"Unknown ID: {file_id}")
+            entry = inventory[file_id].model_copy()
+
+            if new_tags is not None:
+                entry.tags = new_tags
+            if new_description is not None:
+                entry.description = new_description
+            if new_extended_metadata is not None:
+                entry.extended_metadata = new_extended_metadata
+
+            if new_id is not None and new_id != file_id:
+                if new_id in inventory:
+                    raise IndexError(f"ID '{new_id}' already exists")
+                entry.file_id = new_id
+                del inventory[file_id]
+                inventory[new_id] = entry
+                return new_id
+
+            inventory[file_id] = entry
+            return file_id
+
+        result_id = self._update(_apply)
+        if result_id != file_id:
+            self.logger.info("Changed id from %s to %s", file_id, result_id)
+        return result_id
 
     def file_id_exists(self, file_id: str) -> bool:
         """Verifies if a specific ID exists in the inventory.
@@ -385,6 +565,7 @@ class JsonFileTracker:
         Returns:
             True if the ID exists in the system, False otherwise.
         """
+        self._refresh()
         if file_id in self._inventory.keys():
             return True
         return False
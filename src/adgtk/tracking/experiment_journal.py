@@ -2,7 +2,9 @@
 
 Stored at results/{experiment}/common/experiment_journal.json.
 The journal is mutable and researcher-authored; it is never touched
-by the framework run pipeline.
+by the framework run pipeline. Edits from the CLI, web UI and MCP server
+are merged under a file lock (see store.py), so concurrent notes are
+never lost.
 """
 
 from __future__ import annotations
@@ -15,6 +17,8 @@ from typing import Literal, Optional
 
 from pydantic import BaseModel
 
+from adgtk.tracking.store import locked_json
+
 JOURNAL_FILE = "experiment_journal.json"
 
 
@@ -50,9 +54,8 @@ def save_journal(
     common_folder: str,
 ) -> None:
     os.makedirs(common_folder, exist_ok=True)
-    path = _journal_path(common_folder)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump([e.model_dump() for e in entries], f, indent=2)
+    with locked_json(_journal_path(common_folder), default=[]) as doc:
+        doc.replace([e.model_dump() for e in entries])
 
 
 def add_entry(
@@ -64,7 +67,6 @@ def add_entry(
     tags: Optional[list[str]] = None,
     linked_run_id: Optional[str] = None,
 ) -> ExperimentJournalEntry:
-    entries = load_journal(common_folder)
     entry = ExperimentJournalEntry(
         entry_id=str(uuid.uuid4()),
         timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -73,15 +75,19 @@ def add_entry(
         tags=tags or [],
         linked_run_id=linked_run_id or None,
     )
-    entries.append(entry)
-    save_journal(entries, common_folder)
+    os.makedirs(common_folder, exist_ok=True)
+    with locked_json(_journal_path(common_folder), default=[]) as doc:
+        doc.replace(doc.data + [entry.model_dump()])
     return entry
 
 
 def delete_entry(entry_id: str, common_folder: str) -> bool:
-    entries = load_journal(common_folder)
-    filtered = [e for e in entries if e.entry_id != entry_id]
-    if len(filtered) == len(entries):
+    path = _journal_path(common_folder)
+    if not os.path.exists(path):
         return False
-    save_journal(filtered, common_folder)
+    with locked_json(path, default=[]) as doc:
+        filtered = [e for e in doc.data if e.get("entry_id") != entry_id]
+        if len(filtered) == len(doc.data):
+            return False
+        doc.replace(filtered)
     return True
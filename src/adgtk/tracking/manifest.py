@@ -5,32 +5,45 @@ It is the source of truth for the markdown report and the future web interface.
 
 Disk layout (written by runner.py):
   results/{run_id}/conclusion/run.manifest.json   ← canonical JSON
+  results/{run_id}/conclusion/run.summary.json    ← slim RunSummary sidecar
   results/{run_id}/conclusion/report.md            ← generated markdown view
 """
 
 from __future__ import annotations
 
 import csv
+import io
 import os
-from typing import Any, Literal
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Iterable, Literal, Optional, Union
 import numpy as np
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from adgtk.tracking.base import get_saved_series
 from adgtk.tracking.observations import AnyObservation, get_all, get_artifacts
 from adgtk.tracking.structure import (
     ArtifactEntry,
     ExperimentRunFolders,
     MetricSummary
 )
+from adgtk.utils.file import content_hash
 
 MANIFEST_FILE = "run.manifest.json"
+SUMMARY_FILE = "run.summary.json"
 REPORT_FILE = "report.md"
+_MAX_WORKERS = 8
 
 # ----------------------------------------------------------------------
 # RunManifest model
 # ----------------------------------------------------------------------
 
 
-class RunManifest(BaseModel):
+class RunSummary(BaseModel):
+    """The slim, fixed-schema facts a rollup needs from a run.
+
+    Everything in a RunManifest except the config snapshot, observations
+    and artifacts.
+    """
     manifest_version: str = "1.0"
 
     # identity
@@ -47,9 +60,6 @@ class RunManifest(BaseModel):
     verdict: Literal["pass", "fail", "inconclusive", "unknown"] = "unknown"
     verdict_note: str = ""
 
-    # full experiment YAML snapshotted at run time
-    config_snapshot: dict[str, Any]
-
     # from RunResult
     result_metrics: dict[str, Any] = {}
     summary: str = ""
@@ -60,55 +70,231 @@ class RunManifest(BaseModel):
     # computed from MetricTracker CSVs
     metric_summaries: dict[str, MetricSummary] = {}
 
+
+class RunManifest(RunSummary):
+    # full experiment YAML snapshotted at run time
+    config_snapshot: dict[str, Any]
+
     # researcher observations recorded during the run
     observations: list[AnyObservation] = []
 
     # files produced during the run
     artifacts: list[ArtifactEntry] = []
 
+    def to_summary(self) -> RunSummary:
+        """Return the slim rollup view of this manifest."""
+        return RunSummary.model_validate(
+            self.model_dump(include=set(RunSummary.model_fields))
+        )
+
+
+# ----------------------------------------------------------------------
+# Loading
+# ----------------------------------------------------------------------
+
+
+@lru_cache(maxsize=None)
+def _adapter(summary_only: bool) -> TypeAdapter:
+    """Return the cached TypeAdapter for full manifests or summaries."""
+    return TypeAdapter(RunSummary if summary_only else RunManifest)
+
+
+def load_manifest(
+    path: str,
+    summary_only: bool = False,
+) -> Optional[Union[RunManifest, RunSummary]]:
+    """Load a manifest file by validating its raw bytes directly.
+
+    Args:
+        path: Path to a run.manifest.json file.
+        summary_only: When True, return a RunSummary. The config snapshot,
+            observations and artifacts are skipped instead of validated.
+
+    Returns:
+        The loaded model, or None if the file is missing or invalid.
+    """
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        return _adapter(summary_only).validate_json(raw)
+    except (OSError, ValidationError):
+        return None
+
+
+def load_manifests(
+    paths: Iterable[str],
+    summary_only: bool = False,
+) -> list[Optional[Union[RunManifest, RunSummary]]]:
+    """Load many manifest files across a thread pool.
+
+    Args:
+        paths: Paths to run.manifest.json files.
+        summary_only: When True, load RunSummary objects only.
+
+    Returns:
+        One entry per path, in order, each None when the file is missing
+        or invalid.
+    """
+    paths = list(paths)
+    if len(paths) <= 1:
+        return [load_manifest(p, summary_only) for p in paths]
+    workers = min(_MAX_WORKERS, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(
+            lambda p: load_manifest(p, summary_only), paths))
+
+
+def load_run_summary(conclusion_folder: str) -> Optional[RunSummary]:
+    """Load the rollup facts of a run from its conclusion folder.
+
+    Reads the run.summary.json sidecar when it is present and not older
+    than the manifest, otherwise falls back to the manifest itself.
+
+    Args:
+        conclusion_folder: Path to the run's conclusion folder.
+
+    Returns:
+        The RunSummary, or None if neither file can be loaded.
+    """
+    summary_path = os.path.join(conclusion_folder, SUMMARY_FILE)
+    manifest_path = os.path.join(conclusion_folder, MANIFEST_FILE)
+    try:
+        sidecar_fresh = (
+            os.stat(summary_path).st_mtime_ns
+            >= os.stat(manifest_path).st_mtime_ns
+        )
+    except FileNotFoundError:
+        sidecar_fresh = os.path.exists(summary_path)
+    if sidecar_fresh:
+        summary = load_manifest(summary_path, summary_only=True)
+        if summary is not None:
+            return summary
+    return load_manifest(manifest_path, summary_only=True)
+
 
 # ----------------------------------------------------------------------
 # Builder
 # ----------------------------------------------------------------------
 
 
+_PERCENTILES = (25, 50, 75, 95)
+
+
+def _summarise(
+    label: str,
+    values: list,
+    digest: Optional[str],
+) -> Optional[MetricSummary]:
+    """Compute descriptive stats for one metric series.
+
+    Raises ValueError/TypeError when a value cannot be read as a float.
+    """
+    floats = [float(v) for v in values if str(v).strip()]
+    if not floats:
+        return None
+    arr = np.array(floats, dtype=float)
+    p25, p50, p75, p95 = np.percentile(arr, _PERCENTILES)
+    return MetricSummary(
+        label=label,
+        n=len(floats),
+        mean=float(np.mean(arr)),
+        std=float(np.std(arr)),
+        min=float(np.min(arr)),
+        max=float(np.max(arr)),
+        p25=float(p25),
+        p50=float(p50),
+        p75=float(p75),
+        p95=float(p95),
+        content_hash=digest,
+    )
+
+
+def _summarise_file(
+    fpath: str,
+    label: str,
+    previous: Optional[MetricSummary],
+) -> Optional[MetricSummary]:
+    """Summarise a single metric CSV, preferring memory over disk.
+
+    Values still held from MetricTracker.save_data are used directly. A
+    file whose content hash matches the previous summary is not parsed.
+    """
+    saved = get_saved_series(fpath)
+    if saved is not None:
+        digest, values = saved
+        if previous is not None and previous.content_hash == digest:
+            return previous
+        try:
+            return _summarise(label, values, digest)
+        except (TypeError, ValueError):
+            pass  # fall back to the written CSV
+
+    try:
+        with open(fpath, "rb") as f:
+            content = f.read()
+    except OSError:
+        return None
+    digest = content_hash(content)
+    if previous is not None and previous.content_hash == digest:
+        return previous
+
+    try:
+        text = content.decode("utf-8")
+        for row in csv.reader(io.StringIO(text, newline="")):
+            summary = _summarise(label, row, digest)
+            if summary is not None:
+                return summary  # one row per file
+    except (UnicodeDecodeError, ValueError, csv.Error):
+        pass
+    return None
+
+
 def _compute_metric_summaries(
     metrics_folder: str,
+    previous: Optional[dict[str, MetricSummary]] = None,
 ) -> dict[str, MetricSummary]:
     """Read all CSV files in the metrics folder and compute descriptive stats.
+
+    Files are summarised in parallel. Pass the summaries of an earlier
+    manifest as previous to skip files whose content has not changed.
     """
     summaries: dict[str, MetricSummary] = {}
     if not os.path.exists(metrics_folder):
         return summaries
 
-    for fname in os.listdir(metrics_folder):
-        if not fname.endswith(".csv"):
-            continue
-        label = fname[:-4]  # strip .csv
-        fpath = os.path.join(metrics_folder, fname)
-        try:
-            with open(fpath, newline="", encoding="utf-8") as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    values = [float(v) for v in row if v.strip()]
-                    if not values:
-                        continue
-                    arr = np.array(values, dtype=float)
-                    summaries[label] = MetricSummary(
-                        label=label,
-                        n=len(values),
-                        mean=float(np.mean(arr)),
-                        std=float(np.std(arr)),
-                        min=float(np.min(arr)),
-                        max=float(np.max(arr)),
-                    )
-                    break  # one row per file
-        except (ValueError, csv.Error):
-            pass
+    previous = previous or {}
+    labels = [
+        fname[:-4]  # strip .csv
+        for fname in sorted(os.listdir(metrics_folder))
+        if fname.endswith(".csv")
+    ]
+    if not labels:
+        return summaries
+
+    def _task(label: str) -> Optional[MetricSummary]:
+        fpath = os.path.join(metrics_folder, f"{label}.csv")
+        return _summarise_file(fpath, label, previous.get(label))
+
+    workers = min(_MAX_WORKERS, len(labels))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for label, summary in zip(labels, pool.map(_task, labels)):
+            if summary is not None:
+                summaries[label] = summary
 
     return summaries
 
 
+def _load_previous_summaries(
+    conclusion_folder: str,
+) -> dict[str, MetricSummary]:
+    """Return the metric summaries of an existing manifest, if any."""
+    manifest_path = os.path.join(conclusion_folder, MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        return {}
+    previous = load_manifest(manifest_path, summary_only=True)
+    return previous.metric_summaries if previous is not None else {}
+
+
 def build_manifest(
     run_id: str,
     experiment_name: str,
@@ -123,13 +309,18 @@ def build_manifest(
     summary: str,
     tags: dict[str, str],
     folders: ExperimentRunFolders,
+    previous_summaries: Optional[dict[str, MetricSummary]] = None,
 ) -> RunManifest:
     """Assemble a RunManifest from all run data.
 
     Reads observations and artifacts from the module-level state in
     observations.py, and computes metric summaries from the CSV files
-    written to folders.metrics.
+    written to folders.metrics. When previous_summaries is not given and
+    the conclusion folder already holds a manifest, its summaries are
+    reused for metric files that have not changed.
     """
+    if previous_summaries is None:
+        previous_summaries = _load_previous_summaries(folders.conclusion)
     return RunManifest(
         run_id=run_id,
         experiment_name=experiment_name,
@@ -143,7 +334,8 @@ def build_manifest(
         result_metrics=result_metrics,
         summary=summary,
         tags=tags,
-        metric_summaries=_compute_metric_summaries(folders.metrics),
+        metric_summaries=_compute_metric_summaries(
+            folders.metrics, previous=previous_summaries),
         observations=get_all(),
         artifacts=get_artifacts(),
     )
@@ -285,12 +477,19 @@ def generate_markdown(
         if exec_data:
             lines.append("### Step Execution")
             lines.append("")
-            lines.append("| Metric | Mean | Std | Min | Max | n |")
-            lines.append("|--------|-----:|----:|----:|----:|--:|")
+            lines.append(
+                "| Metric | Mean | Std | Min | p50 | p95 | Max | n |"
+            )
+            lines.append(
+                "|--------|-----:|----:|----:|----:|----:|----:|--:|"
+            )
             for label, s in exec_data:
+                p50 = "--" if s.p50 is None else f"{s.p50:.4f}"
+                p95 = "--" if s.p95 is None else f"{s.p95:.4f}"
                 lines.append(
                     f"| {label} | {s.mean:.4f} | {s.std:.4f} "
-                    f"| {s.min:.4f} | {s.max:.4f} | {s.n} |"
+                    f"| {s.min:.4f} | {p50} | {p95} | {s.max:.4f} "
+                    f"| {s.n} |"
                 )
             lines.append("")
 
@@ -446,13 +645,19 @@ def generate_markdown(
 
 
 def save(manifest: RunManifest, conclusion_folder: str) -> None:
-    """Write run.manifest.json and report.md to the conclusion folder."""
+    """Write run.manifest.json, run.summary.json and report.md to the
+    conclusion folder."""
     from adgtk.tracking.researcher_notes import load_notes
 
     manifest_path = os.path.join(conclusion_folder, MANIFEST_FILE)
     with open(manifest_path, "w", encoding="utf-8") as f:
         f.write(manifest.model_dump_json(indent=2))
 
+    # written after the manifest so load_run_summary sees it as fresh
+    summary_path = os.path.join(conclusion_folder, SUMMARY_FILE)
+    with open(summary_path, "w", encoding="utf-8") as f:
+        f.write(manifest.to_summary().model_dump_json())
+
     notes = load_notes(conclusion_folder)
     report_path = os.path.join(conclusion_folder, REPORT_FILE)
     with open(report_path, "w", encoding="utf-8") as f:
@@ -0,0 +1,627 @@
+"""metric_store.py — columnar cross-run metric store for an experiment.
+
+Every run writes one CSV per metric label into its own metrics folder,
+so comparing a label across runs used to mean opening one file per run.
+At finalization the runner also appends each label's values to an
+experiment-level store, and cross-run queries become a single
+memory-mapped read per label.
+
+Disk layout:
+  results/{experiment_name}/common/metric_store/index.json
+  results/{experiment_name}/common/metric_store/{label}.f64
+
+Each ``{label}.f64`` file holds the raw little-endian float64 values of
+every stored run, back to back. The index records, per label, the run_id,
+start offset and value count of each run. Re-appending a run replaces its
+index entry; the old values stay in the file but are no longer reachable.
+
+Step bands: per-step series such as ``agent.latency`` can be aggregated
+across runs, aligned by step index, into a mean, a 95% confidence band and
+percentile bands. The result is cached under ``metric_store/bands/``.
+Bands over every stored run of a label live in ``{label}.npz``, whose
+in-file key is replaced as runs are added. Bands over a subset of the
+runs get their own ``{label}.{hash}.npz``; only the MAX_BAND_SUBSETS most
+recently used of those are kept per label.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import numpy as np
+from pydantic import BaseModel, ValidationError
+
+from adgtk.tracking.base import get_saved_series
+from adgtk.tracking.store import file_lock
+from adgtk.tracking.structure import MetricSummary
+from adgtk.utils.defaults import EXP_RESULTS_FOLDER
+from adgtk.utils.file import content_hash
+
+STORE_DIR = "metric_store"
+INDEX_FILE = "index.json"
+VALUES_SUFFIX = ".f64"
+STORE_VERSION = 1
+BANDS_DIR = "bands"
+BAND_PERCENTILES = (5, 25, 50, 75, 95)
+# subset-selection band files kept per label
+MAX_BAND_SUBSETS = 8
+_DTYPE = np.dtype("<f8")
+_Z95 = 1.959964
+
+# ----------------------------------------------------------------------
+# Models
+# ----------------------------------------------------------------------
+
+
+class StoredRun(BaseModel):
+    """Location of one run's values inside a label's values file."""
+    run_id: str
+    offset: int
+    count: int
+
+
+class MetricStoreIndex(BaseModel):
+    """The on-disk index of an experiment's metric store."""
+    version: int = STORE_VERSION
+    labels: dict[str, list[StoredRun]] = {}
+
+
+@dataclass
+class RaggedMetric:
+    """One metric label across runs, as ragged arrays.
+
+    The values of run i are ``values[offsets[i]:offsets[i + 1]]``. When the
+    stored runs are contiguous on disk, values is a view of the
+    memory-mapped file and nothing is copied.
+    """
+    label: str
+    run_ids: list[str]
+    values: np.ndarray
+    offsets: np.ndarray
+    _position: dict[str, int] = field(
+        init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._position = {rid: i for i, rid in enumerate(self.run_ids)}
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Number of values per run."""
+        return np.diff(self.offsets)
+
+    def run(self, run_id: str) -> np.ndarray:
+        """Return the values of a single run.
+
+        Raises:
+            KeyError: If the run is not in the store for this label.
+        """
+        idx = self._position[run_id]
+        return self.values[self.offsets[idx]:self.offsets[idx + 1]]
+
+    def select(self, run_ids: list[str]) -> "RaggedMetric":
+        """Return a RaggedMetric restricted to the given runs, in order.
+
+        Runs that are not stored are skipped.
+        """
+        keep = [rid for rid in run_ids if rid in self._position]
+        parts = [self.run(rid) for rid in keep]
+        lengths = np.array([len(p) for p in parts], dtype=np.int64)
+        offsets = np.zeros(len(keep) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        values = (
+            np.concatenate(parts) if parts else np.empty(0, dtype=_DTYPE))
+        return RaggedMetric(self.label, keep, values, offsets)
+
+    def to_matrix(self, fill: float = np.nan) -> np.ndarray:
+        """Return a run × step matrix, padding short runs with fill."""
+        lengths = self.lengths
+        width = int(lengths.max()) if len(lengths) else 0
+        matrix = np.full((len(self.run_ids), width), fill, dtype=float)
+        mask = np.arange(width) < lengths[:, None]
+        matrix[mask] = self.values
+        return matrix
+
+
+@dataclass
+class StepBands:
+    """A metric aggregated across runs, aligned by step index.
+
+    Every array has one entry per step in ``steps``. ``count`` is the
+    number of runs that reached the step; shorter runs do not contribute
+    to the steps they never reached.
+    """
+    label: str
+    run_count: int
+    steps: np.ndarray
+    count: np.ndarray
+    mean: np.ndarray
+    ci_low: np.ndarray
+    ci_high: np.ndarray
+    percentiles: dict[int, np.ndarray]
+
+    def downsample(self, max_points: int) -> "StepBands":
+        """Return every k-th step so that at most max_points remain."""
+        n = len(self.steps)
+        if max_points <= 0 or n <= max_points:
+            return self
+        idx = np.linspace(0, n - 1, max_points).round().astype(np.int64)
+        return StepBands(
+            label=self.label,
+            run_count=self.run_count,
+            steps=self.steps[idx],
+            count=self.count[idx],
+            mean=self.mean[idx],
+            ci_low=self.ci_low[idx],
+            ci_high=self.ci_high[idx],
+            percentiles={q: v[idx] for q, v in self.percentiles.items()},
+        )
+
+    def to_dict(self) -> dict:
+        """Return a JSON-serialisable view, e.g. for the web charts."""
+        return {
+            "label": self.label,
+            "run_count": self.run_count,
+            "steps": self.steps.tolist(),
+            "count": self.count.tolist(),
+            "mean": self.mean.tolist(),
+            "ci_low": self.ci_low.tolist(),
+            "ci_high": self.ci_high.tolist(),
+            "percentiles": {
+                str(q): v.tolist() for q, v in self.percentiles.items()},
+        }
+
+
+# ----------------------------------------------------------------------
+# Internal helpers
+# ----------------------------------------------------------------------
+
+
+def _store_folder(experiment_name: str) -> str:
+    return os.path.join(
+        EXP_RESULTS_FOLDER, experiment_name, "common", STORE_DIR)
+
+
+def _values_path(store_folder: str, label: str) -> str:
+    return os.path.join(store_folder, f"{label}{VALUES_SUFFIX}")
+
+
+def _load_index(store_folder: str) -> MetricStoreIndex:
+    index_path = os.path.join(store_folder, INDEX_FILE)
+    if not os.path.exists(index_path):
+        return MetricStoreIndex()
+    try:
+        with open(index_path, "rb") as f:
+            index = MetricStoreIndex.model_validate_json(f.read())
+    except (OSError, ValidationError):
+        return MetricStoreIndex()
+    if index.version != STORE_VERSION:
+        return MetricStoreIndex()
+    return index
+
+
+def _save_index(store_folder: str, index: MetricStoreIndex) -> None:
+    index_path = os.path.join(store_folder, INDEX_FILE)
+    tmp_path = f"{index_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(index.model_dump_json())
+    os.replace(tmp_path, index_path)
+
+
+def _read_series(fpath: str) -> Optional[np.ndarray]:
+    """Read one metric CSV as float64, preferring in-memory values.
+
+    Returns None when the file holds no numeric row.
+    """
+    saved = get_saved_series(fpath)
+    rows: list[list] = []
+    if saved is not None:
+        rows = [saved[1]]
+    else:
+        try:
+            with open(fpath, newline="", encoding="utf-8") as f:
+                rows = list(csv.reader(io.StringIO(f.read())))
+        except (OSError, UnicodeDecodeError, csv.Error):
+            return None
+    for row in rows:
+        try:
+            values = [float(v) for v in row if str(v).strip()]
+        except (TypeError, ValueError):
+            return None
+        if values:
+            return np.asarray(values, dtype=_DTYPE)
+    return None
+
+
+def _append_to_store(
+    store_folder: str,
+    index: MetricStoreIndex,
+    run_id: str,
+    metrics_folder: str,
+) -> int:
+    """Append a run's values files and update index in place.
+
+    Callers hold the lock on the store's index file.
+    """
+    if not os.path.isdir(metrics_folder):
+        return 0
+    os.makedirs(store_folder, exist_ok=True)
+    stored = 0
+    for fname in sorted(os.listdir(metrics_folder)):
+        if not fname.endswith(".csv"):
+            continue
+        label = fname[:-4]
+        values = _read_series(os.path.join(metrics_folder, fname))
+        if values is None:
+            continue
+        with open(_values_path(store_folder, label), "ab") as f:
+            offset = f.tell() // _DTYPE.itemsize
+            f.write(values.tobytes())
+        runs = [
+            r for r in index.labels.get(label, []) if r.run_id != run_id]
+        runs.append(
+            StoredRun(run_id=run_id, offset=offset, count=len(values)))
+        index.labels[label] = runs
+        stored += 1
+    return stored
+
+
+# ----------------------------------------------------------------------
+# Public API
+# ----------------------------------------------------------------------
+
+
+def append_run(
+    experiment_name: str,
+    run_id: str,
+    metrics_folder: str,
+) -> int:
+    """Append every metric CSV of a run to the experiment's store.
+
+    Called by the runner at finalization. Appending a run that is already
+    stored replaces its entry.
+
+    Args:
+        experiment_name: The experiment the run belongs to.
+        run_id: The run identifier (its folder name).
+        metrics_folder: The run's metrics folder.
+
+    Returns:
+        The number of labels stored.
+    """
+    store_folder = _store_folder(experiment_name)
+    with file_lock(os.path.join(store_folder, INDEX_FILE)):
+        index = _load_index(store_folder)
+        stored = _append_to_store(
+            store_folder, index, run_id, metrics_folder)
+        if stored:
+            _save_index(store_folder, index)
+    return stored
+
+
+def list_labels(experiment_name: str) -> list[str]:
+    """Return the metric labels held in an experiment's store."""
+    return sorted(_load_index(_store_folder(experiment_name)).labels)
+
+
+def stored_run_ids(experiment_name: str, label: str) -> list[str]:
+    """Return the runs stored for a label, in append order."""
+    index = _load_index(_store_folder(experiment_name))
+    return [r.run_id for r in index.labels.get(label, [])]
+
+
+def load_metric(
+    experiment_name: str,
+    label: str,
+) -> Optional[RaggedMetric]:
+    """Load one metric label across all stored runs.
+
+    Args:
+        experiment_name: The experiment to query.
+        label: The metric label, e.g. ``agent.latency``.
+
+    Returns:
+        The RaggedMetric, or None if the label is not stored.
+    """
+    store_folder = _store_folder(experiment_name)
+    runs = _load_index(store_folder).labels.get(label)
+    values_path = _values_path(store_folder, label)
+    if not runs or not os.path.exists(values_path):
+        return None
+
+    mm = np.memmap(values_path, dtype=_DTYPE, mode="r")
+    starts = np.array([r.offset for r in runs], dtype=np.int64)
+    counts = np.array([r.count for r in runs], dtype=np.int64)
+    if int(starts[-1] + counts[-1]) > len(mm):
+        return None  # index points past the values file
+
+    offsets = np.zeros(len(runs) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    contiguous = np.array_equal(starts[1:], starts[:-1] + counts[:-1])
+    if contiguous:
+        values = mm[starts[0]:starts[0] + offsets[-1]]
+    else:
+        values = np.concatenate(
+            [mm[s:s + c] for s, c in zip(starts, counts)])
+    return RaggedMetric(label, [r.run_id for r in runs], values, offsets)
+
+
+def load_run_series(
+    experiment_name: str,
+    run_id: str,
+    prefix: str = "",
+) -> dict[str, list[float]]:
+    """Return the stored values of one run for every matching label.
+
+    Args:
+        experiment_name: The experiment to query.
+        run_id: The run identifier.
+        prefix: Only labels starting with this prefix are returned.
+
+    Returns:
+        Mapping of label to values. Empty when the run is not stored.
+    """
+    series: dict[str, list[float]] = {}
+    index = _load_index(_store_folder(experiment_name))
+    for label, runs in sorted(index.labels.items()):
+        if not label.startswith(prefix):
+            continue
+        if not any(r.run_id == run_id for r in runs):
+            continue
+        metric = load_metric(experiment_name, label)
+        if metric is not None:
+            series[label] = metric.run(run_id).tolist()
+    return series
+
+
+def sync_metric_store(experiment_name: str) -> int:
+    """Backfill runs recorded before the store existed.
+
+    Args:
+        experiment_name: The experiment to sync.
+
+    Returns:
+        The number of runs appended.
+    """
+    exp_path = os.path.join(EXP_RESULTS_FOLDER, experiment_name)
+    if not os.path.isdir(exp_path):
+        return 0
+    store_folder = _store_folder(experiment_name)
+    appended = 0
+    with file_lock(os.path.join(store_folder, INDEX_FILE)):
+        index = _load_index(store_folder)
+        known = {r.run_id for runs in index.labels.values() for r in runs}
+        for run_id in sorted(os.listdir(exp_path)):
+            if run_id == "common" or run_id in known:
+                continue
+            metrics_folder = os.path.join(exp_path, run_id, "metrics")
+            if _append_to_store(
+                    store_folder, index, run_id, metrics_folder):
+                appended += 1
+        if appended:
+            _save_index(store_folder, index)
+    return appended
+
+
+def pooled_summaries(
+    experiment_name: str,
+    run_labels: dict[str, list[str]],
+) -> dict[str, MetricSummary]:
+    """Descriptive stats over all samples of each label, pooled across runs.
+
+    A label is only summarised when the store holds every run that
+    reported it, so a partially backfilled store never yields misleading
+    numbers.
+
+    Args:
+        experiment_name: The experiment to query.
+        run_labels: Mapping of label to the run_ids that reported it.
+
+    Returns:
+        Mapping of label to its pooled MetricSummary.
+    """
+    pooled: dict[str, MetricSummary] = {}
+    for label, run_ids in run_labels.items():
+        metric = load_metric(experiment_name, label)
+        if metric is None or not set(run_ids) <= set(metric.run_ids):
+            continue
+        arr = metric.select(run_ids).values
+        if len(arr) == 0:
+            continue
+        p25, p50, p75, p95 = np.percentile(arr, (25, 50, 75, 95))
+        pooled[label] = MetricSummary(
+            label=label,
+            n=len(arr),
+            mean=float(np.mean(arr)),
+            std=float(np.std(arr)),
+            min=float(np.min(arr)),
+            max=float(np.max(arr)),
+            p25=float(p25),
+            p50=float(p50),
+            p75=float(p75),
+            p95=float(p95),
+        )
+    return pooled
+
+
+# ----------------------------------------------------------------------
+# Step-aligned aggregation
+# ----------------------------------------------------------------------
+
+
+def _compute_bands(
+    metric: RaggedMetric,
+    percentiles: tuple[int, ...],
+) -> StepBands:
+    """Aggregate a RaggedMetric per step with whole-array operations."""
+    lengths = metric.lengths
+    width = int(lengths.max()) if len(lengths) else 0
+    # runs that reached step s: those with length > s
+    count = len(lengths) - np.searchsorted(
+        np.sort(lengths), np.arange(width), side="right")
+
+    matrix = metric.to_matrix()
+    total = np.nansum(matrix, axis=0)
+    mean = total / count
+    sq_dev = np.nansum((matrix - mean) ** 2, axis=0)
+    std = np.sqrt(sq_dev / np.maximum(count - 1, 1))
+    half = _Z95 * std / np.sqrt(count)
+
+    # np.sort puts NaN last, so each column's valid values come first
+    matrix.sort(axis=0)
+    cols = np.arange(width)
+    bands: dict[int, np.ndarray] = {}
+    for q in percentiles:
+        pos = (q / 100.0) * (count - 1)
+        lo = np.floor(pos).astype(np.int64)
+        hi = np.minimum(lo + 1, count - 1)
+        frac = pos - lo
+        bands[q] = (
+            matrix[lo, cols] * (1.0 - frac) + matrix[hi, cols] * frac)
+
+    return StepBands(
+        label=metric.label,
+        run_count=len(metric.run_ids),
+        steps=cols,
+        count=count.astype(np.int64),
+        mean=mean,
+        ci_low=mean - half,
+        ci_high=mean + half,
+        percentiles=bands,
+    )
+
+
+def _bands_key(
+    runs: list[StoredRun],
+    percentiles: tuple[int, ...],
+) -> str:
+    parts = [f"{r.run_id}:{r.offset}:{r.count}" for r in runs]
+    parts.append(",".join(str(q) for q in percentiles))
+    return content_hash("\n".join(parts).encode("utf-8"))
+
+
+def _bands_path(
+    store_folder: str,
+    label: str,
+    runs: Optional[list[StoredRun]] = None,
+) -> str:
+    """Cache file for a label: all its runs, or the given subset."""
+    folder = os.path.join(store_folder, BANDS_DIR)
+    if runs is None:
+        return os.path.join(folder, f"{label}.npz")
+    digest = content_hash("\n".join(r.run_id for r in runs).encode("utf-8"))
+    return os.path.join(folder, f"{label}.{digest}.npz")
+
+
+def _evict_subset_bands(store_folder: str, label: str) -> None:
+    """Keep only the MAX_BAND_SUBSETS newest subset files of a label."""
+    folder = os.path.join(store_folder, BANDS_DIR)
+    pattern = re.compile(re.escape(label) + r"\.[0-9a-f]{32}\.npz")
+    try:
+        with os.scandir(folder) as it:
+            entries = [(d.stat().st_mtime_ns, d.path) for d in it
+                       if pattern.fullmatch(d.name)]
+    except FileNotFoundError:
+        return
+    for _, path in sorted(entries, reverse=True)[MAX_BAND_SUBSETS:]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _load_cached_bands(path: str, key: str) -> Optional[StepBands]:
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if str(data["key"]) != key:
+                return None
+            qs = [int(q) for q in data["qs"]]
+            return StepBands(
+                label=str(data["label"]),
+                run_count=int(data["run_count"]),
+                steps=data["steps"],
+                count=data["count"],
+                mean=data["mean"],
+                ci_low=data["ci_low"],
+                ci_high=data["ci_high"],
+                percentiles={q: data[f"p{q}"] for q in qs},
+            )
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _save_cached_bands(path: str, key: str, bands: StepBands) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+    arrays: dict[str, Any] = {
+        "key": np.array(key),
+        "label": np.array(bands.label),
+        "run_count": np.array(bands.run_count),
+        "steps": bands.steps,
+        "count": bands.count,
+        "mean": bands.mean,
+        "ci_low": bands.ci_low,
+        "ci_high": bands.ci_high,
+        "qs": np.array(list(bands.percentiles), dtype=np.int64),
+    }
+    for q, v in bands.percentiles.items():
+        arrays[f"p{q}"] = v
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+
+
+def step_bands(
+    experiment_name: str,
+    label: str,
+    run_ids: Optional[list[str]] = None,
+    percentiles: tuple[int, ...] = BAND_PERCENTILES,
+    use_cache: bool = True,
+) -> Optional[StepBands]:
+    """Aggregate a per-step metric across runs, aligned by step index.
+
+    Args:
+        experiment_name: The experiment to query.
+        label: The metric label, e.g. ``agent.latency``.
+        run_ids: Restrict to these runs. Defaults to every stored run.
+        percentiles: The percentile bands to compute.
+        use_cache: Reuse and update the on-disk cache for this run set.
+
+    Returns:
+        The StepBands, or None if no selected run stores the label.
+    """
+    store_folder = _store_folder(experiment_name)
+    stored = [r for r in _load_index(store_folder).labels.get(label, [])
+              if r.count > 0]
+    runs = stored
+    if run_ids is not None:
+        wanted = set(run_ids)
+        runs = [r for r in stored if r.run_id in wanted]
+    if not runs:
+        return None
+
+    key = _bands_key(runs, tuple(percentiles))
+    subset = len(runs) < len(stored)
+    cache_path = _bands_path(store_folder, label, runs if subset else None)
+    if use_cache:
+        cached = _load_cached_bands(cache_path, key)
+        if cached is not None:
+            if subset:
+                os.utime(cache_path)  # mark as recently used
+            return cached
+
+    metric = load_metric(experiment_name, label)
+    if metric is None:
+        return None
+    metric = metric.select([r.run_id for r in runs])
+    bands = _compute_bands(metric, tuple(percentiles))
+    if use_cache:
+        _save_cached_bands(cache_path, key, bands)
+        if subset:
+            _evict_subset_bands(store_folder, label)
+    return bands
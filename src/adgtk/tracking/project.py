@@ -33,14 +33,20 @@ from adgtk.tracking.structure import (
     PrefixModel)
 from adgtk.utils.defaults import EXP_DEF_DIR
 from pydantic import BaseModel, ValidationError
-import yaml
 import uuid
-from typing import Optional, Literal
+from typing import Callable, Literal, Optional, TypeVar
 import secrets
-import json
 import datetime
 import copy
 from adgtk.utils import create_logger
+from adgtk.tracking.blueprints import list_blueprints
+from adgtk.tracking.store import (
+    atomic_write,
+    file_lock,
+    file_stamp,
+    locked_json,
+    read_json,
+)
 
 # Set up module-specific logger
 _logger = create_logger(
@@ -59,18 +65,44 @@ _prefix_entries: dict[str, BaseModel] = {}
 _available_experiments: list[AvailableExperimentModel] = []
 
 PROJECT_LOG_FILE = "project.json"
+RUN_COUNTER_DIR = "run_ids"
 PROJECT_PREFIX_FILE = "prefix.json"
 AVAILABLE_FILE = "available.experiments.json"
 COMPLETED_FILE = "completed.experiments.json"
+_MAX_RUN_ID_ATTEMPTS = 100
 # control
 _log_loaded: bool = False
+_log_stamp: Optional[tuple[int, int]] = None
 _prefix_loaded: bool = False
 
+T = TypeVar("T")
+
 # ----------------------------------------------------------------------
 # Helper functions
 # ----------------------------------------------------------------------
 
 
+def _prefix_file() -> str:
+    return os.path.join(TRACKING_FOLDER, PROJECT_PREFIX_FILE)
+
+
+def _parse_prefixes(data: dict, file_w_path: str) -> dict[str, PrefixModel]:
+    """Converts the raw prefix file contents into PrefixModels.
+
+    Raises:
+        ValueError: If the prefix file is corrupt.
+    """
+    entries: dict[str, PrefixModel] = {}
+    for k, v in data.items():
+        try:
+            entries[k] = PrefixModel(**v)
+        except ValidationError:
+            msg = f"Corrupt {file_w_path} prefix file."
+            _logger.error(msg)
+            raise ValueError(msg)
+    return entries
+
+
 def _load_prefix_file():
     """Loads the prefix file from disk
 
@@ -78,33 +110,41 @@ def _load_prefix_file():
         ValueError: If the prefix file is corrupt.
     """
     global _prefix_loaded
-    file_w_path = os.path.join(TRACKING_FOLDER, PROJECT_PREFIX_FILE)
+    file_w_path = _prefix_file()
     os.makedirs(TRACKING_FOLDER, exist_ok=True)
-    if os.path.exists(file_w_path):
-        with open(file=file_w_path, mode="r", encoding="utf-8") as infile:
-            tmp = json.load(infile)
-
-        for k, v in tmp.items():
-            try:
-                _prefix_entries[k] = PrefixModel(**v)
-            except ValidationError:
-                msg = f"Corrupt {file_w_path} prefix file."
-                _logger.error(msg)
-                raise ValueError(msg)
+    entries = _parse_prefixes(read_json(file_w_path, default={}), file_w_path)
+    _prefix_entries.clear()
+    _prefix_entries.update(entries)
 
     _prefix_loaded = True
     _logger.info(f"Loaded prefix_file: {file_w_path}")
 
 
-def _save_prefix_file():
-    """Saves the prefix data to disk."""
-    file_w_path = os.path.join(TRACKING_FOLDER, PROJECT_PREFIX_FILE)
-    os.makedirs(TRACKING_FOLDER, exist_ok=True)
+def _update_prefixes(change: Callable[[dict[str, PrefixModel]], T]) -> T:
+    """Applies change to the on-disk prefix file under lock.
+
+    The file is re-read under the lock, change mutates the fresh entries
+    and the result is written back atomically, so concurrent name
+    generation never hands out the same counter twice.
 
-    prefix_dict = {k: v.model_dump() for k, v in _prefix_entries.items()}
-    with open(file=file_w_path, mode="w", encoding="utf-8") as outfile:
-        json.dump(prefix_dict, outfile)
-        _logger.info(f"Saved prefix_file: {file_w_path}")
+    Args:
+        change: Mutates the prefix entries in place and returns a result.
+
+    Returns:
+        Whatever change returned.
+    """
+    global _prefix_loaded
+    file_w_path = _prefix_file()
+    os.makedirs(TRACKING_FOLDER, exist_ok=True)
+    with locked_json(file_w_path, default={}, indent=None) as doc:
+        entries = _parse_prefixes(doc.data, file_w_path)
+        result = change(entries)
+        doc.replace({k: v.model_dump() for k, v in entries.items()})
+    _prefix_entries.clear()
+    _prefix_entries.update(entries)
+    _prefix_loaded = True
+    _logger.info(f"Saved prefix_file: {file_w_path}")
+    return result
 
 
 def _load_log(clear_existing: bool = False, ok_to_create: bool = True):
@@ -122,9 +162,9 @@ def _load_log(clear_existing: bool = False, ok_to_create: bool = True):
         ValueError: If the log file is missing and ok_to_create is False.
     """
 
-    global _log, _log_loaded    # pylint: disable=global-statement
+    global _log, _log_loaded, _log_stamp  # pylint: disable=global-statement
 
-    file_w_path = os.path.join(TRACKING_FOLDER, PROJECT_LOG_FILE)
+    file_w_path = _log_file()
     if not os.path.exists(file_w_path):
         if not ok_to_create:
             msg = f"missing_project_log_file: {file_w_path}. unable to load"
@@ -133,12 +173,13 @@ def _load_log(clear_existing: bool = False, ok_to_create: bool = True):
 
         # creating the logfile
         os.makedirs(TRACKING_FOLDER, exist_ok=True)
-        with open(file_w_path, "w", encoding="utf-8") as f:
-            f.write("[]")
-            _logger.info(f"Creating project logfile: {file_w_path}")
+        with locked_json(file_w_path, default=[]) as doc:
+            if not os.path.exists(file_w_path):
+                doc.replace([])
+                _logger.info(f"Creating project logfile: {file_w_path}")
 
-    with open(file=file_w_path, mode="r", encoding="utf-8") as infile:
-        data = json.load(infile)
+    stamp = file_stamp(file_w_path)
+    data = read_json(file_w_path, default=[])
 
     # clear the _log.
     if clear_existing:
@@ -146,31 +187,61 @@ def _load_log(clear_existing: bool = False, ok_to_create: bool = True):
             _logger.warning("cleared entries in performance log due to load")
         _log = []
     # now convert data back to ExperimentEntryModel
+    _log.extend(_parse_log(data))
+    _log_stamp = stamp
+
+    _logger.info("Loaded project log from %s", file_w_path)
+    _log_loaded = True
+
+
+def _log_file() -> str:
+    return os.path.join(TRACKING_FOLDER, PROJECT_LOG_FILE)
+
+
+def _parse_log(data: list) -> list[ExperimentEntryModel]:
     try:
-        for entry in data:
-            _log.append(ExperimentEntryModel(**entry))
+        return [ExperimentEntryModel(**entry) for entry in data]
     except ValidationError as e:
         msg = f"Corrupt project journal: {e}"
         _logger.error(msg)
         raise
 
-    _logger.info("Loaded project log from %s", file_w_path)
-    _log_loaded = True
 
+def _refresh_log():
+    """Loads the log, or reloads it if another process changed it."""
+    if not _log_loaded:
+        _load_log(clear_existing=False)
+    elif file_stamp(_log_file()) != _log_stamp:
+        _load_log(clear_existing=True)
 
-def _save_log():
-    """Saves the log to disk."""
 
-    file_w_path = os.path.join(TRACKING_FOLDER, PROJECT_LOG_FILE)
-    os.makedirs(TRACKING_FOLDER, exist_ok=True)
+def _update_log(
+    change: Callable[[list[ExperimentEntryModel]], bool],
+) -> bool:
+    """Applies change to the on-disk project log under lock.
 
-    log_as_dict = [entry.model_dump() for entry in _log]
+    Args:
+        change: Mutates the freshly read entries in place and returns
+          True when they should be written back.
 
-    # Now write to JSON
-    with open(file=file_w_path, mode='w', encoding="utf-8") as outfile:
-        json.dump(log_as_dict, outfile, indent=2)
+    Returns:
+        True if the log was rewritten.
+    """
+    global _log, _log_loaded, _log_stamp  # pylint: disable=global-statement
 
-    _logger.info("Saved project log to %s", file_w_path)
+    file_w_path = _log_file()
+    os.makedirs(TRACKING_FOLDER, exist_ok=True)
+    with locked_json(file_w_path, default=[]) as doc:
+        entries = _parse_log(doc.data)
+        changed = change(entries)
+        if changed:
+            doc.replace([entry.model_dump() for entry in entries])
+    _log = entries
+    _log_stamp = file_stamp(file_w_path)
+    _log_loaded = True
+    if changed:
+        _logger.info("Saved project log to %s", file_w_path)
+    return changed
 
 
 def _refresh_using_blueprints():
@@ -178,31 +249,18 @@ def _refresh_using_blueprints():
     refresh the internal tracking by deleting all current entries and by
     processing each file in this directory repopulate the tracking data.
 
+    Blueprints are read through the cached blueprint index, so only
+    files that changed since the last refresh are parsed again.
+
     It does not modify the prefix tracking, only the experiment
     inventory.
     """
     global _available_experiments
-    _available_experiments = []
-    files = os.listdir(EXP_DEF_DIR)
-    files_w_path = [os.path.join(EXP_DEF_DIR, file) for file in files]
-    for file in files_w_path:
-        with open(file=file, mode="r", encoding="utf-8") as infile:
-            try:
-                file_data = yaml.safe_load(infile)
-            except yaml.YAMLError:
-                _logger.error(f"Unable to process {file} on refresh.")
-                continue
-
-            name = os.path.basename(file).removesuffix(".yaml")
-            try:
-                entry = AvailableExperimentModel(
-                    name=name,
-                    description=file_data["description"])
-            except KeyError:
-                _logger.error(f"missing required keys for {file}")
-                continue
-
-            _available_experiments.append(entry)
+    _available_experiments = [
+        AvailableExperimentModel(
+            name=entry.name, description=entry.description or "")
+        for entry in list_blueprints(EXP_DEF_DIR)
+    ]
 
 
 # ----------------------------------------------------------------------
@@ -220,8 +278,7 @@ def get_entries_by_name(name: str) -> list[ExperimentEntryModel]:
     Returns:
         list[ExperimentEntryModel]: A list of all entries found.
     """
-    if not _log_loaded:
-        _load_log(clear_existing=False)
+    _refresh_log()
 
     found = []
     for entry in _log:
@@ -287,9 +344,6 @@ def add_entry(
     Raises:
         KeyError: If an entry with the same ID already exists.
     """
-    if not _log_loaded:
-        _load_log(clear_existing=False)
-
     if request_prefix_registration:
         # Provide a bit of convience in scenarios to save the user a step.
         splits = entry.name.split(register_prefix_delimiter)
@@ -315,13 +369,17 @@ def add_entry(
 
     if entry.id is None:
         entry.id = str(uuid.uuid4())
-    if id_exists(experiment_id=entry.id):
-        msg = f"ID {entry.id} already in log."
-        raise KeyError(msg)
-    _log.append(entry)
+
+    def _add(entries: list[ExperimentEntryModel]) -> bool:
+        # checked against the log as re-read under the lock
+        if any(e.id == entry.id for e in entries):
+            msg = f"ID {entry.id} already in log."
+            raise KeyError(msg)
+        entries.append(entry)
+        return True
+
+    _update_log(_add)
     _logger.info("Added entry for experiment: %s", entry.name)
-    # and always save
-    _save_log()
 
 
 def remove_entry(experiment_id: str) -> bool:
@@ -333,19 +391,15 @@ def remove_entry(experiment_id: str) -> bool:
     Returns:
         bool: True if able to remove from the log, False otherwise.
     """
-    to_remove: Optional[ExperimentEntryModel] = None
-
-    if not _log_loaded:
-        _load_log(clear_existing=False)
-
-    for entry in _log:
-        if entry.id == experiment_id:
-            to_remove = entry
-
-    if to_remove is not None:
-        _log.remove(to_remove)
-        _logger.info("Removed project entry id: %s", id)
-        _save_log()
+    def _remove(entries: list[ExperimentEntryModel]) -> bool:
+        for entry in entries:
+            if entry.id == experiment_id:
+                entries.remove(entry)
+                return True
+        return False
+
+    if _update_log(_remove):
+        _logger.info("Removed project entry id: %s", experiment_id)
         return True
 
     return False
@@ -369,20 +423,17 @@ def register_prefix(
         start_major (int): The counter for the next major. Defaults to 0.
         start_minor (int): The counter for the next minor. Defaults to 0.
     """
-    # load from disk
-    _load_prefix_file()
-
-    if prefix in _prefix_entries.keys():
-        msg = f"register_prefix failed. prefix= {prefix} already exists"
-        _logger.warning(msg)
-    else:
-        _prefix_entries[prefix] = PrefixModel(
-            prefix=prefix,
-            major_counter=start_major,
-            minor_counter=start_minor)
+    def _register(entries: dict[str, PrefixModel]) -> None:
+        if prefix in entries:
+            msg = f"register_prefix failed. prefix= {prefix} already exists"
+            _logger.warning(msg)
+        else:
+            entries[prefix] = PrefixModel(
+                prefix=prefix,
+                major_counter=start_major,
+                minor_counter=start_minor)
 
-        # and save
-        _save_prefix_file()
+    _update_prefixes(_register)
 
 
 def retire_prefix(prefix: str) -> None:
@@ -391,16 +442,13 @@ def retire_prefix(prefix: str) -> None:
     Args:
         prefix (str): The prefix to remove.
     """
-    # load from disk
-    _load_prefix_file()
+    def _retire(entries: dict[str, PrefixModel]) -> None:
+        if prefix in entries:
+            del entries[prefix]
+            msg = f"Removing prefix: {prefix}"
+            _logger.info(msg)
 
-    if prefix in _prefix_entries.keys():
-        del _prefix_entries[prefix]
-        msg = f"Removing prefix: {prefix}"
-        _logger.info(msg)
-
-    # and save
-    _save_prefix_file()
+    _update_prefixes(_retire)
 
 
 def get_prefix_list() -> list[str]:
@@ -418,25 +466,13 @@ def reset_prefix(prefix: str) -> None:
     Args:
         prefix (str): The prefix to reset.
     """
-    _load_prefix_file()
-
-    if prefix not in _prefix_entries.keys():
-        register_prefix(prefix=prefix)
+    def _reset(entries: dict[str, PrefixModel]) -> None:
+        entries[prefix] = PrefixModel(
+            prefix=prefix, major_counter=0, minor_counter=0)
 
-    entry = _prefix_entries[prefix]
-    if not isinstance(entry, PrefixModel) and isinstance(entry, dict):
-        try:
-            entry = PrefixModel(**entry)
-        except ValidationError:
-            msg = "corrupted prefix_entries"
-            _logger.error(msg)
-            raise ValueError(msg)
-    if isinstance(entry, PrefixModel):
-        entry.major_counter = 0
-        entry.minor_counter = 0
-        _save_prefix_file()
-        msg = f"Reset prefix {prefix}"
-        _logger.info(msg)
+    _update_prefixes(_reset)
+    msg = f"Reset prefix {prefix}"
+    _logger.info(msg)
 
 
 # ------------------------ generation ----------------------------------
@@ -453,39 +489,25 @@ def generate_experiment_name(
             Defaults to "minor".
 
     Raises:
-        ValueError: If the prefix entry is corrupted.
-        RuntimeError: If name generation fails.
+        ValueError: If the prefix file is corrupt.
 
     Returns:
         str: The name as prefix.major.minor.
     """
-    _load_prefix_file()
-
-    if prefix not in _prefix_entries.keys():
-        register_prefix(prefix=prefix)
-
-    entry = _prefix_entries[prefix]
-    if not isinstance(entry, PrefixModel) and isinstance(entry, dict):
-        try:
-            entry = PrefixModel(**entry)
-        except ValidationError:
-            msg = "corrupted prefix_entries"
-            _logger.error(msg)
-            raise ValueError(msg)
-
-    if isinstance(entry, PrefixModel):
+    def _next_name(entries: dict[str, PrefixModel]) -> str:
+        # register and increment in one locked step, so two processes
+        # can never be handed the same name
+        entry = entries.setdefault(
+            prefix, PrefixModel(prefix=prefix, major_counter=0,
+                                minor_counter=0))
         if update_next == "major":
             entry.major_counter += 1
             entry.minor_counter = 0
         else:
             entry.minor_counter += 1
-
-        _save_prefix_file()  # save before returning
         return f"{prefix}.{entry.major_counter}.{entry.minor_counter}"
 
-    msg = "failed to generate experiment name"
-    _logger.error(msg)
-    raise RuntimeError(msg)
+    return _update_prefixes(_next_name)
 
 
 def get_available_experiments() -> list[AvailableExperimentModel]:
@@ -502,6 +524,49 @@ def get_available_experiments() -> list[AvailableExperimentModel]:
 # Tracking of runs
 # ----------------------------------------------------------------------
 
+def _allocate_run_number(experiment_name: str, exp_root: str) -> int:
+    """Takes the next number from the experiment's locked run counter.
+
+    The counter lives in .tracking/run_ids/{experiment_name}.next. It is
+    seeded from the results folder the first time (or after the folder
+    was removed), so allocation stays O(1) however many runs exist.
+    """
+    counter_path = os.path.join(
+        TRACKING_FOLDER, RUN_COUNTER_DIR, f"{experiment_name}.next")
+    with file_lock(counter_path):
+        next_num: Optional[int] = None
+        if os.path.isdir(exp_root):
+            try:
+                with open(counter_path, "r", encoding="utf-8") as f:
+                    next_num = int(f.read().strip())
+            except (OSError, ValueError):
+                next_num = None
+        if next_num is None:
+            next_num = _scan_next_run_number(exp_root)
+        atomic_write(counter_path, str(next_num + 1))
+    return next_num
+
+
+def _scan_next_run_number(exp_root: str) -> int:
+    """Returns max(numeric run folder) + 1, the pre-counter behaviour."""
+    if not os.path.exists(exp_root):
+        msg = f"unable to inspect {exp_root} for next run_id"
+        _logger.warning(msg)
+        return 0
+    nums = [int(d) for d in os.listdir(exp_root) if d.isdigit()]
+    return (max(nums) + 1) if nums else 0
+
+
+def _reserve_run_dir(exp_root: str, run_id: str) -> bool:
+    """Atomically creates the run folder; False if it already exists."""
+    os.makedirs(exp_root, exist_ok=True)
+    try:
+        os.mkdir(os.path.join(exp_root, run_id))
+    except FileExistsError:
+        return False
+    return True
+
+
 def get_next_experiment_run_id(
     experiment_name: str,
     use_count: bool = True,
@@ -525,50 +590,34 @@ def get_next_experiment_run_id(
             to the run ID (format: YYYY-MM-DD_HH-MM-SS).
 
     Returns:
-        str: A string representing the next experiment run ID.
+        str: A string representing the next experiment run ID. The run
+            folder is created before returning, which reserves the ID
+            against other processes.
 
     Raises:
         RuntimeError: If failed to create a unique run_id.
     """
-    # we include the root experiment name as part of this string
-    exp_name = experiment_name
     exp_root = os.path.join(EXP_RESULTS_FOLDER, experiment_name)
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
-    if use_count:
-        # we will inspect the results folder for the next entry
-        if not os.path.exists(exp_root):
-            msg = f"unable to inspect {exp_root} for next run_id"
-            _logger.warning(msg)
-            exp_name = "0"
+    for _ in range(_MAX_RUN_ID_ATTEMPTS):
+        if use_count:
+            run_id = str(_allocate_run_number(experiment_name, exp_root))
         else:
-            nums = []
-            for d in os.listdir(exp_root):
-                if d.isdigit():
-                    nums.append(int(d))
-            next_num = (max(nums) + 1) if nums else 0
-            exp_name = str(next_num)
-    else:
-        # use random
-        exp_name = secrets.token_hex(4) + experiment_name
-
-    if prefix is not None:
-        exp_name = f"{prefix}{exp_name}"
-
-    if append_timestamp:
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        exp_name += f".TS.{timestamp}"
-
-    # confirm run_id is unique
-    check_run_exists = os.path.join(exp_root, exp_name)
-    if not os.path.exists(check_run_exists):
-        return exp_name
+            # use random
+            run_id = secrets.token_hex(4) + experiment_name
+        if prefix is not None:
+            run_id = f"{prefix}{run_id}"
+        if append_timestamp:
+            run_id += f".TS.{timestamp}"
+        if _reserve_run_dir(exp_root, run_id):
+            return run_id
 
     # and safety/fallback
     _logger.info(
         "run_id creation reverting to random due to run name collision")
     run_id = f"random.{secrets.token_hex(4)}"
-    check_run_exists = os.path.join(exp_root, run_id)
-    if not os.path.exists(check_run_exists):
+    if _reserve_run_dir(exp_root, run_id):
         return run_id
 
     raise RuntimeError("Failed to create unique run_id")
@@ -1,14 +1,25 @@
 """Experiment-level rollup report generation.
 
-Reads all run manifests for an experiment, computes aggregate
+Reads the run summaries (run.summary.json, falling back to
+run.manifest.json) for an experiment, computes aggregate
 statistics, checks config consistency across runs, and writes:
 
   results/{experiment_name}/experiment_report.md
   results/{experiment_name}/common/results.csv
 
-Config consistency check: compares run.exp.config.yaml across all runs.
-If any run's config differs from the majority baseline, a WARNING is
-prominently placed in the markdown report.
+Config consistency check: every run.exp.config.yaml is hashed once into
+a Merkle tree (one hash per subtree) and runs are grouped by root hash.
+If any group differs from the majority baseline, a WARNING listing the
+exact differing config keys is prominently placed in the markdown report.
+
+Rollup cache: the slim per-run facts the report needs are kept in
+results/{experiment_name}/common/rollup.cache.json, keyed by run folder
+and the size/mtime of each run's manifest and config. Only new or
+changed runs are read from disk on each call.
+
+Pooled sample statistics (every sample of every run, not per-run means)
+are read from the experiment's columnar metric store when it holds all
+the runs; see metric_store.py.
 """
 
 from __future__ import annotations
@@ -16,20 +27,40 @@ from __future__ import annotations
 import csv
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional, Sequence, Union
 
 import numpy as np
 import yaml
+from pydantic import BaseModel, ValidationError
 
 from adgtk.utils.defaults import EXP_RESULTS_FOLDER
-from adgtk.tracking.manifest import RunManifest
+from adgtk.utils.file import content_hash
+from adgtk.tracking.manifest import (
+    RunManifest,
+    RunSummary,
+    load_manifest,
+    load_run_summary,
+)
+from adgtk.tracking.metric_store import (
+    StepBands,
+    pooled_summaries,
+    step_bands as load_step_bands,
+)
+from adgtk.tracking.structure import MetricSummary
 
 EXPERIMENT_REPORT_FILE = "experiment_report.md"
 RESULTS_CSV_FILE = "results.csv"
 CONCLUSIONS_DIR = "conclusions"
 MANIFEST_FILE = "run.manifest.json"
 RUN_CONFIG_FILE = "run.exp.config.yaml"
+ROLLUP_CACHE_FILE = "rollup.cache.json"
+ROLLUP_CACHE_VERSION = 2
+_MAX_LOAD_WORKERS = 8
+# libyaml's safe loader when available, it parses configs ~10x faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 _AGENT_KPI_KEYS = [
     "agent.success",
@@ -48,6 +79,9 @@ _AGENT_TOKEN_DISPLAY = {
     "agent.tokens_in": "Input Tokens",
     "agent.tokens_out": "Output Tokens",
 }
+# per-step series aggregated across runs, aligned by step index
+STEP_BAND_KEYS = ["agent.latency", "agent.tokens_in", "agent.tokens_out"]
+_STEP_BAND_ROWS = 10
 
 
 # ----------------------------------------------------------------------
@@ -55,25 +89,24 @@ _AGENT_TOKEN_DISPLAY = {
 # ----------------------------------------------------------------------
 
 
-def _load_manifest(run_path: str) -> Optional[RunManifest]:
+def _load_manifest(
+    run_path: str,
+    summary_only: bool = False,
+) -> Optional[Union[RunManifest, RunSummary]]:
     """Load a RunManifest from a run's conclusion folder.
 
     Args:
         run_path: Path to the run folder.
+        summary_only: When True, load only the RunSummary fields.
 
     Returns:
-        A RunManifest instance when the manifest file exists and is valid,
-        otherwise None.
+        A RunManifest (or RunSummary) instance when the manifest file
+        exists and is valid, otherwise None.
     """
     manifest_path = os.path.join(run_path, CONCLUSIONS_DIR, MANIFEST_FILE)
     if not os.path.exists(manifest_path):
         return None
-    try:
-        with open(manifest_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return RunManifest(**data)
-    except (json.JSONDecodeError, Exception):
-        return None
+    return load_manifest(manifest_path, summary_only=summary_only)
 
 
 def _load_run_config(run_path: str) -> Optional[dict]:
@@ -91,7 +124,7 @@ def _load_run_config(run_path: str) -> Optional[dict]:
         return None
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YAML_LOADER)
     except yaml.YAMLError:
         return None
 
@@ -115,11 +148,243 @@ def _run_sort_key(run_id: str) -> tuple:
         return (0, run_id)
 
 
+# ----------------------------------------------------------------------
+# Rollup cache
+# ----------------------------------------------------------------------
+
+
+class RollupEntry(BaseModel):
+    """Cached facts for one run folder.
+
+    The stamps are (size, mtime_ns) of the file when it was read, or None
+    when the file did not exist.
+    """
+    manifest_stamp: Optional[tuple[int, int]] = None
+    config_stamp: Optional[tuple[int, int]] = None
+    summary: Optional[RunSummary] = None
+    config: Optional[dict[str, Any]] = None
+    config_hash: Optional[str] = None
+
+
+class RollupCache(BaseModel):
+    """On-disk rollup cache for a single experiment."""
+    version: int = ROLLUP_CACHE_VERSION
+    runs: dict[str, RollupEntry] = {}
+
+
+def _file_stamp(path: str) -> Optional[tuple[int, int]]:
+    """Return (size, mtime_ns) for a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def _load_rollup_cache(common_folder: str) -> dict[str, RollupEntry]:
+    """Load the rollup cache, returning an empty mapping when it is
+    missing, corrupt or written by an older cache version.
+
+    Args:
+        common_folder: Path to the experiment's common directory.
+
+    Returns:
+        Mapping of run folder name to its cached entry.
+    """
+    cache_path = os.path.join(common_folder, ROLLUP_CACHE_FILE)
+    if not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, "rb") as f:
+            cache = RollupCache.model_validate_json(f.read())
+    except (OSError, ValidationError):
+        return {}
+    if cache.version != ROLLUP_CACHE_VERSION:
+        return {}
+    return cache.runs
+
+
+def _save_rollup_cache(
+    common_folder: str,
+    runs: dict[str, RollupEntry],
+) -> None:
+    """Atomically write the rollup cache to the common folder.
+
+    Args:
+        common_folder: Path to the experiment's common directory.
+        runs: Mapping of run folder name to its entry.
+    """
+    os.makedirs(common_folder, exist_ok=True)
+    cache_path = os.path.join(common_folder, ROLLUP_CACHE_FILE)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(RollupCache(runs=runs).model_dump_json())
+    os.replace(tmp_path, cache_path)
+
+
+def _run_stamps(
+    run_path: str,
+) -> tuple[Optional[tuple[int, int]], Optional[tuple[int, int]]]:
+    """Return the manifest and config stamps of a run folder."""
+    return (
+        _file_stamp(os.path.join(run_path, CONCLUSIONS_DIR, MANIFEST_FILE)),
+        _file_stamp(os.path.join(run_path, RUN_CONFIG_FILE)),
+    )
+
+
+def _refresh_entry(
+    run_path: str,
+    entry: Optional[RollupEntry],
+) -> tuple[RollupEntry, bool]:
+    """Bring a cached entry up to date with the files on disk.
+
+    Only a manifest or config whose stamp changed is re-read.
+
+    Args:
+        run_path: Path to the run folder.
+        entry: The cached entry, or None if the run is new.
+
+    Returns:
+        The current entry and whether it differs from the cached one.
+    """
+    manifest_stamp, config_stamp = _run_stamps(run_path)
+
+    is_new = entry is None
+    if entry is None:
+        entry = RollupEntry()
+    changed = is_new
+
+    if is_new or entry.manifest_stamp != manifest_stamp:
+        entry.summary = load_run_summary(
+            os.path.join(run_path, CONCLUSIONS_DIR))
+        entry.manifest_stamp = manifest_stamp
+        changed = True
+
+    if is_new or entry.config_stamp != config_stamp:
+        entry.config = _load_run_config(run_path)
+        entry.config_hash = (
+            config_hash(entry.config) if entry.config is not None else None)
+        entry.config_stamp = config_stamp
+        changed = True
+
+    return entry, changed
+
+
 # ----------------------------------------------------------------------
 # Config consistency
 # ----------------------------------------------------------------------
 
 
+@dataclass
+class ConfigNode:
+    """A node in a config's Merkle tree.
+
+    Every node carries the hash of its subtree, so two configs can be
+    compared top down and only subtrees whose hashes differ are visited.
+    """
+    digest: str
+    kind: str                       # "dict", "list" or "value"
+    children: dict[str, "ConfigNode"] = field(default_factory=dict)
+
+
+@dataclass
+class ConfigDeviation:
+    """A group of runs that share a config differing from the baseline."""
+    run_ids: list[str]
+    config_hash: str
+    differing_keys: list[str]
+
+
+def build_config_tree(config: Any) -> ConfigNode:
+    """Build the Merkle tree of a config.
+
+    Dict keys are hashed in sorted order, so key order does not affect the
+    result. List items keep their position.
+
+    Args:
+        config: A parsed config (dict, list or scalar).
+
+    Returns:
+        The root ConfigNode.
+    """
+    if isinstance(config, dict):
+        children = {
+            str(k): build_config_tree(v) for k, v in config.items()
+        }
+        parts = [
+            f"{json.dumps(k)}:{children[k].digest}"
+            for k in sorted(children)
+        ]
+        return ConfigNode(
+            digest=content_hash(("d{" + ",".join(parts) + "}").encode()),
+            kind="dict",
+            children=children,
+        )
+    if isinstance(config, (list, tuple)):
+        children = {
+            f"[{i}]": build_config_tree(v) for i, v in enumerate(config)
+        }
+        parts = [node.digest for node in children.values()]
+        return ConfigNode(
+            digest=content_hash(("l[" + ",".join(parts) + "]").encode()),
+            kind="list",
+            children=children,
+        )
+    leaf = json.dumps(config, sort_keys=True, default=str)
+    return ConfigNode(digest=content_hash(f"v{leaf}".encode()), kind="value")
+
+
+def config_hash(config: Any) -> str:
+    """Return the canonical hash of a config (its Merkle root).
+
+    Args:
+        config: A parsed config.
+
+    Returns:
+        A hex digest that is equal for deeply equal configs.
+    """
+    return build_config_tree(config).digest
+
+
+def diff_config_trees(
+    a: ConfigNode,
+    b: ConfigNode,
+    path: str = "",
+) -> list[str]:
+    """List the config keys at which two Merkle trees differ.
+
+    Subtrees with equal hashes are skipped without being walked.
+
+    Args:
+        a: Root of the first tree.
+        b: Root of the second tree.
+        path: Dotted path of the nodes being compared.
+
+    Returns:
+        Dotted paths (list positions as [i]) of the differing keys, in
+        sorted order. The root is reported as "<root>".
+    """
+    if a.digest == b.digest:
+        return []
+    if a.kind != b.kind or a.kind == "value":
+        return [path or "<root>"]
+
+    diffs: list[str] = []
+    for key in sorted(set(a.children) | set(b.children)):
+        if key.startswith("["):
+            child_path = f"{path}{key}"
+        else:
+            child_path = f"{path}.{key}" if path else key
+        if key not in a.children or key not in b.children:
+            diffs.append(child_path)
+        else:
+            diffs.extend(
+                diff_config_trees(a.children[key], b.children[key],
+                                  child_path)
+            )
+    return diffs
+
+
 def _configs_equal(a: dict, b: dict) -> bool:
     """Compare two configs for deep equality.
 
@@ -128,14 +393,66 @@ def _configs_equal(a: dict, b: dict) -> bool:
         b: Second config mapping.
 
     Returns:
-        True if the configs are equal after JSON serialisation with sorted
-        keys, otherwise False.
+        True if the configs have the same canonical hash, otherwise False.
+    """
+    return config_hash(a) == config_hash(b)
+
+
+def group_configs(
+    run_configs: dict[str, Optional[dict]],
+    config_hashes: Optional[dict[str, Optional[str]]] = None,
+) -> tuple[Optional[dict], list[ConfigDeviation]]:
+    """Group runs by config hash and describe each deviating group.
+
+    Each run is hashed once (or not at all when its hash is supplied) and
+    placed in its group in O(1). Merkle trees are only built for one
+    representative per group, and each deviating group is diffed against
+    the baseline by walking the subtrees whose hashes differ.
+
+    Args:
+        run_configs: Mapping of run_id to loaded config dict, or None.
+        config_hashes: Optional precomputed config_hash per run_id.
+
+    Returns:
+        A tuple containing:
+        - baseline_config: The majority config dict, or None if no configs
+          are available.
+        - deviations: One ConfigDeviation per non-baseline group, largest
+          group first.
     """
-    return json.dumps(a, sort_keys=True) == json.dumps(b, sort_keys=True)
+    config_hashes = config_hashes or {}
+    groups: dict[str, list[str]] = {}
+    for run_id, cfg in run_configs.items():
+        if cfg is None:
+            continue
+        digest = config_hashes.get(run_id) or config_hash(cfg)
+        groups.setdefault(digest, []).append(run_id)
+
+    if not groups:
+        return None, []
+
+    # stable sort keeps first-seen order between groups of equal size
+    ordered = sorted(groups.items(), key=lambda x: len(x[1]), reverse=True)
+    baseline_hash, baseline_runs = ordered[0]
+    baseline_cfg = run_configs[baseline_runs[0]]
+    if len(ordered) == 1:
+        return baseline_cfg, []
+
+    baseline_tree = build_config_tree(baseline_cfg)
+    deviations: list[ConfigDeviation] = []
+    for digest, group_runs in ordered[1:]:
+        tree = build_config_tree(run_configs[group_runs[0]])
+        deviations.append(ConfigDeviation(
+            run_ids=sorted(group_runs, key=_run_sort_key),
+            config_hash=digest,
+            differing_keys=diff_config_trees(baseline_tree, tree),
+        ))
+    return baseline_cfg, deviations
 
 
 def check_config_consistency(
     run_configs: dict[str, Optional[dict]],
+    config_hashes: Optional[dict[str, Optional[str]]] = None,
 ) -> tuple[Optional[dict], list[str]]:
     """Identify the baseline config and runs that deviate from it.
 
@@ -145,6 +462,7 @@ def check_config_consistency(
 
     Args:
         run_configs: Mapping of run_id to loaded config dict, or None.
+        config_hashes: Optional precomputed config_hash per run_id.
 
     Returns:
         A tuple containing:
@@ -153,34 +471,10 @@ def check_config_consistency(
         - deviating_run_ids: Sorted list of run IDs whose config differs from
           the baseline.
     """
-    available = {
-        rid: cfg
-        for rid, cfg in run_configs.items()
-        if cfg is not None
-    }
-    if not available:
-        return None, []
-
-    groups: list[tuple[dict, list[str]]] = []
-    for run_id, cfg in available.items():
-        placed = False
-        for group_cfg, group_runs in groups:
-            if _configs_equal(group_cfg, cfg):
-                group_runs.append(run_id)
-                placed = True
-                break
-        if not placed:
-            groups.append((cfg, [run_id]))
-
-    if len(groups) == 1:
-        return groups[0][0], []
-
-    groups.sort(key=lambda x: len(x[1]), reverse=True)
-    baseline_cfg = groups[0][0]
+    baseline_cfg, deviations = group_configs(run_configs, config_hashes)
     deviating: list[str] = []
-    for _, group_runs in groups[1:]:
-        deviating.extend(group_runs)
-
+    for deviation in deviations:
+        deviating.extend(deviation.run_ids)
     return baseline_cfg, sorted(deviating, key=_run_sort_key)
 
 
@@ -189,22 +483,19 @@ def check_config_consistency(
 # ----------------------------------------------------------------------
 
 
-def collect_experiment_data(
+def _collect_runs(
     experiment_name: str,
-) -> tuple[list[RunManifest], list[str], dict[str, Optional[dict]], list[str]]:
-    """Collect run manifests and configs for an experiment.
+    use_cache: bool = True,
+) -> tuple[list[RunSummary], list[str], dict[str, RollupEntry]]:
+    """Load every run of an experiment through the rollup cache.
 
     Args:
         experiment_name: Name of the experiment to collect.
+        use_cache: When False, ignore the existing rollup cache.
 
     Returns:
-        A tuple containing:
-        - manifests: Successfully loaded RunManifest objects sorted by
-          timestamp_start then run_id.
-        - skipped_run_ids: Run folders where no manifest could be loaded.
-        - run_configs: Mapping of run_id to config dict or None.
-        - deviating_run_ids: Runs whose run.exp.config.yaml differs from the
-          majority baseline.
+        The sorted run summaries, the run folders without a manifest and
+        the rollup entry of every run folder.
 
     Raises:
         FileNotFoundError: If the experiment results folder does not exist.
@@ -222,26 +513,86 @@ def collect_experiment_data(
         and os.path.isdir(os.path.join(exp_path, d))
     )
 
-    manifests: list[RunManifest] = []
+    common_folder = os.path.join(exp_path, "common")
+    cached = _load_rollup_cache(common_folder) if use_cache else {}
+    entries: dict[str, RollupEntry] = {}
+    dirty = not use_cache or set(cached) != set(run_dirs)
+
+    manifests: list[RunSummary] = []
     skipped: list[str] = []
-    run_configs: dict[str, Optional[dict]] = {}
 
+    # stat every run, then load only the stale ones across a thread pool
+    stale: list[str] = []
     for run_id in run_dirs:
+        entry = cached.get(run_id)
         run_path = os.path.join(exp_path, run_id)
-        manifest = _load_manifest(run_path)
-        config = _load_run_config(run_path)
-        run_configs[run_id] = config
+        if entry is None or _run_stamps(run_path) != (
+                entry.manifest_stamp, entry.config_stamp):
+            stale.append(run_id)
+        else:
+            entries[run_id] = entry
+
+    if stale:
+        dirty = True
+        workers = min(_MAX_LOAD_WORKERS, len(stale))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            refreshed = pool.map(
+                lambda rid: _refresh_entry(
+                    os.path.join(exp_path, rid), cached.get(rid))[0],
+                stale,
+            )
+            entries.update(zip(stale, refreshed))
 
-        if manifest is not None:
-            manifests.append(manifest)
+    for run_id in run_dirs:
+        entry = entries[run_id]
+        if entry.summary is not None:
+            manifests.append(entry.summary)
         else:
             skipped.append(run_id)
 
+    if dirty:
+        try:
+            _save_rollup_cache(common_folder, entries)
+        except OSError:
+            pass  # the cache is an optimisation only
+
     manifests.sort(
         key=lambda m: (m.timestamp_start or "", _run_sort_key(m.run_id))
     )
+    return manifests, skipped, entries
+
+
+def collect_experiment_data(
+    experiment_name: str,
+    use_cache: bool = True,
+) -> tuple[list[RunSummary], list[str], dict[str, Optional[dict]], list[str]]:
+    """Collect run summaries and configs for an experiment.
 
-    _, deviating = check_config_consistency(run_configs)
+    Runs whose manifest and config are unchanged since the last call are
+    served from the rollup cache in the experiment's common folder; only
+    new or changed runs are read from disk.
+
+    Args:
+        experiment_name: Name of the experiment to collect.
+        use_cache: When False, ignore the existing rollup cache and read
+            every run from disk. The cache is still rewritten.
+
+    Returns:
+        A tuple containing:
+        - manifests: RunSummary objects for each run with a valid manifest,
+          sorted by timestamp_start then run_id.
+        - skipped_run_ids: Run folders where no manifest could be loaded.
+        - run_configs: Mapping of run_id to config dict or None.
+        - deviating_run_ids: Runs whose run.exp.config.yaml differs from the
+          majority baseline.
+
+    Raises:
+        FileNotFoundError: If the experiment results folder does not exist.
+    """
+    manifests, skipped, entries = _collect_runs(experiment_name, use_cache)
+    run_configs = {rid: e.config for rid, e in entries.items()}
+    _, deviating = check_config_consistency(
+        run_configs, {rid: e.config_hash for rid, e in entries.items()})
     return manifests, skipped, run_configs, deviating
 
 
@@ -277,21 +628,32 @@ def _fmt_duration(seconds: Optional[float]) -> str:
 
 def generate_markdown_report(
     experiment_name: str,
-    manifests: list[RunManifest],
+    manifests: Sequence[RunSummary],
     skipped_runs: list[str],
     deviating_run_ids: list[str],
     generated_at: str,
     journal_entries: Optional[list] = None,
+    config_deviations: Optional[list[ConfigDeviation]] = None,
+    pooled_stats: Optional[dict[str, MetricSummary]] = None,
+    step_bands: Optional[dict[str, StepBands]] = None,
 ) -> str:
     """Render a rolled-up experiment report as Markdown.
 
     Args:
         experiment_name: Name of the experiment.
-        manifests: List of run manifests included in the report.
+        manifests: Run summaries (or full manifests) included in the
+          report.
         skipped_runs: Run IDs skipped because their manifests could not be
           loaded.
         deviating_run_ids: Run IDs whose config differs from the baseline.
         generated_at: Timestamp when the report was generated.
+        journal_entries: Optional experiment journal entries to append.
+        config_deviations: Optional per-group deviations; when given, the
+          warning lists the config keys each group differs at.
+        pooled_stats: Optional per-label stats over all samples of all
+          runs, read from the experiment's metric store.
+        step_bands: Optional per-label series aggregated across runs by
+          step index; a sample of steps is tabulated.
 
     Returns:
         The rendered markdown report as a string.
@@ -328,8 +690,15 @@ def generate_markdown_report(
             "the experiment."
         )
         lines.append("")
-        for run_id in deviating_run_ids:
-            lines.append(f"- `{run_id}`")
+        if config_deviations:
+            for deviation in config_deviations:
+                run_list = ", ".join(f"`{r}`" for r in deviation.run_ids)
+                key_list = ", ".join(
+                    f"`{k}`" for k in deviation.differing_keys)
+                lines.append(f"- {run_list} — differs at: {key_list}")
+        else:
+            for run_id in deviating_run_ids:
+                lines.append(f"- `{run_id}`")
         lines.append("")
         lines.append(
             "> Use `adgtk-results show <experiment> <run_id>` to inspect "
@@ -655,6 +1024,54 @@ def generate_markdown_report(
                 )
         lines.append("")
 
+        if pooled_stats:
+            lines.append("### Pooled Sample Statistics")
+            lines.append("")
+            lines.append(
+                "_Statistics computed from every sample of every run._")
+            lines.append("")
+            lines.append(
+                "| Metric | Samples | Mean | Std | p50 | p95 | Min | Max |")
+            lines.append(
+                "|--------|--------:|-----:|----:|----:|----:|----:|----:|")
+            for k in meas_keys:
+                p = pooled_stats.get(k)
+                if p is None:
+                    continue
+                lines.append(
+                    f"| {k} | {p.n} | {p.mean:.4f} | {p.std:.4f} "
+                    f"| {p.p50:.4f} | {p.p95:.4f} "
+                    f"| {p.min:.4f} | {p.max:.4f} |"
+                )
+            lines.append("")
+
+    if step_bands:
+        lines.append("## Step-Aligned Series")
+        lines.append("")
+        lines.append(
+            "_Each row aggregates the runs that reached that step. "
+            "CI is the 95% confidence interval of the mean._")
+        lines.append("")
+        for k, bands in step_bands.items():
+            sampled = bands.downsample(_STEP_BAND_ROWS)
+            p5 = sampled.percentiles.get(5)
+            p95 = sampled.percentiles.get(95)
+            lines.append(f"### {k} ({bands.run_count} runs)")
+            lines.append("")
+            lines.append(
+                "| Step | Runs | Mean | CI low | CI high | p5 | p95 |")
+            lines.append(
+                "|-----:|-----:|-----:|-------:|--------:|---:|----:|")
+            for i, step in enumerate(sampled.steps):
+                lo = f"{p5[i]:.4f}" if p5 is not None else "--"
+                hi = f"{p95[i]:.4f}" if p95 is not None else "--"
+                lines.append(
+                    f"| {int(step) + 1} | {int(sampled.count[i])} "
+                    f"| {sampled.mean[i]:.4f} | {sampled.ci_low[i]:.4f} "
+                    f"| {sampled.ci_high[i]:.4f} | {lo} | {hi} |"
+                )
+            lines.append("")
+
     all_tag_keys: set[str] = set()
     for m in manifests:
         all_tag_keys.update(m.tags.keys())
@@ -731,13 +1148,13 @@ def generate_markdown_report(
 
 
 def save_results_csv(
-    manifests: list[RunManifest],
+    manifests: Sequence[RunSummary],
     common_folder: str,
 ) -> str:
     """Write per-run results to a CSV file in the common folder.
 
     Args:
-        manifests: Sorted list of RunManifest objects.
+        manifests: Sorted run summaries (or full manifests).
         common_folder: Path to the experiment's common directory.
 
     Returns:
@@ -849,14 +1266,31 @@ def generate_experiment_report(experiment_name: str) -> tuple[str, str]:
     """
     generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    manifests, skipped, _run_configs, deviating = collect_experiment_data(
-        experiment_name
+    manifests, skipped, entries = _collect_runs(experiment_name)
+    _, deviations = group_configs(
+        {rid: e.config for rid, e in entries.items()},
+        {rid: e.config_hash for rid, e in entries.items()},
     )
+    deviating = sorted(
+        (rid for d in deviations for rid in d.run_ids), key=_run_sort_key)
 
     common_folder = os.path.join(EXP_RESULTS_FOLDER, experiment_name, "common")
     from adgtk.tracking.experiment_journal import load_journal
     journal_entries = load_journal(common_folder)
 
+    run_labels: dict[str, list[str]] = {}
+    for m in manifests:
+        for k in m.metric_summaries:
+            run_labels.setdefault(k, []).append(m.run_id)
+    pooled = pooled_summaries(experiment_name, run_labels)
+    bands: dict[str, StepBands] = {}
+    for k in STEP_BAND_KEYS:
+        if k not in pooled:  # the store does not hold every run
+            continue
+        b = load_step_bands(experiment_name, k, run_ids=run_labels[k])
+        if b is not None:
+            bands[k] = b
+
     report_md = generate_markdown_report(
         experiment_name=experiment_name,
         manifests=manifests,
@@ -864,6 +1298,9 @@ def generate_experiment_report(experiment_name: str) -> tuple[str, str]:
         deviating_run_ids=deviating,
         generated_at=generated_at,
         journal_entries=journal_entries or None,
+        config_deviations=deviations,
+        pooled_stats=pooled or None,
+        step_bands=bands or None,
     )
 
     exp_path = os.path.join(EXP_RESULTS_FOLDER, experiment_name)
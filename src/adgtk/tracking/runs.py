@@ -9,16 +9,21 @@ maintained so the two can never drift out of sync.
 Note
 ====
 Follows the same module-global pattern as project.py for consistency.
+Writes go through tracking/store.py: the registry is re-read under an
+fcntl lock, the change is applied to that copy and written back
+atomically, so runs registered by other processes are never lost. Reads
+reload the in-memory copy whenever runs.json changed on disk.
 """
 
-import json
 import os
-from typing import Optional
+from typing import Callable, Optional
 
 from pydantic import ValidationError
 
 from adgtk.utils.defaults import TRACKING_FOLDER
+from adgtk.tracking.store import file_stamp, locked_json, read_json
 from adgtk.tracking.structure import RunEntryModel
+from adgtk.tracking.usage import forget_runs
 from adgtk.utils import create_logger
 
 _logger = create_logger(
@@ -31,52 +36,88 @@ RUNS_FILE = "runs.json"
 
 _runs: list[RunEntryModel] = []
 _loaded: bool = False
+_stamp: Optional[tuple[int, int]] = None
 
 
 # ----------------------------------------------------------------------
 # Internal helpers
 # ----------------------------------------------------------------------
 
+def _runs_file() -> str:
+    return os.path.join(TRACKING_FOLDER, RUNS_FILE)
+
+
+def _parse(data: list) -> list[RunEntryModel]:
+    try:
+        return [RunEntryModel(**entry) for entry in data]
+    except ValidationError as e:
+        msg = f"Corrupt runs registry: {e}"
+        _logger.error(msg)
+        raise
+
+
 def _load(clear_existing: bool = False) -> None:
-    global _runs, _loaded
+    global _runs, _loaded, _stamp
 
-    file_w_path = os.path.join(TRACKING_FOLDER, RUNS_FILE)
+    file_w_path = _runs_file()
     os.makedirs(TRACKING_FOLDER, exist_ok=True)
 
     if not os.path.exists(file_w_path):
-        with open(file_w_path, "w", encoding="utf-8") as f:
-            f.write("[]")
-        _logger.info("Created runs registry: %s", file_w_path)
+        with locked_json(file_w_path, default=[]) as doc:
+            if not os.path.exists(file_w_path):
+                doc.replace([])
+                _logger.info("Created runs registry: %s", file_w_path)
 
-    with open(file=file_w_path, mode="r", encoding="utf-8") as infile:
-        data = json.load(infile)
+    stamp = file_stamp(file_w_path)
+    data = read_json(file_w_path, default=[])
 
     if clear_existing:
         if _runs:
             _logger.warning("Cleared existing run entries on reload")
         _runs = []
 
-    try:
-        for entry in data:
-            _runs.append(RunEntryModel(**entry))
-    except ValidationError as e:
-        msg = f"Corrupt runs registry: {e}"
-        _logger.error(msg)
-        raise
-
+    _runs.extend(_parse(data))
+    _stamp = stamp
     _logger.info("Loaded runs registry from %s", file_w_path)
     _loaded = True
 
 
-def _save() -> None:
-    file_w_path = os.path.join(TRACKING_FOLDER, RUNS_FILE)
-    os.makedirs(TRACKING_FOLDER, exist_ok=True)
+def _refresh() -> None:
+    """Loads the registry, or reloads it if another process changed it."""
+    if not _loaded:
+        _load()
+    elif file_stamp(_runs_file()) != _stamp:
+        _load(clear_existing=True)
 
-    runs_as_dict = [r.model_dump() for r in _runs]
-    with open(file=file_w_path, mode="w", encoding="utf-8") as outfile:
-        json.dump(runs_as_dict, outfile, indent=2)
 
-    _logger.info("Saved runs registry to %s", file_w_path)
+def _update(
+    change: Callable[[list[RunEntryModel]], Optional[list[RunEntryModel]]],
+) -> bool:
+    """Applies change to the on-disk registry under lock.
+
+    Args:
+        change: Receives the freshly read runs and returns the new list,
+          or None when nothing needs to be written.
+
+    Returns:
+        True if the registry was rewritten.
+    """
+    global _runs, _loaded, _stamp
+
+    file_w_path = _runs_file()
+    os.makedirs(TRACKING_FOLDER, exist_ok=True)
+    with locked_json(file_w_path, default=[]) as doc:
+        current = _parse(doc.data)
+        updated = change(current)
+        if updated is not None:
+            doc.replace([r.model_dump() for r in updated])
+            current = updated
+    _runs = current
+    _stamp = file_stamp(file_w_path)
+    _loaded = True
+    if updated is not None:
+        _logger.info("Saved runs registry to %s", file_w_path)
+    return updated is not None
 
 
 # ----------------------------------------------------------------------
@@ -89,20 +130,19 @@ def add_run(entry: RunEntryModel) -> None:
     Args:
         entry: The run record to store.
     """
-    if not _loaded:
-        _load()
-
-    for r in _runs:
-        if r.run_id == entry.run_id:
-            if r.experiment_name == entry.experiment_name:
+    def _add(runs: list[RunEntryModel]) -> Optional[list[RunEntryModel]]:
+        for r in runs:
+            if (r.run_id == entry.run_id
+                    and r.experiment_name == entry.experiment_name):
                 _logger.warning(
                     "Run %s / %s already registered — skipping",
                     entry.experiment_name, entry.run_id)
-                return
+                return None
+        return runs + [entry]
 
-    _runs.append(entry)
-    _logger.info("Registered run %s / %s", entry.experiment_name, entry.run_id)
-    _save()
+    if _update(_add):
+        _logger.info(
+            "Registered run %s / %s", entry.experiment_name, entry.run_id)
 
 
 def get_runs(experiment_name: Optional[str] = None) -> list[RunEntryModel]:
@@ -114,8 +154,7 @@ def get_runs(experiment_name: Optional[str] = None) -> list[RunEntryModel]:
     Returns:
         List of matching RunEntryModel instances.
     """
-    if not _loaded:
-        _load()
+    _refresh()
 
     if experiment_name is None:
         return list(_runs)
@@ -128,8 +167,7 @@ def get_experiment_names() -> list[str]:
     Returns:
         Sorted list of experiment name strings.
     """
-    if not _loaded:
-        _load()
+    _refresh()
 
     seen: set[str] = set()
     names: list[str] = []
@@ -150,19 +188,18 @@ def remove_run(run_id: str, experiment_name: str) -> bool:
     Returns:
         True if an entry was removed, False if not found.
     """
-    global _runs
-    if not _loaded:
-        _load()
-
-    before = len(_runs)
-    _runs = [
-        r for r in _runs
-        if not (r.run_id == run_id and r.experiment_name == experiment_name)
-    ]
-    if len(_runs) < before:
+    def _remove(runs: list[RunEntryModel]) -> Optional[list[RunEntryModel]]:
+        kept = [
+            r for r in runs
+            if not (r.run_id == run_id
+                    and r.experiment_name == experiment_name)
+        ]
+        return kept if len(kept) < len(runs) else None
+
+    if _update(_remove):
+        forget_runs(experiment_name, run_id)
         _logger.info(
             "Removed run %s / %s from registry", experiment_name, run_id)
-        _save()
         return True
     return False
 
@@ -176,17 +213,18 @@ def remove_experiment(experiment_name: str) -> int:
     Returns:
         Number of entries removed.
     """
-    global _runs
-    if not _loaded:
-        _load()
+    removed = 0
+
+    def _remove(runs: list[RunEntryModel]) -> Optional[list[RunEntryModel]]:
+        nonlocal removed
+        kept = [r for r in runs if r.experiment_name != experiment_name]
+        removed = len(runs) - len(kept)
+        return kept if removed else None
 
-    before = len(_runs)
-    _runs = [r for r in _runs if r.experiment_name != experiment_name]
-    removed = before - len(_runs)
-    if removed > 0:
+    if _update(_remove):
+        forget_runs(experiment_name)
         _logger.info(
             "Removed %d run entries for experiment %s",
             removed,
             experiment_name)
-        _save()
     return removed
@@ -0,0 +1,142 @@
+"""store.py — process-safe primitives for the files under .tracking/.
+
+Several processes (CLI, web UI, MCP server, batch workers) can touch the
+same tracking files at once. The helpers here give them two guarantees:
+
+1. file_lock serialises writers through an advisory fcntl lock held on a
+   sidecar ``{path}.lock`` file. On platforms without fcntl the lock is a
+   no-op and callers fall back to the atomic write alone.
+2. atomic_write replaces a file via a temp file and os.replace, so a
+   reader never sees a half-written document.
+
+On top of those, locked_json implements merge-on-write for the JSON
+registries (runs.json, project.json, prefix.json, datasets.json and the
+experiment journals): the file is re-read under the lock, the caller
+applies its change to that fresh copy, and the result is written back
+atomically. Updates made by another process since this one last read the
+file are therefore kept rather than overwritten. file_stamp lets a
+module notice those updates and reload its in-memory copy.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+LOCK_SUFFIX = ".lock"
+
+# ----------------------------------------------------------------------
+# Locking and atomic writes
+# ----------------------------------------------------------------------
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """Hold an exclusive advisory lock on path for the duration of a block.
+
+    Args:
+        path: The file being protected. The lock is taken on a sidecar
+          ``{path}.lock`` so path itself can be replaced while locked.
+    """
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path + LOCK_SUFFIX, "a", encoding="utf-8") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def atomic_write(path: str, text: str) -> None:
+    """Write text to path through a temp file and an atomic rename.
+
+    Args:
+        path: The destination file.
+        text: The full file contents.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def file_stamp(path: str) -> Optional[tuple[int, int]]:
+    """Return (mtime_ns, size) of path, or None when it does not exist.
+
+    Every atomic_write replaces the file, so a changed stamp means another
+    writer has been at it since the stamp was taken.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+# ----------------------------------------------------------------------
+# JSON documents
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class LockedDocument:
+    """A JSON document read under lock by locked_json.
+
+    Call replace() with the new contents to have them written when the
+    block exits; leaving it untouched writes nothing.
+    """
+    data: Any
+    dirty: bool = False
+
+    def replace(self, data: Any) -> None:
+        """Set the contents to write back when the lock is released."""
+        self.data = data
+        self.dirty = True
+
+
+def read_json(path: str, default: Any) -> Any:
+    """Load a JSON file, returning default when it does not exist.
+
+    Raises:
+        json.JSONDecodeError: If the file exists but is not valid JSON.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+@contextmanager
+def locked_json(
+    path: str,
+    default: Any,
+    indent: Optional[int] = 2,
+) -> Iterator[LockedDocument]:
+    """Re-read a JSON file under lock and write back any replacement.
+
+    Args:
+        path: The JSON file.
+        default: The contents to start from when the file is missing.
+        indent: The indent used when writing the file back.
+
+    Yields:
+        The LockedDocument holding the current on-disk contents.
+    """
+    with file_lock(path):
+        doc = LockedDocument(data=read_json(path, default))
+        yield doc
+        if doc.dirty:
+            atomic_write(path, json.dumps(doc.data, indent=indent))
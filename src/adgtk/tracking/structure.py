@@ -51,6 +51,12 @@ class MetricSummary(BaseModel):
     std: float
     min: float
     max: float
+    p25: Optional[float] = None
+    p50: Optional[float] = None
+    p75: Optional[float] = None
+    p95: Optional[float] = None
+    # blake2b of the source CSV, lets a rebuild skip unchanged files
+    content_hash: Optional[str] = None
 
 
 class CommentModel(BaseModel):
@@ -0,0 +1,229 @@
+"""usage.py — reverse index from datasets to the blueprints and runs
+that use them.
+
+Design
+======
+Two sides make up "where is this dataset used":
+
+  - blueprints: the blueprint index (tracking/blueprints.py) keeps the
+    reverse map of referenced values, so blueprints naming a dataset ID
+    are a dictionary lookup.
+  - runs: DatasetManager.load_file notes every dataset ID loaded in this
+    process. The experiment runner clears that set when a run starts and
+    records it against the run at finalization, in
+    .tracking/dataset_usage.json as {dataset_id: ["<experiment>/<run_id>"]}.
+
+Both sides are maintained as things happen, so answering a usage query
+never scans the blueprint folder or the results tree. Run entries are
+dropped when the run is removed from the run registry.
+"""
+
+import os
+from typing import Callable, Optional
+
+from pydantic import BaseModel
+
+from adgtk.tracking.blueprints import blueprints_by_reference
+from adgtk.tracking.store import file_stamp, locked_json, read_json
+from adgtk.utils.defaults import EXP_DEF_DIR, TRACKING_FOLDER
+
+USAGE_FILE = "dataset_usage.json"
+RUN_KEY_SEP = "/"
+
+# dataset IDs loaded by this process since the last clear
+_loaded_datasets: set[str] = set()
+_usage: dict[str, list[str]] = {}
+_stamp: Optional[tuple[int, int]] = None
+
+
+# ----------------------------------------------------------------------
+# Models
+# ----------------------------------------------------------------------
+
+
+class DatasetUsage(BaseModel):
+    """Where one dataset is used."""
+    blueprints: list[str] = []
+    runs: list[str] = []
+
+
+# ----------------------------------------------------------------------
+# Internal helpers
+# ----------------------------------------------------------------------
+
+
+def _usage_file() -> str:
+    return os.path.join(TRACKING_FOLDER, USAGE_FILE)
+
+
+def _run_key(experiment_name: str, run_id: str) -> str:
+    return f"{experiment_name}{RUN_KEY_SEP}{run_id}"
+
+
+def _refresh() -> dict[str, list[str]]:
+    """Reload the run side when the file changed on disk."""
+    global _usage, _stamp
+    path = _usage_file()
+    stamp = file_stamp(path)
+    if stamp != _stamp:
+        _usage = read_json(path, default={}) if stamp else {}
+        _stamp = stamp
+    return _usage
+
+
+def _update(
+    change: Callable[[dict[str, list[str]]], bool],
+) -> None:
+    """Apply change to the on-disk usage map under lock.
+
+    Args:
+        change: Mutates the freshly read map in place and returns True
+          when it needs to be written.
+    """
+    global _usage, _stamp
+    path = _usage_file()
+    with locked_json(path, default={}) as doc:
+        if change(doc.data):
+            doc.replace(doc.data)
+        _usage = doc.data
+    _stamp = file_stamp(path)
+
+
+# ----------------------------------------------------------------------
+# Recording
+# ----------------------------------------------------------------------
+
+
+def note_dataset_loaded(dataset_id: str) -> None:
+    """Remember that dataset_id was loaded by the current run."""
+    _loaded_datasets.add(dataset_id)
+
+
+def clear_loaded_datasets() -> None:
+    """Forget the datasets noted so far. Called when a run starts."""
+    _loaded_datasets.clear()
+
+
+def get_loaded_datasets() -> list[str]:
+    """Return the dataset IDs loaded since the last clear, sorted."""
+    return sorted(_loaded_datasets)
+
+
+def record_run_datasets(experiment_name: str, run_id: str) -> list[str]:
+    """Record the datasets loaded during a run against that run.
+
+    Args:
+        experiment_name: The experiment the run belongs to.
+        run_id: The run identifier.
+
+    Returns:
+        The dataset IDs recorded.
+    """
+    dataset_ids = get_loaded_datasets()
+    if not dataset_ids:
+        return []
+    key = _run_key(experiment_name, run_id)
+
+    def _add(usage: dict[str, list[str]]) -> bool:
+        changed = False
+        for dataset_id in dataset_ids:
+            keys = usage.setdefault(dataset_id, [])
+            if key not in keys:
+                keys.append(key)
+                changed = True
+        return changed
+
+    _update(_add)
+    return dataset_ids
+
+
+def forget_runs(experiment_name: str, run_id: Optional[str] = None) -> None:
+    """Drop the usage recorded for a run, or for every run of an experiment.
+
+    Args:
+        experiment_name: The experiment name.
+        run_id: The run to drop. None drops all runs of the experiment.
+    """
+    if not os.path.exists(_usage_file()):
+        return
+    if run_id is None:
+        prefix = experiment_name + RUN_KEY_SEP
+
+        def _matches(key: str) -> bool:
+            return key.startswith(prefix)
+    else:
+        target = _run_key(experiment_name, run_id)
+
+        def _matches(key: str) -> bool:
+            return key == target
+
+    def _drop(usage: dict[str, list[str]]) -> bool:
+        changed = False
+        for dataset_id in list(usage):
+            kept = [k for k in usage[dataset_id] if not _matches(k)]
+            if len(kept) != len(usage[dataset_id]):
+                changed = True
+                if kept:
+                    usage[dataset_id] = kept
+                else:
+                    del usage[dataset_id]
+        return changed
+
+    _update(_drop)
+
+
+# ----------------------------------------------------------------------
+# Queries
+# ----------------------------------------------------------------------
+
+
+def runs_using_dataset(dataset_id: str) -> list[str]:
+    """Return the "<experiment>/<run_id>" keys of runs that loaded a dataset.
+    """
+    return list(_refresh().get(dataset_id, []))
+
+
+def all_dataset_usage(
+    blueprints_dir: str = EXP_DEF_DIR,
+) -> dict[str, DatasetUsage]:
+    """Return the usage of every referenced or loaded value in one pass.
+
+    Intended for tables listing many datasets: the blueprint index is
+    refreshed once and each row is then a dictionary lookup. Keys that
+    are not dataset IDs (other string settings) are harmless extras.
+
+    Args:
+        blueprints_dir: The folder holding the blueprint YAML files.
+
+    Returns:
+        Mapping of dataset ID to its DatasetUsage.
+    """
+    by_blueprint = blueprints_by_reference(blueprints_dir)
+    by_run = _refresh()
+    return {
+        key: DatasetUsage(
+            blueprints=list(by_blueprint.get(key, [])),
+            runs=list(by_run.get(key, [])),
+        )
+        for key in set(by_blueprint) | set(by_run)
+    }
+
+
+def dataset_usage(
+    dataset_id: str,
+    blueprints_dir: str = EXP_DEF_DIR,
+) -> DatasetUsage:
+    """Return the blueprints and runs that use one dataset.
+
+    Args:
+        dataset_id: The dataset ID.
+        blueprints_dir: The folder holding the blueprint YAML files.
+
+    Returns:
+        The DatasetUsage for the dataset.
+    """
+    return DatasetUsage(
+        blueprints=list(
+            blueprints_by_reference(blueprints_dir).get(dataset_id, [])),
+        runs=runs_using_dataset(dataset_id),
+    )
@@ -16,6 +16,7 @@ EXP_DATASET_FOLDER = "datasets"
 EXP_RESULTS_FOLDER = "results"
 EXP_MODEL_TRAIN_LOG = "model_train_runs"
 TRACKING_FOLDER = ".tracking"
+CACHE_FOLDER = "cache"                  # derived data under TRACKING_FOLDER
 RUN_FOLDER_VERSION = 1.2                # Ease of migration
 
 # Study Folders
@@ -3,9 +3,9 @@
 
 
 import csv
+import hashlib
 import os
 import shutil
-from typing import Any
 
 # ----------------------------------------------------------------------
 # Module configuration
@@ -16,30 +16,24 @@ from typing import Any
 # ----------------------------------------------------------------------
 
 
-def load_data_from_csv_file(filename: str) -> list:
+def load_data_from_csv_file(filename: str, encoding: str = "utf-8") -> list:
     """Loads a CSV file into a list of dictionaries.
 
+    Every value is kept as a string. For large files, or typed values,
+    use adgtk.data.ingest.read_csv_columns instead.
+
     Args:
         filename (str): The name of the file to load.
+        encoding (str): The text encoding of the file. Defaults to utf-8.
 
     Returns:
         list: A list of dictionaries representing the CSV data.
     """
-    columns: list[str] = []
-    records: list[dict] = []
-
-    with open(filename, "r") as infile:
+    with open(filename, "r", newline="", encoding=encoding) as infile:
         csv_reader = csv.reader(infile)
-        for row in csv_reader:
-            # we are on the first row when len == 0
-            if len(columns) == 0:
-                columns = row
-            else:
-                data: dict[Any, Any] = {}
-                for idx, col in enumerate(columns):
-                    data[col] = row[idx]
-                records.append(data)
-    return records
+        # the first row holds the column names
+        columns = next(csv_reader, [])
+        return [dict(zip(columns, row)) for row in csv_reader if row]
 
 
 def clear_folder(folder_path: str) -> None:
@@ -60,3 +54,45 @@ def clear_folder(folder_path: str) -> None:
             os.unlink(item_path)
         elif os.path.isdir(item_path):
             shutil.rmtree(item_path)
+
+
+# ----------------------------------------------------------------------
+#  Hashing
+# ----------------------------------------------------------------------
+
+
+def content_hash(data: bytes) -> str:
+    """Computes a short, stable digest of raw file content.
+
+    Args:
+        data (bytes): The content to hash.
+
+    Returns:
+        str: A hex encoded blake2b digest.
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def file_content_hash(path: str, chunk_size: int = 1 << 20) -> str:
+    """Computes content_hash of a file without reading it into memory.
+
+    The file is fed to blake2b in chunks, so the digest equals
+    content_hash(open(path, "rb").read()) for any file size.
+
+    Args:
+        path (str): The file to hash.
+        chunk_size (int): Bytes read per chunk. Defaults to 1 MiB.
+
+    Returns:
+        str: A hex encoded blake2b digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            digest.update(view[:n])
+    return digest.hexdigest()
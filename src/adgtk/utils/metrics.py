@@ -3,7 +3,8 @@ retrieving metric results from measurement engine results.
 
 This module includes functions to extract metric data from CSV files
 generated by measurement engines for individual runs or all runs in
-an experiment.
+an experiment. Cross-run queries read the experiment's columnar metric
+store when it holds a run and fall back to the run's CSV otherwise.
 """
 import csv
 import os
@@ -73,11 +74,21 @@ def get_all_metric_data(
               the metric data for each run. Returns an empty dictionary
               if no valid directories are found.
     """
+    # imported here: adgtk.tracking imports adgtk.utils at load time
+    from adgtk.tracking.metric_store import load_metric
+
     results = {}
     experiment_root = os.path.join(EXP_RESULTS_FOLDER, experiment_name)
+    stored = load_metric(experiment_name, f"{engine_id}.{metric}")
+    stored_runs = set(stored.run_ids) if stored is not None else set()
     run_folders = [folder for folder in os.listdir(experiment_root)
                    if os.path.isdir(os.path.join(experiment_root, folder))]
     for folder in run_folders:
+        if stored is not None and folder in stored_runs:
+            results[folder] = [
+                int(v) if v.is_integer() else v
+                for v in stored.run(folder).tolist()]
+            continue
         folder_w_path = os.path.join(experiment_root, folder)
         results[folder] = get_single_run_metric_data(
             results_folder=folder_w_path,
@@ -126,3 +126,30 @@ def test_dashboard_stats_partial(no_auth_config):
          patch("adgtk.tracking.project.get_available_experiments", return_value=[]):
         r = client.get("/dashboard/stats")
     assert r.status_code == 200
+
+
+# ---------------------------------------------------------------------------
+# Datasets
+# ---------------------------------------------------------------------------
+
+def test_dataset_profile_card(no_auth_config, tmp_path, monkeypatch):
+    from adgtk.data.dataset import DatasetManager
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data.csv").write_text("n,label\n1,a\n22,bb\n333,a\n")
+    DatasetManager().register(str(tmp_path / "data.csv"), "csv", file_id="d")
+    client = _client(no_auth_config)
+
+    r = client.get("/datasets/d")
+    assert r.status_code == 200
+    assert "Profile dataset" in r.text
+
+    r = client.post("/datasets/d/profile")
+    assert r.status_code == 200
+    assert "3 rows" in r.text and "label" in r.text
+
+    r = client.get("/datasets/d")
+    assert "Profile again" in r.text
+    # editing metadata keeps the cached profile
+    client.post("/datasets/d/update", data={"extended_metadata": '{"a": 1}'})
+    meta = DatasetManager().get_file_definition("d").extended_metadata
+    assert meta["a"] == 1 and meta["profile"]["rows"] == 3
@@ -0,0 +1,16 @@
+"""Shared fixtures for the test suite.
+
+Loading a dataset goes through the parsed-dataset cache by default, and
+random access to jsonl files builds an offset index, so every test gets
+its own tracking folder for both rather than ./.tracking/cache.
+"""
+
+import pytest
+from adgtk.data import cache, jsonl
+
+
+@pytest.fixture(autouse=True)
+def dataset_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "TRACKING_FOLDER", str(tmp_path / "t"))
+    monkeypatch.setattr(jsonl, "TRACKING_FOLDER", str(tmp_path / "t"))
+    return tmp_path / "t"
@@ -0,0 +1,9 @@
+"""Fixtures shared by the data tests."""
+
+import pytest
+from adgtk.data.dataset import DatasetManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return DatasetManager(folder=str(tmp_path / "t"))
@@ -0,0 +1,94 @@
+"""Tests for adgtk.data.cache — the parsed-dataset cache.
+
+pytest test/data/test_cache.py
+"""
+
+import os
+import pytest
+from unittest.mock import patch
+from adgtk.data import cache
+from adgtk.data.structure import FileDefinition
+from adgtk.data.utils import load_data, load_data_from_file
+
+
+@pytest.fixture(autouse=True)
+def cache_folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "TRACKING_FOLDER", str(tmp_path / "t"))
+    cache._fingerprints.clear()
+    yield tmp_path / "t" / "cache" / cache.CACHE_DIR
+    cache._fingerprints.clear()
+
+
+def _file_def(path, encoding="csv") -> FileDefinition:
+    return FileDefinition(
+        file_id="d", filename=path.name, path=str(path.parent),
+        encoding=encoding)
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n3,4\n")
+    return path
+
+
+def test_hit_skips_parsing(csv_file, cache_folder):
+    file_def = _file_def(csv_file)
+    first = load_data_from_file(file_def)
+    assert len(os.listdir(cache_folder)) == 1
+    with patch("adgtk.data.utils.load_data_from_csv_file") as reader:
+        second = load_data_from_file(file_def)
+    reader.assert_not_called()
+    assert second == first
+
+
+def test_edit_invalidates(csv_file):
+    file_def = _file_def(csv_file)
+    assert len(load_data_from_file(file_def)) == 2
+    csv_file.write_text("a,b\n1,2\n3,4\n5,6\n")
+    assert len(load_data_from_file(file_def)) == 3
+
+
+def test_options_change_the_key(csv_file):
+    file_def = _file_def(csv_file)
+    plain = cache.cache_key(file_def)
+    assert plain == cache.cache_key(file_def, {"key_rename_map": None})
+    assert plain != cache.cache_key(file_def, {"key_rename_map": {"a": "x"}})
+    assert cache.cache_key(_file_def(csv_file, "text")) is None
+
+
+def test_pandas_uses_feather(tmp_path, cache_folder):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n")
+    first = load_data_from_file(_file_def(path, "pandas"))
+    assert [f[-8:] for f in os.listdir(cache_folder)] == [".feather"]
+    assert load_data_from_file(_file_def(path, "pandas")).equals(first)
+
+
+def test_lru_eviction(tmp_path, cache_folder):
+    for i in range(3):
+        path = tmp_path / f"f{i}.csv"
+        path.write_text(f"a\n{i}\n")
+        load_data_from_file(_file_def(path))
+    entries = sorted(cache_folder.iterdir())
+    for age, entry in enumerate(entries):
+        os.utime(entry, ns=(age * 10**9, age * 10**9))
+    oldest = entries[0]
+    assert cache.evict(2 * entries[0].stat().st_size) == 1
+    assert not oldest.exists()
+    assert cache.clear_dataset_cache() == 2
+
+
+def test_load_data_caches_transform_not_shuffle(csv_file):
+    from adgtk.data.structure import FileDataDefinition
+    data_def = FileDataDefinition(
+        file_definition=_file_def(csv_file),
+        key_rename_map={"a": "x"},
+        shuffle_on_load=False,
+    )
+    assert load_data(data_def)[0] == {"x": "1", "b": "2"}
+    with patch("adgtk.data.utils.remap_data") as remap:
+        assert load_data(data_def)[0] == {"x": "1", "b": "2"}
+    remap.assert_not_called()
+    # a bare FileDefinition now returns its data
+    assert len(load_data(_file_def(csv_file))) == 2
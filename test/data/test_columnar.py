@@ -0,0 +1,95 @@
+"""Tests for adgtk.data.columnar and its use in adgtk.data.utils.
+
+pytest test/data/test_columnar.py
+"""
+
+import pickle
+import numpy as np
+import pandas as pd
+import pytest
+from adgtk.data.columnar import ColumnarDataset
+from adgtk.data.structure import InMemoryDataDefinition
+from adgtk.data.utils import (
+    change_orientation,
+    inspect_current_orientation,
+    load_data,
+    remap_data,
+    shuffle_data,
+    split_data_into_left_right,
+)
+
+
+@pytest.fixture
+def rows():
+    return [
+        {"id": i, "score": i / 2, "text": f"t{i}", "tags": [i]}
+        for i in range(10)
+    ]
+
+
+def test_columns_keep_values(rows):
+    ds = ColumnarDataset.from_records(rows)
+    assert ds.column("id").dtype == np.int64
+    assert ds.column("score").dtype == np.float64
+    assert ds.column("tags").dtype == object
+    assert ds[3] == rows[3]
+    assert type(ds[3]["id"]) is int
+    assert ds.to_records() == rows
+    with pytest.raises(ValueError):
+        ds.column("id")[0] = 5
+
+
+def test_ragged_records_fill_none():
+    ds = ColumnarDataset.from_records([{"a": 1}, {"a": 2, "b": "x"}])
+    assert ds.to_dict() == {"a": [1, 2], "b": [None, "x"]}
+
+
+def test_views_share_columns(rows):
+    ds = ColumnarDataset.from_records(rows)
+    shuffled = ds.shuffle(seed=3)
+    assert shuffled._columns["id"] is ds._columns["id"]
+    assert sorted(shuffled.column("id").tolist()) == list(range(10))
+
+    head, tail = shuffled.split_at(0.7)
+    assert len(head) == 7 and len(tail) == 3
+    assert head.to_records() + tail.to_records() == shuffled.to_records()
+
+    left, right = head.split(["text"])
+    assert right.columns == ["text"]
+    assert "text" not in left.columns
+    assert left._columns["id"] is ds._columns["id"]
+    assert ds[2:4].to_records() == rows[2:4]
+    assert ds[ds.column("id") % 2 == 0].column("id").tolist() == [0, 2, 4, 6, 8]
+
+
+def test_utils_dispatch(rows):
+    ds = change_orientation(rows, "columnar")
+    assert inspect_current_orientation(ds) == "columnar"
+    assert change_orientation(ds, "dict_contains_list")["id"] == list(range(10))
+    assert change_orientation(ds, "list_contains_dict") == rows
+    assert isinstance(change_orientation(ds, "pandas"), pd.DataFrame)
+    assert change_orientation(
+        pd.DataFrame({"a": [1, 2]}), "columnar").to_dict() == {"a": [1, 2]}
+
+    assert remap_data(ds, {"id": "key"}).columns[0] == "key"
+    assert len(shuffle_data(ds)) == 10
+    left, right = split_data_into_left_right(ds, ["score"])
+    assert right.columns == ["score"]
+
+
+def test_list_to_dict_orientation(rows):
+    flipped = change_orientation(rows, "dict_contains_list")
+    assert flipped["text"][1] == "t1"
+
+
+def test_load_data_columnar_and_pickle(rows):
+    data_def = InMemoryDataDefinition(
+        data=rows, target_orientation="columnar", shuffle_on_load=True,
+        key_rename_map={"text": "body"})
+    ds = load_data(data_def)
+    assert isinstance(ds, ColumnarDataset)
+    assert sorted(r["body"] for r in ds) == sorted(r["text"] for r in rows)
+
+    restored = pickle.loads(pickle.dumps(ds))
+    assert restored == ds
+    assert not restored._columns["id"].flags.writeable
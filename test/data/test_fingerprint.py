@@ -0,0 +1,65 @@
+"""Tests for adgtk.data.fingerprint and DatasetManager fingerprints.
+
+pytest test/data/test_fingerprint.py
+"""
+
+import os
+import pytest
+from unittest.mock import patch
+from adgtk.data.fingerprint import FINGERPRINT_KEY, stored_fingerprint
+from adgtk.utils.file import content_hash, file_content_hash
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n")
+    return path
+
+
+def test_streamed_hash_matches_content_hash(tmp_path):
+    path = tmp_path / "blob.bin"
+    payload = os.urandom(3 * 1024 + 17)
+    path.write_bytes(payload)
+    assert file_content_hash(str(path), chunk_size=1024) == content_hash(
+        payload)
+
+
+def test_register_stores_fingerprint(manager, data_file):
+    manager.register(str(data_file), "csv", file_id="d",
+                     extended_metadata={"owner": "me"})
+    meta = manager.get_file_definition("d").extended_metadata
+    assert meta["owner"] == "me"
+    fp = stored_fingerprint(manager.get_file_definition("d"))
+    assert fp.digest == content_hash(data_file.read_bytes())
+    assert fp.size == data_file.stat().st_size
+
+
+def test_rehash_only_when_stamps_change(manager, data_file):
+    manager.register(str(data_file), "csv", file_id="d")
+    with patch("adgtk.data.fingerprint.file_content_hash") as hasher:
+        assert manager.refresh_fingerprints() == 0
+        first = manager.fingerprint("d")
+    hasher.assert_not_called()
+
+    data_file.write_text("a,b\n1,2\n3,4\n")
+    assert manager.refresh_fingerprints() == 1
+    changed = manager.fingerprint("d")
+    assert changed.digest != first.digest
+    assert stored_fingerprint(manager.get_file_definition("d")) == changed
+
+
+def test_background_and_batch_registration(manager, tmp_path, data_file):
+    manager.register(str(data_file), "csv", file_id="bg", background=True)
+    manager.wait_for_fingerprints()
+    assert stored_fingerprint(manager.get_file_definition("bg")) is not None
+
+    shards = []
+    for i in range(3):
+        shard = tmp_path / f"shard{i}.csv"
+        shard.write_text(f"x\n{i}\n")
+        shards.append(str(shard))
+    ids = manager.register_many(shards, "csv", file_ids=["s0", "s1", "s2"])
+    digests = {manager.get_file_definition(i)
+               .extended_metadata[FINGERPRINT_KEY]["digest"] for i in ids}
+    assert len(digests) == 3
@@ -0,0 +1,157 @@
+"""Tests for adgtk.data.ingest — typed CSV ingestion.
+
+pytest test/data/test_ingest.py
+"""
+
+import numpy as np
+import pytest
+from adgtk.data import ingest
+from adgtk.data.dataset import DatasetManager
+from adgtk.data.ingest import read_csv_columns
+from adgtk.data.structure import FileDataDefinition, FileDefinition
+from adgtk.data.utils import load_data
+from adgtk.utils.file import load_data_from_csv_file
+
+
+_CSV = (
+    "id,score,flag,text\n"
+    "1,0.5,True,\"hello, world\"\n"
+    "2,,False,NA\n"
+    "3,1.5,True,\"multi\nline\"\n"
+    "4,2.0,False,\n"
+)
+
+
+@pytest.fixture(params=[True, False], ids=["arrow", "pandas"])
+def reader(request, monkeypatch):
+    monkeypatch.setattr(ingest, "_HAS_ARROW", request.param)
+    return read_csv_columns
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text(_CSV, encoding="utf-8")
+    return path
+
+
+def test_types_are_inferred(reader, csv_file):
+    ds = reader(str(csv_file))
+    assert ds.column("id").dtype == np.int64
+    assert ds.column("flag").dtype == np.bool_
+    score = ds.column("score")
+    assert score.dtype == np.float64 and np.isnan(score[1])
+    assert ds.column("text").tolist() == [
+        "hello, world", "NA", "multi\nline", ""]
+
+
+def test_strings_match_csv_module(reader, csv_file):
+    ds = reader(str(csv_file), infer_types=False)
+    assert ds.to_records() == load_data_from_csv_file(str(csv_file))
+
+
+def test_schema_projection_and_nrows(reader, csv_file):
+    ds = reader(str(csv_file), schema={"id": "str", "score": "float"},
+                usecols=["score", "id"], nrows=2)
+    assert ds.columns == ["score", "id"]
+    assert ds.column("id").tolist() == ["1", "2"]
+    with pytest.raises(ValueError):
+        reader(str(csv_file), usecols=["missing"])
+    with pytest.raises(ValueError):
+        reader(str(csv_file), schema={"id": "decimal"})
+
+
+def test_type_change_after_first_block(reader, tmp_path):
+    path = tmp_path / "mixed.csv"
+    path.write_text("a\n" + "1\n" * 200_000 + "1.5\n")
+    ds = reader(str(path), nrows=200_001)
+    assert ds.column("a").dtype == np.float64
+    assert ds[-1] == {"a": 1.5}
+
+
+@pytest.mark.parametrize("nrows", [None, 1])
+def test_arrow_and_pandas_agree_on_dates(monkeypatch, tmp_path, nrows):
+    path = tmp_path / "dates.csv"
+    path.write_text("day,at,stamp,empty,n\n"
+                    "2024-01-01,12:30:00,2024-01-01T10:00:00,,1\n"
+                    "2024-02-01,13:00:00,2024-01-02T10:00:00,,\n")
+    read = {}
+    for arrow in (True, False):
+        monkeypatch.setattr(ingest, "_HAS_ARROW", arrow)
+        read[arrow] = read_csv_columns(str(path), nrows=nrows)
+    for name in read[True].columns:
+        arrow_col, pandas_col = (read[a].column(name) for a in (True, False))
+        assert arrow_col.dtype == pandas_col.dtype, name
+        np.testing.assert_array_equal(arrow_col, pandas_col)
+    assert read[True].column("day").tolist()[0] == "2024-01-01"
+    assert read[True].column("empty").dtype == np.float64
+
+
+def test_manager_and_load_data(tmp_path, csv_file):
+    mgr = DatasetManager(folder=str(tmp_path / "t"))
+    mgr.register(str(csv_file), "csv", file_id="d")
+    assert mgr.load_columns("d", usecols=["id"]).column("id").tolist() == [
+        1, 2, 3, 4]
+
+    file_def = FileDefinition(file_id="d", filename=csv_file.name,
+                              path=str(tmp_path), encoding="csv")
+    ds = load_data(FileDataDefinition(
+        file_definition=file_def, target_orientation="columnar"))
+    assert ds.to_records() == load_data_from_csv_file(str(csv_file))
+
+
+# ---------------------------------------------------------------------------
+# Parquet / Feather
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(params=["parquet", "feather"])
+def table_file(request, tmp_path):
+    import pandas as pd
+    frame = pd.DataFrame({"id": range(100), "split": ["train", "test"] * 50})
+    path = tmp_path / f"data.{request.param}"
+    if request.param == "parquet":
+        frame.to_parquet(path, row_group_size=30)
+    else:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+        feather.write_feather(pa.Table.from_pandas(frame), path,
+                              chunksize=30)
+    return path, request.param
+
+
+def test_table_projection_and_filters(table_file):
+    path, encoding = table_file
+    frame = ingest.read_table(str(path), encoding, columns=["id"],
+                              filters=[("split", "==", "test")])
+    assert list(frame.columns) == ["id"]
+    assert frame["id"].tolist() == list(range(1, 100, 2))
+
+    chunks = list(ingest.iter_table(str(path), encoding, chunk_size=20))
+    assert max(len(c) for c in chunks) <= 30
+    assert sum(len(c) for c in chunks) == 100
+
+
+def test_table_preview_reads_first_group(table_file):
+    path, encoding = table_file
+    names, rows = ingest.read_table_preview(str(path), encoding, 50)
+    assert names == ["id", "split"]
+    assert rows[:2] == [[0, "train"], [1, "test"]]
+    assert len(rows) == 30
+
+    from pathlib import Path
+    from adgtk.api.routes.datasets import _build_preview
+    preview_type, headers, shown, _, truncated, _ = _build_preview(Path(path))
+    assert (preview_type, headers, len(shown)) == ("csv", names, 30)
+    assert not truncated
+
+
+def test_manager_tables(tmp_path, table_file):
+    path, encoding = table_file
+    mgr = DatasetManager(folder=str(tmp_path / "t"))
+    mgr.register(str(path), encoding, file_id="tbl")
+    assert len(mgr.load_file("tbl")) == 100
+    assert len(mgr.load_table("tbl", filters=[("id", "<", 10)])) == 10
+    assert sum(len(c) for c in mgr.iter_table("tbl", columns=["id"])) == 100
+    assert sum(len(c) for c in mgr.iter_file("tbl", chunk_size=25)) == 100
+    with pytest.raises(ValueError):
+        ingest.read_table(str(path), "csv")
@@ -0,0 +1,84 @@
+"""Tests for adgtk.data.jsonl — the persisted JSONL line-offset index.
+
+pytest test/data/test_jsonl.py
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+from adgtk.data import jsonl
+from adgtk.data.dataset import DatasetManager
+from adgtk.data.jsonl import JsonlReader, update_line_index
+
+
+@pytest.fixture(autouse=True)
+def tracking_folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(jsonl, "TRACKING_FOLDER", str(tmp_path / "t"))
+    return tmp_path / "t"
+
+
+def _write(path, records, mode="w", trailing_newline=True):
+    text = "\n".join(json.dumps(r) for r in records)
+    with open(path, mode) as f:
+        f.write(text + ("\n" if trailing_newline else ""))
+
+
+def test_random_access_skips_blank_lines(tmp_path):
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"i": 0}\n\n  \n{"i": 1}\r\n{"i": 2}')
+    with JsonlReader(str(path)) as records:
+        assert len(records) == 3
+        assert records[-1] == {"i": 2}
+        assert records[0:2] == [{"i": 0}, {"i": 1}]
+        assert list(records) == [{"i": 0}, {"i": 1}, {"i": 2}]
+        with pytest.raises(IndexError):
+            records[3]
+
+
+def test_append_extends_index_incrementally(tmp_path):
+    path = tmp_path / "data.jsonl"
+    _write(path, [{"i": i} for i in range(5)])
+    assert update_line_index(str(path)).count == 5
+
+    _write(path, [{"i": 5}], mode="a", trailing_newline=False)
+    with patch("adgtk.data.jsonl._scan", wraps=jsonl._scan) as scan:
+        header = update_line_index(str(path))
+    assert scan.call_args.args[1] > 0  # scanned from the old end only
+    assert header.count == 5  # the unterminated line is not persisted
+    with open(path, "a") as f:
+        f.write('\n{"i": 6}\n')
+    with JsonlReader(str(path)) as records:
+        assert [r["i"] for r in records[4:]] == [4, 5, 6]
+
+
+def test_rewrite_rebuilds_index(tmp_path):
+    path = tmp_path / "data.jsonl"
+    _write(path, [{"i": i} for i in range(5)])
+    update_line_index(str(path))
+    _write(path, [{"j": i} for i in range(8)])
+    with JsonlReader(str(path)) as records:
+        assert len(records) == 8
+        assert records[7] == {"j": 7}
+
+
+def test_sample_and_shards(tmp_path):
+    path = tmp_path / "data.jsonl"
+    _write(path, [{"i": i} for i in range(100)])
+    with JsonlReader(str(path)) as records:
+        picked = records.sample(10, seed=3)
+        assert picked == records.sample(10, seed=3)
+        assert len({r["i"] for r in picked}) == 10
+        shards = [records.shard_range(w, 3) for w in range(3)]
+        seen = [r["i"] for s in shards
+                for chunk in records.iter_chunks(7, s) for r in chunk]
+        assert seen == list(range(100))
+
+
+def test_dataset_manager_open_jsonl(tmp_path):
+    path = tmp_path / "data.jsonl"
+    _write(path, [{"i": 0}, {"i": 1}])
+    mgr = DatasetManager(folder=str(tmp_path / "t"))
+    mgr.register(str(path), "jsonl", file_id="gen")
+    with mgr.open_jsonl("gen") as records:
+        assert records[1] == {"i": 1}
+    assert mgr.load_file("gen") == [{"i": 0}, {"i": 1}]
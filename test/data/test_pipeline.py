@@ -0,0 +1,116 @@
+"""Tests for adgtk.data.pipeline — lazy transform pipelines.
+
+pytest test/data/test_pipeline.py
+"""
+
+import json
+import pandas as pd
+import pytest
+from adgtk.data.columnar import ColumnarDataset
+from adgtk.data.pipeline import Pipeline
+
+
+@pytest.fixture
+def rows_file(tmp_path, manager):
+    path = tmp_path / "rows.jsonl"
+    path.write_text("".join(
+        json.dumps({"id": i, "text": f"t{i}"}) + "\n" for i in range(100)))
+    manager.register(str(path), "jsonl", file_id="rows")
+    return path
+
+
+def test_stages_are_lazy_and_fused():
+    read = []
+
+    def source():
+        for i in range(0, 1000, 10):
+            read.append(i)
+            yield [{"id": j} for j in range(i, i + 10)]
+
+    pipe = (Pipeline.from_chunks(source)
+            .filter(lambda r: r["id"] % 2 == 0)
+            .map(lambda r: {**r, "double": r["id"] * 2})
+            .remap({"id": "key"})
+            .take(5))
+    assert read == []
+    assert pipe.collect() == [{"key": i, "double": i * 2}
+                              for i in range(0, 10, 2)]
+    assert read == [0]
+    # the same pipeline runs again from the source
+    assert len(pipe.collect()) == 5
+
+
+def test_batch_and_shuffle():
+    pipe = Pipeline.from_data(list(range(50)))
+    shuffled = pipe.shuffle(buffer=8, seed=3).collect()
+    assert sorted(shuffled) == list(range(50)) and shuffled != list(range(50))
+    assert shuffled == pipe.shuffle(buffer=8, seed=3).collect()
+    assert [len(b) for b in pipe.batch(20)] == [20, 20, 10]
+
+
+def test_from_any_loaded_data():
+    frame = pd.DataFrame({"a": [1, 2]})
+    expected = [{"a": 1}, {"a": 2}]
+    assert Pipeline.from_data(frame).collect() == expected
+    assert Pipeline.from_data({"a": [1, 2]}).collect() == expected
+    assert Pipeline.from_data(
+        ColumnarDataset({"a": [1, 2]})).collect() == expected
+
+
+def test_process_map_keeps_order():
+    out = Pipeline.from_data(list(range(-500, 0))).map(
+        abs, processes=2, block_size=16).take(300).collect()
+    assert out == list(range(500, 200, -1))
+
+
+def test_manager_pipeline_write_to(tmp_path, manager, rows_file):
+    new_id = (manager.pipeline("rows", chunk_size=7)
+              .filter(lambda r: r["id"] < 10)
+              .write_to(str(tmp_path / "out.parquet"), "parquet",
+                        file_id="small", use="train"))
+    assert new_id == "small"
+    assert manager.load_file("small")["id"].tolist() == list(range(10))
+    assert "train" in manager.get_file_definition("small").tags
+    assert manager.pipeline("small").map(
+        lambda r: r["text"]).take(2).collect() == ["t0", "t1"]
+
+
+@pytest.mark.parametrize("encoding", ["parquet", "feather", "jsonl"])
+def test_write_to_empty_result_loads(tmp_path, manager, rows_file, encoding):
+    new_id = (manager.pipeline("rows")
+              .filter(lambda r: False)
+              .write_to(str(tmp_path / f"none.{encoding}"), encoding,
+                        file_id="none"))
+    assert len(manager.load_file(new_id)) == 0
+
+
+@pytest.mark.parametrize("encoding", ["parquet", "feather"])
+def test_write_to_widens_nullable_columns(tmp_path, manager, encoding):
+    # block 1: score has a None (double), note is all None (null);
+    # later blocks: score is int64 and note is a string
+    path = tmp_path / "nullable.jsonl"
+    path.write_text("".join(json.dumps(
+        {"id": i, "score": None if i == 0 else i,
+         "note": None if i < 5 else f"n{i}"}) + "\n" for i in range(20)))
+    manager.register(str(path), "jsonl", file_id="nullable")
+    new_id = manager.pipeline("nullable").write_to(
+        str(tmp_path / f"out.{encoding}"), encoding, file_id="wide",
+        chunk_size=5)
+    frame = manager.load_file(new_id)
+    assert frame["id"].tolist() == list(range(20))
+    assert frame["score"].isna().tolist() == [True] + [False] * 19
+    assert frame["score"].tolist()[1:] == list(range(1, 20))
+    assert frame["note"].isna().sum() == 5
+    assert frame["note"].tolist()[5:] == [f"n{i}" for i in range(5, 20)]
+
+
+def test_write_to_csv_with_optional_keys(tmp_path, manager, rows_file):
+    new_id = (manager.pipeline("rows")
+              .map(lambda r: {**r, "even": True} if r["id"] % 2 == 0
+                   and r["id"] > 20 else r)
+              .write_to(str(tmp_path / "out.csv"), "csv", file_id="opt",
+                        chunk_size=10))
+    rows = manager.load_file(new_id)
+    assert len(rows) == 100
+    assert rows[0]["even"] == "" and rows[22]["even"] == "True"
+    assert rows[23]["even"] == ""
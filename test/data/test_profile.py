@@ -0,0 +1,99 @@
+"""Tests for adgtk.data.profile and DatasetManager.profile.
+
+pytest test/data/test_profile.py
+"""
+
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+from adgtk.data.profile import (
+    PROFILE_KEY,
+    current_profile,
+    format_profile,
+    profile_chunks,
+)
+
+
+def _by_name(profile):
+    return {c.name: c for c in profile.columns}
+
+
+def test_sketches_are_close_to_exact():
+    rng = np.random.default_rng(1)
+    frame = pd.DataFrame({
+        "id": np.arange(100_000),
+        "score": rng.normal(10, 2, 100_000),
+        "label": rng.choice(["a", "b", "c"], 100_000, p=[0.5, 0.3, 0.2]),
+    })
+    chunks = [frame.iloc[i:i + 7_000] for i in range(0, len(frame), 7_000)]
+    cols = _by_name(profile_chunks(chunks, "d"))
+
+    assert cols["id"].type == "int" and not cols["id"].distinct_exact
+    assert abs(cols["id"].distinct - 100_000) < 5_000
+    assert (cols["id"].min, cols["id"].max) == (0, 99_999)
+    score = cols["score"]
+    assert score.type == "float"
+    for label, q in (("p5", 0.05), ("p50", 0.5), ("p95", 0.95)):
+        exact = np.quantile(frame["score"], q)
+        assert abs(score.quantiles[label] - exact) < 0.1
+    assert score.mean == pytest.approx(frame["score"].mean())
+    label = cols["label"]
+    assert label.distinct == 3 and label.distinct_exact
+    assert label.top == [
+        (v, int(c)) for v, c in frame["label"].value_counts().items()]
+
+
+def test_records_missing_values_and_text():
+    records = [{"n": str(i), "text": "x" * i} for i in range(10)]
+    records += [{"n": "", "other": {"k": 1}}, {"n": None}]
+    profile = profile_chunks([records[:5], records[5:]])
+    cols = _by_name(profile)
+    assert profile.rows == 12
+    # numbers read from CSV text are profiled as numbers
+    assert cols["n"].type == "int" and cols["n"].nulls == 2
+    assert cols["n"].max == 9
+    text = cols["text"]
+    # "" is missing, so lengths start at 1
+    assert text.type == "str" and text.nulls == 3
+    assert (text.length_min, text.length_max) == (1, 9)
+    assert text.length_histogram == [("1", 1), ("2-3", 2), ("4-7", 4),
+                                     ("8-15", 2)]
+    assert cols["other"].type == "mixed" and cols["other"].nulls == 11
+    assert "12 rows" in format_profile(profile, "demo")
+
+
+def test_profile_is_cached_until_the_file_changes(tmp_path, manager):
+    path = tmp_path / "data.jsonl"
+    path.write_text("".join(json.dumps({"a": i}) + "\n" for i in range(5)))
+    manager.register(str(path), "jsonl", file_id="d")
+    first = manager.profile("d")
+    assert first.rows == 5
+    stored = manager.get_file_definition("d").extended_metadata[PROFILE_KEY]
+    assert stored["digest"] == first.digest
+    assert current_profile(manager.get_file_definition("d")) == first
+
+    with patch("adgtk.data.dataset.profile_chunks") as run:
+        assert manager.profile("d") == first
+    run.assert_not_called()
+
+    with open(path, "a") as f:
+        f.write(json.dumps({"a": 5}) + "\n")
+    assert current_profile(manager.get_file_definition("d")) is None
+    assert manager.profile("d").rows == 6
+
+
+def test_report_shows_rows(tmp_path, manager, capsys):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,x\n2,y\n")
+    manager.register(str(path), "csv", file_id="d")
+    manager.report()
+    assert "Rows" in capsys.readouterr().out
+    manager.report(profiles=True)
+    out = capsys.readouterr().out
+    assert "2 rows" in out and "| int " in out
+    manager.report()
+    row = capsys.readouterr().out.strip().splitlines()[-1]
+    assert row.split("|")[0].strip() == "- d"
+    assert row.split("|")[-1].strip() == "2"
@@ -0,0 +1,86 @@
+"""Tests for adgtk.data.sample and DatasetManager sampling.
+
+pytest test/data/test_sample.py
+"""
+
+import json
+from collections import Counter
+import pandas as pd
+import pytest
+from unittest.mock import patch
+from adgtk.data.sample import reservoir_sample, stratified_sample
+
+
+def _chunks(records, size):
+    return [records[i:i + size] for i in range(0, len(records), size)]
+
+
+@pytest.fixture
+def records():
+    return [{"id": i, "label": "a" if i % 10 else "b"} for i in range(1000)]
+
+
+def test_reservoir_is_seeded_and_chunk_independent(records):
+    first = reservoir_sample(_chunks(records, 7), 50, seed=1)
+    assert first == reservoir_sample(_chunks(records, 300), 50, seed=1)
+    assert first != reservoir_sample(_chunks(records, 7), 50, seed=2)
+    assert len(first) == 50 and len({r["id"] for r in first}) == 50
+    assert [r["id"] for r in first] == sorted(r["id"] for r in first)
+    assert len(reservoir_sample(_chunks(records, 7), 5000, seed=1)) == 1000
+
+
+def test_reservoir_is_uniform(records):
+    hits = Counter()
+    for seed in range(400):
+        hits.update(r["id"] // 100 for r in
+                    reservoir_sample(_chunks(records, 64), 20, seed=seed))
+    # each tenth of the file holds ~1/10 of the 8000 picks
+    assert all(650 < hits[d] < 950 for d in range(10))
+
+
+def test_stratified(records):
+    per = stratified_sample(_chunks(records, 33), "label", 20, seed=4)
+    assert Counter(r["label"] for r in per) == {"a": 20, "b": 20}
+    share = stratified_sample(_chunks(records, 33), "label", 100, seed=4,
+                              per_stratum=False)
+    assert Counter(r["label"] for r in share) == {"a": 90, "b": 10}
+
+    frame = pd.DataFrame(records)
+    chunks = [frame.iloc[i:i + 100] for i in range(0, 1000, 100)]
+    sampled = stratified_sample(chunks, "label", 5, seed=4)
+    assert isinstance(sampled, pd.DataFrame)
+    assert sampled["label"].value_counts().to_dict() == {"a": 5, "b": 5}
+
+
+def test_manager_sampling_is_cached(tmp_path, manager, records):
+    path = tmp_path / "rows.csv"
+    pd.DataFrame(records).to_csv(path, index=False)
+    manager.register(str(path), "csv", file_id="rows")
+
+    sample = manager.sample("rows", 25, seed=9)
+    assert len(sample) == 25
+    with patch("adgtk.data.dataset.reservoir_sample") as draw:
+        assert manager.sample("rows", 25, seed=9) == sample
+    draw.assert_not_called()
+    assert manager.sample("rows", 25, seed=10) != sample
+    with pytest.raises(ValueError):
+        manager.sample("rows", 5, method="random_access")
+
+    strata = manager.stratified_sample("rows", "label", 3, seed=1)
+    assert Counter(r["label"] for r in strata) == {"a": 3, "b": 3}
+
+
+def test_manager_random_access(tmp_path, manager, records):
+    jsonl_path = tmp_path / "rows.jsonl"
+    jsonl_path.write_text("".join(json.dumps(r) + "\n" for r in records))
+    manager.register(str(jsonl_path), "jsonl", file_id="j")
+    parquet = tmp_path / "rows.parquet"
+    pd.DataFrame(records).to_parquet(parquet, row_group_size=100)
+    manager.register(str(parquet), "parquet", file_id="p")
+
+    from_jsonl = manager.sample("j", 30, seed=2, use_cache=False)
+    from_parquet = manager.sample("p", 30, seed=2, use_cache=False)
+    # same positions are drawn from either index
+    assert from_parquet.to_dict(orient="records") == from_jsonl
+    streamed = manager.sample("j", 30, seed=2, method="stream")
+    assert len(streamed) == 30
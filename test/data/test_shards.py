@@ -0,0 +1,86 @@
+"""Tests for adgtk.data.shards and sharded DatasetManager entries.
+
+pytest test/data/test_shards.py
+"""
+
+import json
+import os
+import pandas as pd
+import pytest
+from adgtk.data.shards import select_shards, split_source
+
+
+def _write_shards(folder, count, per_shard=3):
+    folder.mkdir(exist_ok=True)
+    for s in range(count):
+        with open(folder / f"part-{s}.jsonl", "w") as f:
+            for r in range(per_shard):
+                f.write(json.dumps({"id": s * per_shard + r}) + "\n")
+
+
+def test_split_source(tmp_path):
+    assert split_source(str(tmp_path)) == (str(tmp_path), "*")
+    assert split_source(str(tmp_path / "a" / "**" / "p-*.csv")) == (
+        str(tmp_path / "a"), os.path.join("**", "p-*.csv"))
+    with pytest.raises(ValueError):
+        split_source(str(tmp_path / "missing.csv"))
+
+
+def test_register_and_load_in_order(tmp_path, manager):
+    _write_shards(tmp_path / "gen", 12)
+    (tmp_path / "gen" / "notes.txt").write_text("not a shard")
+    file_id = manager.register_shards(
+        str(tmp_path / "gen" / "part-*.jsonl"), "jsonl", file_id="gen")
+    assert manager.list_files() and len(manager.list_files()) == 1
+    shards = manager.list_shards(file_id)
+    # natural order: part-2 before part-10
+    assert [s.filename for s in shards][:3] == [
+        "part-0.jsonl", "part-1.jsonl", "part-2.jsonl"]
+    assert shards[-1].filename == "part-11.jsonl"
+    assert [r["id"] for r in manager.load_file(file_id)] == list(range(36))
+    chunks = list(manager.iter_file(file_id, chunk_size=2))
+    assert [r["id"] for c in chunks for r in c] == list(range(36))
+    assert max(len(c) for c in chunks) == 2
+
+
+def test_worker_shares_are_disjoint(tmp_path, manager):
+    _write_shards(tmp_path / "gen", 7)
+    manager.register_shards(str(tmp_path / "gen"), "jsonl", file_id="gen")
+    seen = []
+    for worker in range(3):
+        ids = [r["id"] for c in manager.iter_shards("gen", worker, 3)
+               for r in c]
+        assert ids == [r["id"] for r in manager.load_shards(
+            "gen", worker, 3, max_workers=2)]
+        seen.extend(ids)
+    assert sorted(seen) == list(range(21))
+    assert select_shards(list(range(7)), 1, 3) == [1, 4]
+    with pytest.raises(ValueError):
+        manager.list_shards("gen", 3, 3)
+
+
+def test_refresh_and_fingerprint(tmp_path, manager):
+    _write_shards(tmp_path / "gen", 2)
+    manager.register_shards(str(tmp_path / "gen"), "jsonl", file_id="gen")
+    before = manager.fingerprint("gen")
+    assert before == manager.fingerprint("gen")
+    _write_shards(tmp_path / "gen", 3)
+    assert manager.refresh_shards("gen") == 3
+    assert manager.fingerprint("gen") != before
+    assert len(manager.load_file("gen")) == 9
+    # the unchanged entry is skipped by the single-file refresh
+    assert manager.refresh_fingerprints() == 0
+
+
+def test_parquet_shards_in_processes(tmp_path, manager):
+    folder = tmp_path / "pq"
+    folder.mkdir()
+    for s in range(3):
+        pd.DataFrame({"x": [s * 2, s * 2 + 1]}).to_parquet(
+            folder / f"part-{s:05d}.parquet")
+    manager.register_shards(str(folder / "*.parquet"), "parquet",
+                            file_id="pq")
+    frame = manager.load_file("pq")
+    assert frame["x"].tolist() == list(range(6))
+    chunks = manager.iter_shards("pq", processes=True, max_workers=2)
+    assert pd.concat(list(chunks))["x"].tolist() == list(range(6))
@@ -0,0 +1,97 @@
+"""Tests for adgtk.data.split and DatasetManager splits.
+
+pytest test/data/test_split.py
+"""
+
+import json
+import pandas as pd
+import pytest
+from adgtk.data.split import SPLIT_KEY, SplitAssigner, SplitWriter
+
+
+def test_assignment_is_stable_and_proportional():
+    assign = SplitAssigner(key="id", seed=1)
+    names = [assign.split_of({"id": i}) for i in range(10_000)]
+    assert names == [SplitAssigner(key="id", seed=1).split_of({"id": i})
+                     for i in range(10_000)]
+    assert 0.77 < names.count("train") / 10_000 < 0.83
+    assert names != [SplitAssigner(key="id", seed=2).split_of({"id": i})
+                     for i in range(10_000)]
+    # the same key read from text or a typed column
+    assert assign.split_of_value("7") == assign.split_of_value(7)
+    # pinned, so a change to the hashing scheme is noticed
+    assert names[:12] == ["train"] * 4 + ["test"] + ["train"] * 5 + [
+        "validate", "train"]
+    with pytest.raises(ValueError):
+        SplitAssigner(ratios={"train": 0.5, "test": 0.4})
+
+
+def test_dataframe_and_records_agree():
+    assign = SplitAssigner(key="id", seed=3)
+    records = [{"id": i, "x": i * 2} for i in range(50)]
+    from_records = {n: [r["id"] for r in p] for n, p in assign.assign(records)}
+    from_frame = {n: p["id"].tolist()
+                  for n, p in assign.assign(pd.DataFrame(records))}
+    assert from_records == from_frame
+
+
+def test_split_file_writes_and_registers(tmp_path, manager):
+    path = tmp_path / "rows.jsonl"
+    path.write_text("".join(json.dumps({"id": i}) + "\n" for i in range(200)))
+    manager.register(str(path), "jsonl", file_id="rows", tags=["gen"])
+
+    ids = manager.split_file("rows", key="id", seed=5, chunk_size=17)
+    assert ids == {n: f"rows-{n}" for n in ("train", "test", "validate")}
+    seen = []
+    for name, split_id in ids.items():
+        definition = manager.get_file_definition(split_id)
+        assert definition.filename == f"rows.{name}.jsonl"
+        assert set(definition.tags) == {"gen", name}
+        assert definition.extended_metadata[SPLIT_KEY]["seed"] == 5
+        loaded = manager.load_file(split_id)
+        streamed = sum(manager.iter_split("rows", name, key="id", seed=5), [])
+        assert loaded == streamed
+        seen += [r["id"] for r in loaded]
+    assert sorted(seen) == list(range(200))
+
+    with pytest.raises(IndexError):
+        manager.split_file("rows", key="id")
+
+
+def test_failed_split_registration_leaves_nothing(tmp_path, manager,
+                                                  monkeypatch):
+    path = tmp_path / "rows.jsonl"
+    path.write_text("".join(json.dumps({"id": i}) + "\n" for i in range(50)))
+    manager.register(str(path), "jsonl", file_id="rows")
+    register = manager.register
+
+    def failing(source, *args, **kwargs):
+        if source.endswith(".test.jsonl"):
+            raise OSError("disk full")
+        return register(source, *args, **kwargs)
+
+    monkeypatch.setattr(manager, "register", failing)
+    with pytest.raises(OSError):
+        manager.split_file("rows", key="id")
+    assert manager.get_file_ids_only() == ["rows"]
+    assert sorted(p.name for p in tmp_path.glob("rows*")) == ["rows.jsonl"]
+
+
+def test_split_parquet(tmp_path, manager):
+    path = tmp_path / "rows.parquet"
+    pd.DataFrame({"id": range(100)}).to_parquet(path, row_group_size=10)
+    manager.register(str(path), "parquet", file_id="pq")
+    ids = manager.split_file("pq", key="id", ratios={"a": 0.5, "b": 0.5},
+                             output_dir=str(tmp_path / "out"))
+    total = sum(len(manager.load_file(i)) for i in ids.values())
+    assert total == 100
+    assert set(manager.get_file_definition(ids["a"]).tags) == {"other"}
+
+
+def test_writer_rejects_conflicting_column_types(tmp_path):
+    out = tmp_path / "a.parquet"
+    with pytest.raises(ValueError):
+        with SplitWriter({"a": str(out)}, "parquet") as writer:
+            writer.write("a", pd.DataFrame({"x": [1, 2]}))
+            writer.write("a", pd.DataFrame({"x": ["one"]}))
+    assert list(tmp_path.iterdir()) == []
@@ -99,3 +99,48 @@ def test_load_from_disk_populates_inventory(tmp_inventory, fake_file):
     assert file_id in new_tracker._inventory
     fd = new_tracker._inventory[file_id]
     assert fd.filename == fake_file.name
+
+
+# --- Indexes and batches ---
+
+def test_list_files_intersects_tags_in_order(tmp_inventory, fake_file):
+    tracker = make_tracker(tmp_inventory)
+    tracker.register_file(str(fake_file), "csv", tags=["a", "b"], file_id="1")
+    tracker.register_file(str(fake_file), "csv", tags=["b"], file_id="2")
+    tracker.register_file(str(fake_file), "csv", tags=["b", "a"], file_id="3")
+    tracker.register_file(str(fake_file), "csv", file_id="4")
+    assert tracker.get_file_ids_only(tag=["b", "a"]) == ["1", "3"]
+    assert tracker.get_file_ids_only(tag="b") == ["1", "2", "3"]
+    assert tracker.get_file_ids_only(tag="missing") == []
+    assert tracker.get_file_ids_only() == ["1", "2", "3", "4"]
+
+    tracker.update_file("2", new_tags=["a"])
+    assert tracker.get_file_ids_only(tag="a") == ["1", "2", "3"]
+    tracker.retire_file("1")
+    assert tracker.get_file_ids_only(tag=["a", "b"]) == ["3"]
+
+
+def test_register_many_writes_once(tmp_inventory, tmp_path):
+    files = []
+    for i in range(3):
+        f = tmp_path / f"shard{i}.csv"
+        f.write_text("x\n")
+        files.append(str(f))
+    tracker = make_tracker(tmp_inventory)
+    ids = tracker.register_many(
+        files, "csv", tags="shard", file_ids=["s0", "s1", "s2"])
+    assert ids == ["s0", "s1", "s2"]
+    assert make_tracker(tmp_inventory).get_file_ids_only("shard") == ids
+    assert tracker.get_file_id("shard1.csv", path=str(tmp_path)) == "s1"
+
+
+def test_batch_aborts_as_a_whole(tmp_inventory, fake_file):
+    tracker = make_tracker(tmp_inventory)
+    tracker.register_file(str(fake_file), "csv", file_id="keep")
+    with pytest.raises(IndexError):
+        with tracker.batch():
+            tracker.register_file(str(fake_file), "csv", file_id="new")
+            assert tracker.file_id_exists("new")
+            tracker.register_file(str(fake_file), "csv", file_id="keep")
+    assert tracker.get_file_ids_only() == ["keep"]
+    assert make_tracker(tmp_inventory).get_file_ids_only() == ["keep"]
@@ -14,6 +14,7 @@ note: initial test cases generated via a model. modified code to meet
 """
 
 import json
+import pytest
 import pandas as pd
 import adgtk.data.utils as utils
 from adgtk.data.structure import FileDefinition, FileDataDefinition
@@ -190,3 +191,57 @@ def test_file_definition_with_optional_fields(tmp_path):
     assert isinstance(data, list)
     assert len(data) == 2
     assert all("col1" in row and "col2" in row for row in data)
+
+
+def test_iter_data_from_file_streams_chunks(tmp_path):
+    csv_file = tmp_path / "rows.csv"
+    csv_file.write_text("a,b\n1,x\n2,y\n3,z\n")
+    jsonl_file = tmp_path / "rows.jsonl"
+    jsonl_file.write_text('{"a": 1}\n\n{"a": 2}\n{"a": 3}\n')
+
+    def _def(path, encoding):
+        return FileDefinition(file_id="f", filename=path.name,
+                              path=str(tmp_path), encoding=encoding)
+
+    chunks = list(utils.iter_data_from_file(_def(csv_file, "csv"), 2))
+    assert chunks == [[{"a": "1", "b": "x"}, {"a": "2", "b": "y"}],
+                      [{"a": "3", "b": "z"}]]
+    assert sum(chunks, []) == utils.load_data_from_csv_file(str(csv_file))
+
+    frames = list(utils.iter_data_from_file(_def(csv_file, "pandas"), 2))
+    assert [len(f) for f in frames] == [2, 1]
+    assert list(frames[1]["b"]) == ["z"]
+
+    jsonl = list(utils.iter_data_from_file(_def(jsonl_file, "jsonl"), 2))
+    assert jsonl == [[{"a": 1}, {"a": 2}], [{"a": 3}]]
+    assert utils.load_data_from_file(_def(jsonl_file, "jsonl")) == [
+        {"a": 1}, {"a": 2}, {"a": 3}]
+
+    with pytest.raises(ValueError):
+        utils.iter_data_from_file(_def(jsonl_file, "json"))
+
+
+# ---------------------------------------------------------------------------
+# hf-json modes
+# ---------------------------------------------------------------------------
+
+def test_hf_json_modes(tmp_path, monkeypatch):
+    import datasets
+    from adgtk.data.dataset import DatasetManager
+    monkeypatch.setattr(utils, "TRACKING_FOLDER", str(tmp_path / "t"))
+    path = tmp_path / "rows.jsonl"
+    path.write_text('{"a": 1}\n{"a": 2}\n')
+    mgr = DatasetManager(folder=str(tmp_path / "t"))
+    mgr.register(str(path), "hf-json", file_id="hf",
+                 extended_metadata={utils.HF_MODE_KEY: "memory_map"})
+
+    loaded = mgr.load_file("hf")
+    assert isinstance(loaded, datasets.Dataset)
+    assert loaded["a"] == [1, 2]
+    assert loaded.cache_files[0]["filename"].startswith(utils.hf_cache_dir())
+    assert isinstance(mgr.load_hf("hf", "dataset_dict"), datasets.DatasetDict)
+    streamed = mgr.load_hf("hf", "streaming")
+    assert isinstance(streamed, datasets.IterableDataset)
+    assert [r["a"] for r in streamed] == [1, 2]
+    with pytest.raises(ValueError):
+        utils.load_hf_json(str(path), "eager")    # type: ignore[arg-type]
@@ -230,6 +230,8 @@ def test_run_scenario_success(monkeypatch, tmp_path, mock_experiment_run_folders
     bp_dir.mkdir()
     fname = bp_dir / "scenario.yaml"
     fname.write_text(yaml.dump(config))
+    # run ids, runs.json and results are written under the cwd
+    monkeypatch.chdir(tmp_path)
     monkeypatch.setattr(runner, "_load_scenario", lambda conf: DummyScenario())
     monkeypatch.setattr(runner, "task_safe_to_start", lambda: True)
     monkeypatch.setattr(
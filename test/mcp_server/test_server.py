@@ -297,6 +297,30 @@ def test_export_results_csv():
     assert "results_path" in result["data"]
 
 
+def test_export_results_includes_summary_fields(tmp_path):
+    from adgtk.tracking.manifest import RunManifest, SUMMARY_FILE
+    conclusions = tmp_path / "conclusions"
+    conclusions.mkdir()
+    manifest = RunManifest(
+        run_id="001", experiment_name="exp1",
+        timestamp_start="a", timestamp_end="b", duration_seconds=1.0,
+        status="complete", config_snapshot={},
+        result_metrics={"acc": 0.9},
+        metric_summaries={"eng.score": {
+            "label": "eng.score", "n": 3, "mean": 2.0,
+            "std": 0.8, "min": 1.0, "max": 3.0}},
+    )
+    (conclusions / SUMMARY_FILE).write_text(
+        manifest.to_summary().model_dump_json())
+
+    runs = [_MockRun(str(tmp_path))]
+    with patch("adgtk.tracking.runs.get_runs", return_value=runs):
+        result = export_results("exp1", format="json")
+    record = result["data"][0]
+    assert record["metric_acc"] == 0.9
+    assert record["meas_eng.score_mean"] == 2.0
+
+
 # ─── validate_results ─────────────────────────────────────────────────────────
 
 def test_validate_results_healthy(tmp_path, monkeypatch):
@@ -115,6 +115,16 @@ def test_measure(mock_measurement_engine):
         "test_id") == 12
 
 
+def test_measure_chunks_records_once(mock_measurement_engine):
+    """Chunks are measured separately and recorded as one dataset."""
+    mock_measurement_engine.add("test_id")
+    mock_measurement_engine.measure_chunks(
+        iter([[1], [2, 3]]), record_as="sum")
+    assert mock_measurement_engine.metric_tracker.get_latest_value(
+        "test_id") == 12
+    assert mock_measurement_engine.measurement_count("test_id") == 1
+
+
 # -------- Comparison tests --------
 
 def test_compare_valid_data(mock_measurement_engine):
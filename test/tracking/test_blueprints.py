@@ -0,0 +1,105 @@
+"""Tests for adgtk.tracking.blueprints — the cached blueprint index.
+
+pytest test/tracking/test_blueprints.py
+"""
+
+import os
+import pytest
+from unittest.mock import patch
+from adgtk.tracking import blueprints
+from adgtk.tracking import project
+from adgtk.data.dataset import find_blueprints_using_dataset
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+_BLUEPRINT = """\
+attribute: experiment
+description: {description}
+factory_id: {scenario}
+init_config:
+  dataset: {dataset}
+  agents:
+    - attribute: agent
+      factory_id: basic_agent
+"""
+
+
+@pytest.fixture
+def bp_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(blueprints, "TRACKING_FOLDER", str(tmp_path / "t"))
+    folder = tmp_path / "blueprints"
+    folder.mkdir()
+    return folder
+
+
+def _write(folder, name, description="desc", scenario="sc", dataset="ds1"):
+    path = folder / f"{name}.yaml"
+    path.write_text(_BLUEPRINT.format(
+        description=description, scenario=scenario, dataset=dataset))
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+def test_index_extracts_facts(bp_dir):
+    _write(bp_dir, "alpha")
+    entry = blueprints.refresh_blueprint_index(str(bp_dir))["alpha.yaml"]
+    assert entry.description == "desc"
+    assert entry.factory_ids == ["basic_agent", "sc"]
+    assert "ds1" in entry.references
+    assert "experiment" not in entry.references
+    assert entry.config_hash
+
+
+def test_only_changed_files_are_parsed(bp_dir):
+    _write(bp_dir, "alpha")
+    beta = _write(bp_dir, "beta")
+    blueprints.refresh_blueprint_index(str(bp_dir))
+
+    with patch("adgtk.tracking.blueprints._index_file",
+               wraps=blueprints._index_file) as parse:
+        blueprints.refresh_blueprint_index(str(bp_dir))
+        assert parse.call_count == 0
+        _write(bp_dir, "beta", description="a longer description")
+        entries = blueprints.refresh_blueprint_index(str(bp_dir))
+        assert parse.call_count == 1
+    assert entries["beta.yaml"].description == "a longer description"
+
+    os.remove(beta)
+    assert list(blueprints.refresh_blueprint_index(str(bp_dir))) == [
+        "alpha.yaml"]
+
+
+def test_invalid_blueprints_are_not_listed(bp_dir):
+    _write(bp_dir, "alpha")
+    (bp_dir / "broken.yaml").write_text("key: [unclosed")
+    (bp_dir / "nodesc.yaml").write_text("attribute: experiment\n")
+    names = [e.name for e in blueprints.list_blueprints(str(bp_dir))]
+    assert names == ["alpha"]
+
+
+# ---------------------------------------------------------------------------
+# Callers
+# ---------------------------------------------------------------------------
+
+def test_get_available_experiments_uses_index(bp_dir, monkeypatch):
+    monkeypatch.setattr(project, "EXP_DEF_DIR", str(bp_dir))
+    _write(bp_dir, "beta", description="second")
+    _write(bp_dir, "alpha", description="first")
+    found = project.get_available_experiments()
+    assert [(e.name, e.description) for e in found] == [
+        ("alpha", "first"), ("beta", "second")]
+
+
+def test_find_blueprints_using_dataset(bp_dir):
+    _write(bp_dir, "alpha", dataset="ds1")
+    _write(bp_dir, "beta", dataset="ds2")
+    _write(bp_dir, "gamma", dataset="ds1")
+    assert find_blueprints_using_dataset("ds1", str(bp_dir)) == [
+        "alpha", "gamma"]
+    assert find_blueprints_using_dataset("missing", str(bp_dir)) == []
@@ -11,11 +11,16 @@ import csv
 from unittest.mock import patch, MagicMock
 from adgtk.tracking.manifest import (
     RunManifest,
+    RunSummary,
     _compute_metric_summaries,
     build_manifest,
     generate_markdown,
+    load_manifest,
+    load_manifests,
+    load_run_summary,
     save,
     MANIFEST_FILE,
+    SUMMARY_FILE,
     REPORT_FILE,
 )
 from adgtk.tracking.structure import ExperimentRunFolders, MetricSummary, ArtifactEntry
@@ -125,6 +130,50 @@ def test_compute_metric_summaries_multiple_files(tmp_path):
     assert "acc" in result
 
 
+def test_compute_metric_summaries_percentiles_and_hash(tmp_path):
+    with open(tmp_path / "latency.csv", "w", newline="") as f:
+        csv.writer(f).writerow([1.0, 2.0, 3.0, 4.0, 5.0])
+
+    s = _compute_metric_summaries(str(tmp_path))["latency"]
+    assert s.p50 == 3.0
+    assert s.p25 == 2.0
+    assert s.p75 == 4.0
+    assert s.content_hash is not None
+
+
+def test_compute_metric_summaries_reuses_unchanged_previous(tmp_path):
+    with open(tmp_path / "loss.csv", "w", newline="") as f:
+        csv.writer(f).writerow([0.5, 0.4])
+    first = _compute_metric_summaries(str(tmp_path))
+
+    # a stale mean proves the file was not re-parsed
+    previous = {"loss": first["loss"].model_copy(update={"mean": -1.0})}
+    result = _compute_metric_summaries(str(tmp_path), previous=previous)
+    assert result["loss"].mean == -1.0
+
+    with open(tmp_path / "loss.csv", "w", newline="") as f:
+        csv.writer(f).writerow([0.5, 0.4, 0.3])
+    result = _compute_metric_summaries(str(tmp_path), previous=previous)
+    assert result["loss"].n == 3
+
+
+def test_compute_metric_summaries_uses_saved_tracker_data(tmp_path):
+    from adgtk.tracking.base import MetricTracker, clear_saved_series
+    folders = _make_folders(tmp_path)
+    tracker = MetricTracker(name="eng")
+    tracker.add_raw_data("score", [1, 2, 3])
+    with patch("adgtk.tracking.base.observations.add_artifact"):
+        tracker.save_data(folders)
+
+    with patch("adgtk.tracking.manifest.open", side_effect=AssertionError):
+        in_memory = _compute_metric_summaries(folders.metrics)
+    assert in_memory["eng.score"].mean == 2.0
+
+    clear_saved_series()
+    from_disk = _compute_metric_summaries(folders.metrics)
+    assert from_disk["eng.score"] == in_memory["eng.score"]
+
+
 # ---------------------------------------------------------------------------
 # build_manifest
 # ---------------------------------------------------------------------------
@@ -283,3 +332,78 @@ def test_save_includes_researcher_notes_in_report(tmp_path):
     content = report_path.read_text()
     assert "Researcher Notes" in content
     assert "This is a researcher note." in content
+
+
+# ---------------------------------------------------------------------------
+# load_manifest / load_manifests
+# ---------------------------------------------------------------------------
+
+def test_load_manifest_full_and_summary(tmp_path):
+    m = _minimal_manifest(
+        artifacts=[ArtifactEntry(path="/tmp/a.csv", purpose="other")]
+    )
+    path = tmp_path / MANIFEST_FILE
+    path.write_text(m.model_dump_json())
+
+    full = load_manifest(str(path))
+    assert isinstance(full, RunManifest)
+    assert full.artifacts[0].path == "/tmp/a.csv"
+
+    slim = load_manifest(str(path), summary_only=True)
+    assert type(slim) is RunSummary
+    assert slim.run_id == "001"
+    assert slim == m.to_summary()
+
+
+def test_load_manifest_missing_or_invalid(tmp_path):
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+    assert load_manifest(str(bad)) is None
+    assert load_manifest(str(tmp_path / "missing.json")) is None
+
+
+def test_load_manifests_keeps_order(tmp_path):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"{i}.json"
+        path.write_text(_minimal_manifest(run_id=str(i)).model_dump_json())
+        paths.append(str(path))
+    paths.insert(2, str(tmp_path / "missing.json"))
+
+    loaded = load_manifests(paths, summary_only=True)
+    assert [m.run_id if m else None for m in loaded] == \
+        ["0", "1", None, "2", "3", "4"]
+
+
+# ---------------------------------------------------------------------------
+# run.summary.json sidecar
+# ---------------------------------------------------------------------------
+
+def test_save_writes_summary_sidecar(tmp_path):
+    m = _minimal_manifest(result_metrics={"acc": 0.9})
+    with patch("adgtk.tracking.researcher_notes.load_notes", return_value=None):
+        save(m, str(tmp_path))
+
+    data = json.loads((tmp_path / SUMMARY_FILE).read_text())
+    assert data["result_metrics"] == {"acc": 0.9}
+    assert "observations" not in data
+    assert "config_snapshot" not in data
+
+
+def test_load_run_summary_prefers_sidecar(tmp_path):
+    (tmp_path / MANIFEST_FILE).write_text(
+        _minimal_manifest(summary="manifest").model_dump_json())
+    (tmp_path / SUMMARY_FILE).write_text(
+        _minimal_manifest(summary="sidecar").to_summary().model_dump_json())
+
+    assert load_run_summary(str(tmp_path)).summary == "sidecar"
+
+
+def test_load_run_summary_falls_back_to_manifest(tmp_path):
+    (tmp_path / MANIFEST_FILE).write_text(
+        _minimal_manifest(summary="manifest").model_dump_json())
+    assert load_run_summary(str(tmp_path)).summary == "manifest"
+
+    (tmp_path / SUMMARY_FILE).write_text("{broken")
+    assert load_run_summary(str(tmp_path)).summary == "manifest"
+    assert load_run_summary(str(tmp_path / "missing")) is None
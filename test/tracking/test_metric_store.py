@@ -0,0 +1,219 @@
+"""Tests for adgtk.tracking.metric_store — columnar cross-run metrics.
+
+pytest test/tracking/test_metric_store.py
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pytest
+from unittest.mock import patch
+from adgtk.tracking.metric_store import (
+    append_run,
+    list_labels,
+    load_metric,
+    load_run_series,
+    pooled_summaries,
+    step_bands,
+    sync_metric_store,
+    BANDS_DIR,
+    MAX_BAND_SUBSETS,
+    STORE_DIR,
+)
+from adgtk.utils.metrics import get_all_metric_data
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _write_metric(run_path: str, label: str, values: list) -> str:
+    metrics = os.path.join(run_path, "metrics")
+    os.makedirs(metrics, exist_ok=True)
+    with open(os.path.join(metrics, f"{label}.csv"), "w") as f:
+        f.write(",".join(str(v) for v in values) + "\n")
+    return metrics
+
+
+@pytest.fixture
+def results(tmp_path):
+    with patch("adgtk.tracking.metric_store.EXP_RESULTS_FOLDER",
+               str(tmp_path)), \
+            patch("adgtk.utils.metrics.EXP_RESULTS_FOLDER", str(tmp_path)):
+        yield tmp_path
+
+
+# ---------------------------------------------------------------------------
+# Append and load
+# ---------------------------------------------------------------------------
+
+def test_append_and_load_ragged(results):
+    exp = results / "exp"
+    m1 = _write_metric(str(exp / "1.a"), "agent.latency", [1.0, 2.0, 3.0])
+    m2 = _write_metric(str(exp / "2.a"), "agent.latency", [4.0])
+    assert append_run("exp", "1.a", m1) == 1
+    assert append_run("exp", "2.a", m2) == 1
+
+    metric = load_metric("exp", "agent.latency")
+    assert metric.run_ids == ["1.a", "2.a"]
+    assert metric.offsets.tolist() == [0, 3, 4]
+    assert isinstance(metric.values, np.memmap)
+    assert metric.run("2.a").tolist() == [4.0]
+    matrix = metric.to_matrix()
+    assert matrix.shape == (2, 3)
+    assert np.isnan(matrix[1, 1])
+    assert list_labels("exp") == ["agent.latency"]
+
+
+def test_reappend_replaces_run(results):
+    exp = results / "exp"
+    m1 = _write_metric(str(exp / "1.a"), "score", [1, 2])
+    append_run("exp", "1.a", m1)
+    _write_metric(str(exp / "1.a"), "score", [5, 6, 7])
+    append_run("exp", "1.a", m1)
+    metric = load_metric("exp", "score")
+    assert metric.run_ids == ["1.a"]
+    assert metric.run("1.a").tolist() == [5.0, 6.0, 7.0]
+
+
+def test_concurrent_appends_keep_every_run(results):
+    exp = results / "exp"
+    folders = {
+        f"{i}.a": _write_metric(str(exp / f"{i}.a"), "score", [i] * (i + 1))
+        for i in range(12)}
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        list(pool.map(lambda item: append_run("exp", *item), folders.items()))
+    metric = load_metric("exp", "score")
+    assert sorted(metric.run_ids) == sorted(folders)
+    for i in range(12):
+        assert metric.run(f"{i}.a").tolist() == [float(i)] * (i + 1)
+    with pytest.raises(KeyError):
+        metric.run("missing")
+
+
+def test_non_numeric_metric_skipped(results):
+    exp = results / "exp"
+    m1 = _write_metric(str(exp / "1.a"), "label", ["a", "b"])
+    assert append_run("exp", "1.a", m1) == 0
+    assert load_metric("exp", "label") is None
+
+
+def test_load_run_series_prefix(results):
+    exp = results / "exp"
+    _write_metric(str(exp / "1.a"), "agent.latency", [0.5])
+    m1 = _write_metric(str(exp / "1.a"), "score", [1])
+    append_run("exp", "1.a", m1)
+    assert load_run_series("exp", "1.a", prefix="agent.") == {
+        "agent.latency": [0.5]}
+    assert load_run_series("exp", "9.z") == {}
+
+
+def test_sync_backfills_unstored_runs(results):
+    exp = results / "exp"
+    _write_metric(str(exp / "1.a"), "score", [1])
+    _write_metric(str(exp / "2.a"), "score", [2])
+    os.makedirs(exp / "common")
+    assert sync_metric_store("exp") == 2
+    assert sync_metric_store("exp") == 0
+    assert load_metric("exp", "score").run_ids == ["1.a", "2.a"]
+
+
+# ---------------------------------------------------------------------------
+# Step bands
+# ---------------------------------------------------------------------------
+
+def test_step_bands_match_reference(results):
+    exp = results / "exp"
+    rng = np.random.default_rng(3)
+    series = [rng.random(n).round(4) for n in (6, 4, 4, 1)]
+    for i, vals in enumerate(series):
+        m = _write_metric(str(exp / f"{i}.a"), "agent.latency", vals.tolist())
+        append_run("exp", f"{i}.a", m)
+
+    bands = step_bands("exp", "agent.latency")
+    matrix = np.full((4, 6), np.nan)
+    for i, vals in enumerate(series):
+        matrix[i, :len(vals)] = vals
+    assert bands.count.tolist() == [4, 3, 3, 3, 1, 1]
+    np.testing.assert_allclose(bands.mean, np.nanmean(matrix, axis=0))
+    for q in (5, 50, 95):
+        np.testing.assert_allclose(
+            bands.percentiles[q], np.nanpercentile(matrix, q, axis=0))
+    assert np.all(bands.ci_low <= bands.mean)
+    assert bands.ci_low[-1] == bands.ci_high[-1]  # a single run, no spread
+
+
+def test_step_bands_cached_by_run_set(results):
+    exp = results / "exp"
+    m1 = _write_metric(str(exp / "1.a"), "agent.latency", [1, 2])
+    append_run("exp", "1.a", m1)
+    first = step_bands("exp", "agent.latency")
+    bands_dir = exp / "common" / STORE_DIR / BANDS_DIR
+    assert (bands_dir / "agent.latency.npz").exists()
+
+    with patch("adgtk.tracking.metric_store._compute_bands") as compute:
+        again = step_bands("exp", "agent.latency")
+    compute.assert_not_called()
+    assert again.mean.tolist() == first.mean.tolist()
+
+    m2 = _write_metric(str(exp / "2.a"), "agent.latency", [3, 4])
+    append_run("exp", "2.a", m2)
+    assert step_bands("exp", "agent.latency").mean.tolist() == [2.0, 3.0]
+    only_first = step_bands("exp", "agent.latency", run_ids=["1.a"])
+    assert only_first.mean.tolist() == [1.0, 2.0]
+
+    # each run selection keeps its own cache entry
+    with patch("adgtk.tracking.metric_store._compute_bands") as compute:
+        step_bands("exp", "agent.latency")
+        step_bands("exp", "agent.latency", run_ids=["1.a"])
+    compute.assert_not_called()
+    # all-runs bands keep one file; subsets are capped per label
+    assert len(list(bands_dir.iterdir())) == 2
+    for i in range(3, 3 + MAX_BAND_SUBSETS + 2):
+        m = _write_metric(str(exp / f"{i}.a"), "agent.latency", [i])
+        append_run("exp", f"{i}.a", m)
+        step_bands("exp", "agent.latency")
+        step_bands("exp", "agent.latency", run_ids=["1.a", f"{i}.a"])
+    files = [f.name for f in bands_dir.iterdir()]
+    assert "agent.latency.npz" in files
+    assert len(files) == 1 + MAX_BAND_SUBSETS
+
+
+def test_step_bands_downsample(results):
+    exp = results / "exp"
+    m1 = _write_metric(str(exp / "1.a"), "agent.latency", list(range(100)))
+    append_run("exp", "1.a", m1)
+    small = step_bands("exp", "agent.latency").downsample(10)
+    assert len(small.steps) == 10
+    assert small.steps[0] == 0 and small.steps[-1] == 99
+    assert len(small.to_dict()["percentiles"]["50"]) == 10
+
+
+# ---------------------------------------------------------------------------
+# Consumers
+# ---------------------------------------------------------------------------
+
+def test_pooled_requires_full_coverage(results):
+    exp = results / "exp"
+    m1 = _write_metric(str(exp / "1.a"), "score", [1, 2, 3])
+    append_run("exp", "1.a", m1)
+    _write_metric(str(exp / "2.a"), "score", [4, 5])
+
+    assert pooled_summaries("exp", {"score": ["1.a", "2.a"]}) == {}
+    pooled = pooled_summaries("exp", {"score": ["1.a"]})
+    assert pooled["score"].n == 3
+    assert pooled["score"].mean == pytest.approx(2.0)
+    assert pooled["score"].p50 == pytest.approx(2.0)
+
+
+def test_get_all_metric_data_mixes_store_and_csv(results):
+    exp = results / "exp"
+    m1 = _write_metric(str(exp / "1.a"), "eng.score", [1, 2.5])
+    append_run("exp", "1.a", m1)
+    _write_metric(str(exp / "2.a"), "eng.score", [3])
+
+    data = get_all_metric_data("exp", "eng", "score")
+    assert data["1.a"] == [1, 2.5]
+    assert isinstance(data["1.a"][0], int)
+    assert data["2.a"] == [3]
+    assert data["common"] == []
@@ -233,4 +233,44 @@ def test_add_entry_registration_with_custom_delimiter(monkeypatch, tmp_path):
     assert "aprefix" in project.get_prefix_list()
     prefix_entry = project._prefix_entries["aprefix"]
     assert prefix_entry.major_counter == 5
-    assert prefix_entry.minor_counter == 4
\ No newline at end of file
+    assert prefix_entry.minor_counter == 4
+
+# ----------------------------------------------------------------------
+# Run ID allocation
+# ----------------------------------------------------------------------
+
+@pytest.fixture
+def results_folder(tmp_path, monkeypatch):
+    results = tmp_path / "results"
+    monkeypatch.setattr(project, "EXP_RESULTS_FOLDER", str(results))
+    return results
+
+def _allocate(folders):
+    # runs in a spawned worker, so the test's monkeypatching is redone
+    project.EXP_RESULTS_FOLDER, project.TRACKING_FOLDER = folders
+    return project.get_next_experiment_run_id("exp")
+
+def test_run_ids_sequential_and_reserved(results_folder):
+    assert project.get_next_experiment_run_id("exp") == "0"
+    assert project.get_next_experiment_run_id("exp") == "1"
+    assert (results_folder / "exp" / "1").is_dir()
+
+def test_run_id_counter_seeded_from_folders(results_folder):
+    for d in ("3", "7", "common"):
+        os.makedirs(results_folder / "exp" / d)
+    assert project.get_next_experiment_run_id("exp") == "8"
+    # the counter is used from now on, no listing needed
+    os.makedirs(results_folder / "exp" / "9")
+    assert project.get_next_experiment_run_id("exp") == "10"
+
+def test_run_id_prefix_and_random(results_folder):
+    assert project.get_next_experiment_run_id("exp", prefix="p.") == "p.0"
+    rid = project.get_next_experiment_run_id("exp", use_count=False)
+    assert rid.endswith("exp") and (results_folder / "exp" / rid).is_dir()
+
+def test_run_ids_unique_across_processes(results_folder):
+    import multiprocessing
+    folders = (str(results_folder), project.TRACKING_FOLDER)
+    with multiprocessing.get_context("spawn").Pool(4) as pool:
+        ids = pool.map(_allocate, [folders] * 40)
+    assert sorted(ids, key=int) == [str(i) for i in range(40)]
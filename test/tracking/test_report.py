@@ -13,13 +13,18 @@ from adgtk.tracking.report import (
     _run_sort_key,
     _configs_equal,
     _fmt_duration,
+    build_config_tree,
     check_config_consistency,
+    config_hash,
+    diff_config_trees,
+    group_configs,
     collect_experiment_data,
     generate_markdown_report,
     save_results_csv,
     generate_experiment_report,
     CONCLUSIONS_DIR,
     MANIFEST_FILE,
+    ROLLUP_CACHE_FILE,
     RUN_CONFIG_FILE,
 )
 from adgtk.tracking.manifest import RunManifest
@@ -208,6 +213,50 @@ def test_check_config_consistency_mixed_none_and_valid():
     assert deviating == []
 
 
+def test_config_hash_ignores_key_order():
+    a = {"a": 1, "b": {"x": [1, 2], "y": "z"}}
+    b = {"b": {"y": "z", "x": [1, 2]}, "a": 1}
+    assert config_hash(a) == config_hash(b)
+    assert config_hash(a) != config_hash({"a": 1, "b": {"x": [2, 1]}})
+
+
+def test_diff_config_trees_lists_nested_keys():
+    a = {"model": "gpt-4", "agent": {"temp": 0.7, "tools": ["a", "b"]}}
+    b = {"model": "gpt-4", "agent": {"temp": 0.9, "tools": ["a", "c"]},
+         "seed": 1}
+    diffs = diff_config_trees(build_config_tree(a), build_config_tree(b))
+    assert diffs == ["agent.temp", "agent.tools[1]", "seed"]
+
+
+def test_diff_config_trees_equal():
+    tree = build_config_tree({"a": 1})
+    assert diff_config_trees(tree, build_config_tree({"a": 1})) == []
+
+
+def test_group_configs_reports_differing_keys():
+    base = {"model": "gpt-4", "lr": 0.01}
+    run_configs = {
+        "1": base,
+        "2": dict(base),
+        "3": {"model": "gpt-4", "lr": 0.1},
+        "4": {"model": "gpt-3.5", "lr": 0.01},
+        "5": {"model": "gpt-3.5", "lr": 0.01},
+        "6": None,
+    }
+    baseline, deviations = group_configs(run_configs)
+    assert baseline == base
+    assert [d.run_ids for d in deviations] == [["4", "5"], ["3"]]
+    assert deviations[0].differing_keys == ["model"]
+    assert deviations[1].differing_keys == ["lr"]
+
+
+def test_group_configs_uses_supplied_hashes():
+    run_configs = {"1": {"a": 1}, "2": {"a": 1}}
+    with patch("adgtk.tracking.report.config_hash") as hasher:
+        group_configs(run_configs, {"1": "h", "2": "h"})
+    hasher.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # collect_experiment_data
 # ---------------------------------------------------------------------------
@@ -266,6 +315,58 @@ def test_collect_experiment_data_skips_common_folder(tmp_path):
     assert skipped == []
 
 
+def test_collect_experiment_data_writes_rollup_cache(tmp_path):
+    exp_path = tmp_path / "myexp"
+    run_path = exp_path / "001"
+    run_path.mkdir(parents=True)
+    _write_manifest(str(run_path), _make_manifest(run_id="001"))
+
+    with patch("adgtk.tracking.report.EXP_RESULTS_FOLDER", str(tmp_path)):
+        collect_experiment_data("myexp")
+
+    assert (exp_path / "common" / ROLLUP_CACHE_FILE).exists()
+
+
+def test_collect_experiment_data_only_loads_changed_runs(tmp_path):
+    exp_path = tmp_path / "myexp"
+    for rid in ("001", "002"):
+        (exp_path / rid).mkdir(parents=True)
+        _write_manifest(str(exp_path / rid), _make_manifest(run_id=rid))
+        _write_config(str(exp_path / rid), {"lr": 0.01})
+
+    with patch("adgtk.tracking.report.EXP_RESULTS_FOLDER", str(tmp_path)):
+        collect_experiment_data("myexp")
+
+        with patch("adgtk.tracking.report._load_manifest") as load:
+            manifests, _, configs, _ = collect_experiment_data("myexp")
+        load.assert_not_called()
+        assert [m.run_id for m in manifests] == ["001", "002"]
+        assert configs["002"] == {"lr": 0.01}
+
+        _write_manifest(
+            str(exp_path / "002"),
+            _make_manifest(run_id="002", verdict="fail", summary="rerun"),
+        )
+        (exp_path / "003").mkdir()
+        manifests, skipped, _, _ = collect_experiment_data("myexp")
+
+    assert manifests[1].verdict == "fail"
+    assert skipped == ["003"]
+
+
+def test_collect_experiment_data_ignores_corrupt_cache(tmp_path):
+    exp_path = tmp_path / "myexp"
+    (exp_path / "001").mkdir(parents=True)
+    _write_manifest(str(exp_path / "001"), _make_manifest(run_id="001"))
+    (exp_path / "common").mkdir()
+    (exp_path / "common" / ROLLUP_CACHE_FILE).write_text("{not json")
+
+    with patch("adgtk.tracking.report.EXP_RESULTS_FOLDER", str(tmp_path)):
+        manifests, _, _, _ = collect_experiment_data("myexp")
+
+    assert len(manifests) == 1
+
+
 # ---------------------------------------------------------------------------
 # generate_markdown_report
 # ---------------------------------------------------------------------------
@@ -321,6 +422,23 @@ def test_generate_markdown_report_with_deviation_warning():
     assert "WARNING: Configuration Inconsistency" in md
 
 
+def test_generate_markdown_report_lists_differing_keys():
+    from adgtk.tracking.report import ConfigDeviation
+    m = _make_manifest(run_id="001")
+    md = generate_markdown_report(
+        experiment_name="exp",
+        manifests=[m],
+        skipped_runs=[],
+        deviating_run_ids=["001"],
+        generated_at="2026-01-01",
+        config_deviations=[
+            ConfigDeviation(run_ids=["001"], config_hash="h",
+                            differing_keys=["agent.temp"]),
+        ],
+    )
+    assert "`001` — differs at: `agent.temp`" in md
+
+
 def test_generate_markdown_report_with_result_metrics():
     m = _make_manifest(result_metrics={"accuracy": 0.9, "f1": 0.85})
     md = generate_markdown_report(
@@ -384,6 +502,50 @@ def test_generate_markdown_report_with_measurement_summaries():
     assert "## Measurement Summaries" in md
 
 
+def test_generate_markdown_report_with_pooled_stats():
+    summary = MetricSummary(
+        label="score", n=5, mean=0.7, std=0.05, min=0.6, max=0.8)
+    pooled = MetricSummary(
+        label="score", n=50, mean=0.7, std=0.1, min=0.1, max=0.9,
+        p50=0.71, p95=0.88)
+    md = generate_markdown_report(
+        experiment_name="exp",
+        manifests=[_make_manifest(metric_summaries={"score": summary})],
+        skipped_runs=[],
+        deviating_run_ids=[],
+        generated_at="2026-01-01",
+        pooled_stats={"score": pooled},
+    )
+    assert "### Pooled Sample Statistics" in md
+    assert "| score | 50 | 0.7000 | 0.1000 | 0.7100 | 0.8800 |" in md
+
+
+def test_generate_markdown_report_with_step_bands():
+    import numpy as np
+    from adgtk.tracking.metric_store import StepBands
+    bands = StepBands(
+        label="agent.latency",
+        run_count=2,
+        steps=np.arange(3),
+        count=np.array([2, 2, 1]),
+        mean=np.array([1.0, 2.0, 3.0]),
+        ci_low=np.array([0.5, 1.5, 3.0]),
+        ci_high=np.array([1.5, 2.5, 3.0]),
+        percentiles={5: np.zeros(3), 95: np.ones(3)},
+    )
+    md = generate_markdown_report(
+        experiment_name="exp",
+        manifests=[_make_manifest()],
+        skipped_runs=[],
+        deviating_run_ids=[],
+        generated_at="2026-01-01",
+        step_bands={"agent.latency": bands},
+    )
+    assert "## Step-Aligned Series" in md
+    assert "### agent.latency (2 runs)" in md
+    assert "| 3 | 1 | 3.0000 | 3.0000 | 3.0000 | 0.0000 | 1.0000 |" in md
+
+
 def test_generate_markdown_report_with_journal_entries():
     entry = type("E", (), {
         "entry_type": "finding",
@@ -0,0 +1,138 @@
+"""Tests for adgtk.tracking.store and the registries built on it.
+
+pytest test/tracking/test_store.py
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from adgtk.tracking import project
+from adgtk.tracking import runs as run_registry
+from adgtk.tracking.dataset import JsonFileTracker
+from adgtk.tracking.experiment_journal import (
+    add_entry as add_journal_entry,
+    load_journal,
+)
+from adgtk.tracking.store import atomic_write, file_stamp, locked_json
+from adgtk.tracking.structure import RunEntryModel
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(autouse=True)
+def tracking_folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(run_registry, "TRACKING_FOLDER", str(tmp_path))
+    monkeypatch.setattr(project, "TRACKING_FOLDER", str(tmp_path))
+    run_registry._runs.clear()
+    run_registry._loaded = False
+    project._prefix_entries.clear()
+    yield tmp_path
+    run_registry._runs.clear()
+    run_registry._loaded = False
+
+
+def _entry(run_id: str) -> RunEntryModel:
+    return RunEntryModel(
+        run_id=run_id,
+        experiment_name="exp",
+        timestamp_start="2026-01-01 00:00:00",
+        timestamp_end="2026-01-01 00:01:00",
+        duration_seconds=60.0,
+        status="complete",
+        verdict="pass",
+        results_path=f"results/exp/{run_id}",
+    )
+
+
+def _register_runs(worker):
+    for i in range(5):
+        run_registry.add_run(_entry(f"{worker}.{i}"))
+
+
+def _next_names(_):
+    return [project.generate_experiment_name("exp") for _ in range(5)]
+
+
+# ---------------------------------------------------------------------------
+# Primitives
+# ---------------------------------------------------------------------------
+
+def test_locked_json_writes_only_when_replaced(tmp_path):
+    path = str(tmp_path / "doc.json")
+    with locked_json(path, default=[]) as doc:
+        assert doc.data == []
+    assert not os.path.exists(path)
+    with locked_json(path, default=[]) as doc:
+        doc.replace(doc.data + [1])
+    with locked_json(path, default=[]) as doc:
+        doc.replace(doc.data + [2])
+    assert json.loads(open(path).read()) == [1, 2]
+
+
+def test_locked_json_aborts_on_error(tmp_path):
+    path = str(tmp_path / "doc.json")
+    atomic_write(path, "[1]")
+    with pytest.raises(KeyError):
+        with locked_json(path, default=[]) as doc:
+            doc.replace([])
+            raise KeyError("abort")
+    assert json.loads(open(path).read()) == [1]
+
+
+# ---------------------------------------------------------------------------
+# Registries
+# ---------------------------------------------------------------------------
+
+def test_runs_merge_with_other_writers(tracking_folder):
+    run_registry.add_run(_entry("1"))
+    # another process appends behind this module's back
+    path = tracking_folder / run_registry.RUNS_FILE
+    data = json.loads(path.read_text())
+    data.append(_entry("2").model_dump())
+    atomic_write(str(path), json.dumps(data))
+
+    assert [r.run_id for r in run_registry.get_runs()] == ["1", "2"]
+    run_registry.add_run(_entry("3"))
+    on_disk = [r["run_id"] for r in json.loads(path.read_text())]
+    assert on_disk == ["1", "2", "3"]
+
+
+# Each worker opens its own lock file descriptor, so flock serialises
+# threads exactly as it does processes (see test_project for processes).
+
+def test_runs_parallel_writers_keep_every_entry(tracking_folder):
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(_register_runs, range(4)))
+    path = tracking_folder / run_registry.RUNS_FILE
+    assert len(json.loads(path.read_text())) == 20
+
+
+def test_prefix_names_unique_across_writers(tracking_folder):
+    with ThreadPoolExecutor(3) as pool:
+        names = list(pool.map(_next_names, range(3)))
+    flat = [n for batch in names for n in batch]
+    assert len(set(flat)) == 15
+
+
+def test_trackers_sharing_inventory_merge(tmp_path):
+    inventory = str(tmp_path / "datasets.json")
+    data_file = tmp_path / "a.csv"
+    data_file.write_text("x\n1\n")
+    first = JsonFileTracker("first", inventory)
+    second = JsonFileTracker("second", inventory)
+    first.register_file(str(data_file), "csv", file_id="a")
+    second.register_file(str(data_file), "csv", file_id="b")
+    assert sorted(first.get_file_ids_only()) == ["a", "b"]
+    with pytest.raises(IndexError):
+        first.register_file(str(data_file), "csv", file_id="b")
+    assert file_stamp(inventory) is not None
+
+
+def test_journal_appends_are_merged(tmp_path):
+    common = str(tmp_path / "common")
+    add_journal_entry("one", common)
+    add_journal_entry("two", common)
+    assert [e.text for e in load_journal(common)] == ["one", "two"]
@@ -0,0 +1,126 @@
+"""Tests for adgtk.tracking.usage — datasets → blueprints and runs.
+
+pytest test/tracking/test_usage.py
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+from adgtk.tracking import blueprints, usage
+from adgtk.tracking import runs as run_registry
+from adgtk.tracking.structure import RunEntryModel
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+_BLUEPRINT = """\
+attribute: experiment
+description: desc
+factory_id: scenario
+init_config:
+  dataset: {dataset}
+"""
+
+
+@pytest.fixture(autouse=True)
+def tracking_folder(tmp_path, monkeypatch):
+    folder = str(tmp_path / "t")
+    monkeypatch.setattr(blueprints, "TRACKING_FOLDER", folder)
+    monkeypatch.setattr(usage, "TRACKING_FOLDER", folder)
+    monkeypatch.setattr(run_registry, "TRACKING_FOLDER", folder)
+    run_registry._runs.clear()
+    run_registry._loaded = False
+    usage.clear_loaded_datasets()
+    yield tmp_path
+    run_registry._runs.clear()
+    run_registry._loaded = False
+
+
+@pytest.fixture
+def bp_dir(tmp_path):
+    folder = tmp_path / "blueprints"
+    folder.mkdir()
+    return folder
+
+
+def _entry(run_id: str) -> RunEntryModel:
+    return RunEntryModel(
+        run_id=run_id,
+        experiment_name="exp",
+        status="complete",
+        results_path=f"results/exp/{run_id}",
+    )
+
+
+def _record(experiment: str, run_id: str, *dataset_ids: str) -> None:
+    usage.clear_loaded_datasets()
+    for dataset_id in dataset_ids:
+        usage.note_dataset_loaded(dataset_id)
+    usage.record_run_datasets(experiment, run_id)
+
+
+# ---------------------------------------------------------------------------
+# Blueprints
+# ---------------------------------------------------------------------------
+
+def test_index_blueprint_updates_reverse_map(bp_dir):
+    blueprints.refresh_blueprint_index(str(bp_dir))
+    path = bp_dir / "alpha.yaml"
+    path.write_text(_BLUEPRINT.format(dataset="ds1"))
+    blueprints.index_blueprint(str(path))
+
+    with patch("adgtk.tracking.blueprints._index_file") as parse:
+        found = usage.dataset_usage("ds1", str(bp_dir))
+    parse.assert_not_called()
+    assert found.blueprints == ["alpha"]
+
+    path.write_text(_BLUEPRINT.format(dataset="ds2"))
+    blueprints.index_blueprint(str(path))
+    assert usage.dataset_usage("ds1", str(bp_dir)).blueprints == []
+    path.unlink()
+    blueprints.index_blueprint(str(path))
+    assert blueprints.blueprints_by_reference(str(bp_dir)) == {}
+
+
+# ---------------------------------------------------------------------------
+# Runs
+# ---------------------------------------------------------------------------
+
+def test_record_and_query_runs(bp_dir):
+    _record("exp", "1.a", "ds1", "ds2")
+    _record("exp", "2.a", "ds1")
+    _record("other", "1.b")
+    assert usage.runs_using_dataset("ds1") == ["exp/1.a", "exp/2.a"]
+    assert usage.runs_using_dataset("ds2") == ["exp/1.a"]
+
+    (bp_dir / "alpha.yaml").write_text(_BLUEPRINT.format(dataset="ds2"))
+    everything = usage.all_dataset_usage(str(bp_dir))
+    assert everything["ds2"].blueprints == ["alpha"]
+    assert everything["ds2"].runs == ["exp/1.a"]
+    assert everything["ds1"].blueprints == []
+
+
+def test_removing_runs_forgets_usage(tracking_folder):
+    run_registry.add_run(_entry("1.a"))
+    run_registry.add_run(_entry("2.a"))
+    _record("exp", "1.a", "ds1")
+    _record("exp", "2.a", "ds1")
+
+    run_registry.remove_run("1.a", "exp")
+    assert usage.runs_using_dataset("ds1") == ["exp/2.a"]
+    run_registry.remove_experiment("exp")
+    assert usage.runs_using_dataset("ds1") == []
+    path = tracking_folder / "t" / usage.USAGE_FILE
+    assert json.loads(path.read_text()) == {}
+
+
+def test_dataset_manager_notes_loads(tracking_folder):
+    from adgtk.data.dataset import DatasetManager
+    data_file = tracking_folder / "a.csv"
+    data_file.write_text("x\n1\n")
+    mgr = DatasetManager(folder=str(tracking_folder / "t"))
+    mgr.register(str(data_file), "csv", file_id="a")
+    mgr.load_file("a")
+    assert usage.get_loaded_datasets() == ["a"]